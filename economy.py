@@ -1,2487 +1,4065 @@
-import discord
-from discord.ext import commands, tasks
-import aiosqlite
-import asyncio
-import random
-import time
-from utils.db import Database  # Import the Database class from utils.db
-from discord.ui import View, Button, Modal, TextInput
-
-class BotSelectionModal(discord.ui.Modal):
-    def __init__(self):
-        super().__init__(title="Select Bot Battle Mode")
-        self.bot_mode = None
-        self.add_item(discord.ui.TextInput(
-            label="Bot Battle Mode",
-            placeholder="Enter 1v1, 2v2, 3v3, or 4v4",
-            required=True,
-            max_length=3
-        ))
-
-    async def on_submit(self, interaction: discord.Interaction):
-        self.bot_mode = self.children[0].value
-        if self.bot_mode not in ['1v1', '2v2', '3v3', '4v4']:
-            await interaction.response.send_message("Invalid mode. Please choose 1v1, 2v2, 3v3, or 4v4.", ephemeral=True)
-        else:
-            await interaction.response.defer()
-
-class CaseBattleView(discord.ui.View):
-    def __init__(self, ctx, host, cog, case_data):  
-        super().__init__(timeout=300) 
-        self.ctx = ctx  # Store the context
-        self.host = host
-        self.cog = cog
-        self.players = [host]
-        self.case_data = case_data
-
-    @discord.ui.button(label="Select Cases", style=discord.ButtonStyle.primary)
-    async def select_cases(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != self.host:
-            await interaction.response.send_message("Only the host can select cases!", ephemeral=True)
-            return
-
-        modal = CaseSelectionModal(self.case_data)
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        
-        if modal.selected_cases:
-            potential_total_bet = sum(
-                self.case_data[case]['price'] * amount 
-                for case, amount in modal.selected_cases.items()
-            )
-            
-            # Check if host has enough balance before updating selected cases
-            if not await self.cog.check_balance(self.host, potential_total_bet):
-                await interaction.followup.send("You don't have enough balance to select these cases!", ephemeral=True)
-            else:
-                self.selected_cases.update(modal.selected_cases)
-                self.total_bet = potential_total_bet
-                await interaction.followup.send(f"Added cases to your selection. Total bet: ${self.total_bet:,}", ephemeral=True)
-                await self.update_message(interaction)
-
-
-
-        
-        if modal.selected_cases:
-            self.selected_cases.update(modal.selected_cases)
-            self.total_bet = self.calculate_total_bet()
-            
-            # Check if host has enough balance
-            if not await self.economy_cog.check_balance(self.host, self.total_bet):
-                await interaction.followup.send("You don't have enough balance to start this battle!", ephemeral=True)
-                self.selected_cases = {}
-                self.total_bet = 0
-            else:
-                await self.update_message(interaction)
-
-    @discord.ui.button(label="Bot Battle", style=discord.ButtonStyle.blurple)
-    async def bot_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != self.host:
-            await interaction.response.send_message("Only the host can start a bot battle!", ephemeral=True)
-        elif len(self.players) > 1:
-            await interaction.response.send_message("Can't switch to bot battle after players have joined!", ephemeral=True)
-        else:
-            modal = BotSelectionModal()
-            await interaction.response.send_modal(modal)
-            await modal.wait()
-            
-            if modal.bot_mode:
-                self.is_bot_battle = True
-                self.bot_mode = modal.bot_mode
-                num_bots = int(self.bot_mode[0]) - 1  # Number of bots on the host's team
-                self.teams = {
-                    1: [self.host] + [self.economy_cog.generate_bot_name() for _ in range(num_bots)],
-                    2: [self.economy_cog.generate_bot_name() for _ in range(int(self.bot_mode[0]))]
-                }
-                await self.update_message(interaction)
-
-    @discord.ui.button(label="Join Battle", style=discord.ButtonStyle.green)
-    async def join_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.is_bot_battle:
-            await interaction.response.send_message("This is a bot battle. Players can't join.", ephemeral=True)
-        elif not self.selected_cases:
-            await interaction.response.send_message("The host hasn't selected cases yet!", ephemeral=True)
-        elif interaction.user in self.players:
-            await interaction.response.send_message("You've already joined this battle!", ephemeral=True)
-        elif len(self.players) >= 8:
-            await interaction.response.send_message("This battle is already full!", ephemeral=True)
-        else:
-            # Check if joining player has enough balance
-            if not await self.economy_cog.check_balance(interaction.user, self.total_bet):
-                await interaction.response.send_message("You don't have enough balance to join this battle!", ephemeral=True)
-                return
-
-            self.players.append(interaction.user)
-            if len(self.teams[1]) <= len(self.teams[2]):
-                self.teams[1].append(interaction.user)
-            else:
-                self.teams[2].append(interaction.user)
-            await interaction.response.send_message(f"You've joined the battle on Team {1 if interaction.user in self.teams[1] else 2}!", ephemeral=True)
-            await self.update_message(interaction)
-
-    @discord.ui.button(label="Start Battle", style=discord.ButtonStyle.danger)
-    async def start_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != self.host:
-            await interaction.response.send_message("Only the host can start the battle!", ephemeral=True)
-        elif not self.selected_cases:
-            await interaction.response.send_message("You need to select cases first!", ephemeral=True)
-        elif not self.is_bot_battle and len(self.players) < 2:
-            await interaction.response.send_message("You need at least 2 players to start the battle!", ephemeral=True)
-        else:
-            await interaction.response.send_message("Starting the battle!", ephemeral=True)
-            self.stop()
-
-    def calculate_total_bet(self):
-        return sum(self.case_data[case]['price'] * amount 
-                   for case, amount in self.selected_cases.items())
-
-    async def update_message(self, interaction):
-        embed = discord.Embed(title="Case Battle", color=discord.Color.gold())
-        embed.add_field(name="Host", value=self.host.mention, inline=False)
-        
-        cases_field = "Selected Cases:\n" + "\n".join(f"{self.case_data[case]['name']}: {amount}" 
-                                                      for case, amount in self.selected_cases.items())
-        embed.add_field(name="Cases", value=cases_field, inline=False)
-        
-        embed.add_field(name="Total Bet", value=f"${self.total_bet:,}", inline=False)
-        
-        players_field = "Players:\n"
-        for team_num, team in self.teams.items():
-            players_field += f"Team {team_num}: {', '.join(str(player) for player in team)}\n"
-        embed.add_field(name="Players", value=players_field, inline=False)
-        
-        if self.is_bot_battle:
-            embed.add_field(name="Mode", value=f"Bot Battle ({self.bot_mode})", inline=False)
-        else:
-            embed.add_field(name="Mode", value="Player Battle", inline=False)
-        
-        embed.add_field(name="Status", value="Waiting for case selection and players...", inline=False)
-        
-        await interaction.message.edit(embed=embed)
-
-class CaseSelectionModal(discord.ui.Modal, title="Select Cases"):
-    def __init__(self, case_data):
-        super().__init__()
-        self.case_data = case_data
-        self.selected_cases = {}
-
-        self.case_select = discord.ui.TextInput(
-            label="Case Name",
-            placeholder="Enter the name of the case",
-            required=True
-        )
-        self.add_item(self.case_select)
-
-        self.quantity_input = discord.ui.TextInput(
-            label="Quantity",
-            placeholder="Enter a number between 1 and 5",
-            min_length=1,
-            max_length=1,
-            required=True
-        )
-        self.add_item(self.quantity_input)
-
-    async def on_submit(self, interaction: discord.Interaction):
-        selected_case = self.case_select.value.lower()
-        try:
-            quantity = int(self.quantity_input.value)
-            if selected_case not in self.case_data:
-                await interaction.response.send_message("Invalid case name. Please try again.", ephemeral=True)
-                return
-
-            if 1 <= quantity <= 5:
-                if selected_case in self.selected_cases:
-                    self.selected_cases[selected_case] += quantity
-                else:
-                    self.selected_cases[selected_case] = quantity
-                
-                total_cases = sum(self.selected_cases.values())
-                if total_cases > 10:
-                    self.selected_cases[selected_case] -= quantity
-                    await interaction.response.send_message("You can't select more than 10 cases in total.", ephemeral=True)
-                else:
-                    await interaction.response.defer()
-            else:
-                await interaction.response.send_message("Please enter a quantity between 1 and 5.", ephemeral=True)
-        except ValueError:
-            await interaction.response.send_message("Please enter a valid number for the quantity.", ephemeral=True)
-
-
-
-class CaseBattle(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-        self.case_data = self.load_case_data()
-
-    def load_case_data(self):
-        return {
-            "starter_spark": {
-                "name": "Starter Spark",
-                "price": 500,
-                "color": 0x1abc9c,
-                "items": {
-                    "common": [("Rusty Combat Knife", 75), ("Worn Tactical Vest", 75)],
-                    "rare": [("Custom Engraved Pistol", 200), ("Enhanced Night Vision Goggles", 200)],
-                    "epic": [("Stealth Recon Outfit", 500), ("Dragonfire Grenade", 500)],
-                    "legendary": [("Phoenix Revolver", 1200), ("Spectral Cloak", 1200)]
-                }
-            },
-            "novice_nest": {
-                "name": "Novice Nest",
-                "price": 1000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Basic Survival Gear", 100), ("Entry-Level Drone", 100)],
-                    "rare": [("Advanced Sniper Rifle", 300), ("Deployable Shield", 300)],
-                    "epic": [("Titanium Combat Armor", 750), ("Quantum Stealth Module", 750)],
-                    "legendary": [("Nebula Assault Rifle", 1800), ("Hyperion Battle Suit", 1800)]
-                }
-            },
-            "wanderers_way": {
-                "name": "Wanderer's Way",
-                "price": 1500,
-                "color": 0x9b59b6,
-                "items": {
-                    "common": [("Standard Issue Handgun", 150), ("Utility Belt", 150)],
-                    "rare": [("Exotic Survival Knife", 400), ("Adaptive Camouflage", 400)],
-                    "epic": [("Mark II Combat Drone", 900), ("Phantom Suppressor", 900)],
-                    "legendary": [("Aurora Energy Blaster", 2200), ("Eclipse Power Armor", 2200)]
-                }
-            },
-            "common_cache": {
-                "name": "Common Cache",
-                "price": 2000,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Basic Survival Kit", 200), ("Entry-Level Gadget", 200)],
-                    "rare": [("Advanced Utility Belt", 500), ("Compact Drone", 500)],
-                    "epic": [("Nano-Tech Armor", 1200), ("High-Performance Backpack", 1200)],
-                    "legendary": [("Omni-Tool Kit", 3000), ("Elite Tactical Gear", 3000)]
-                }
-            },
-            "cosmic_chest": {
-                "name": "Cosmic Chest",
-                "price": 3000,
-                "color": 0xf39c12,
-                "items": {
-                    "common": [("Starlight Pendant", 100), ("Galactic Bookmark", 100)],
-                    "rare": [("Celestial Map", 300), ("Lunar Lantern", 300)],
-                    "epic": [("Nebula Crystal", 700), ("Astral Telescope", 700)],
-                    "legendary": [("Quantum Starship Model", 1600), ("Galactic Voyage Diary", 1600)]
-                }
-            },
-            "mystic_box": {
-                "name": "Mystic Box",
-                "price": 3500,
-                "color": 0x8e44ad,
-                "items": {
-                    "common": [("Enchanted Journal", 150), ("Runic Keychain", 150)],
-                    "rare": [("Ancient Rune Stones", 400), ("Mystic Potion Set", 400)],
-                    "epic": [("Wizards' Staff Replica", 900), ("Sorcerer's Amulet", 900)],
-                    "legendary": [("Arcane Grimoire", 2100), ("Dragon's Heart Crystal", 2100)]
-                }
-            },
-            "futuristic_fortune": {
-                "name": "Futuristic Fortune",
-                "price": 4000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Holo-Glasses", 200), ("Neon Keycard", 200)],
-                    "rare": [("Techno Wristband", 500), ("Digital Pet", 500)],
-                    "epic": [("Virtual Reality Headset", 1100), ("Holographic Projector", 1100)],
-                    "legendary": [("Anti-Gravity Boots", 2500), ("Cybernetic Companion Drone", 2500)]
-                }
-            },
-            "fantasy_bundle": {
-                "name": "Fantasy Bundle",
-                "price": 4500,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Magic Wand Trinket", 125), ("Fairy Dust Pouch", 125)],
-                    "rare": [("Enchanted Necklace", 350), ("Dragon Scale Brooch", 350)],
-                    "epic": [("Unicorn Figurine", 800), ("Phoenix Feather Quill", 800)],
-                    "legendary": [("Wizard's Cloak", 1900), ("Griffin's Talon", 1900)]
-                }
-            },
-            "retro_vault": {
-                "name": "Retro Vault",
-                "price": 5000,
-                "color": 0xf1c40f,
-                "items": {
-                    "common": [("Vintage Cassette Tape", 180), ("Retro Game Console Keychain", 180)],
-                    "rare": [("Classic Arcade Token Set", 450), ("Old School Action Figure", 450)],
-                    "epic": [("Retro Game Cartridge Collection", 1000), ("Vintage Comic Book Collection", 1000)],
-                    "legendary": [("Limited Edition Vinyl Record", 2300), ("Retro Gaming Cabinet Model", 2300)]
-                }
-            },
-            "mythic_cache": {
-                "name": "Mythic Cache",
-                "price": 6000,
-                "color": 0x2ecc71,
-                "items": {
-                    "common": [("Legendary Coin", 200), ("Mystic Amulet", 200)],
-                    "rare": [("Ancient Artifact", 500), ("Celestial Pendant", 500)],
-                    "epic": [("Elder Relic", 1100), ("Mythic Tome", 1100)],
-                    "legendary": [("Godly Crown", 2500), ("Epic Orb of Power", 2500)]
-                }
-            },
-            "celestial_cache": {
-                "name": "Celestial Cache",
-                "price": 7000,
-                "color": 0x34495e,
-                "items": {
-                    "common": [("Nebula Gem", 250), ("Galactic Scroll", 250)],
-                    "rare": [("Solar Flare Pendant", 600), ("Cosmic Ring", 600)],
-                    "epic": [("Stellar Map", 1400), ("Astral Compass", 1400)],
-                    "legendary": [("Interstellar Telescope", 3200), ("Celestial Artifact", 3200)]
-                }
-            },
-            "arcane_arsenal": {
-                "name": "Arcane Arsenal",
-                "price": 8000,
-                "color": 0x9b59b6,
-                "items": {
-                    "common": [("Enchanted Mirror", 300), ("Mystic Bracelet", 300)],
-                    "rare": [("Arcane Scroll", 750), ("Wizard's Wand", 750)],
-                    "epic": [("Sorcerer's Tome", 1700), ("Magical Crystal Ball", 1700)],
-                    "legendary": [("Ancient Grimoire", 4000), ("Dragon's Breath Amulet", 4000)]
-                }
-            },
-            "cosmic_conundrum": {
-                "name": "Cosmic Conundrum",
-                "price": 9000,
-                "color": 0x1abc9c,
-                "items": {
-                    "common": [("Stardust Pendant", 350), ("Galactic Charm", 350)],
-                    "rare": [("Lunar Orb", 800), ("Astral Beacon", 800)],
-                    "epic": [("Cosmic Map", 1800), ("Nebula Compass", 1800)],
-                    "legendary": [("Quantum Starship", 4200), ("Galactic Relic", 4200)]
-                }
-            },
-            "astral_attic": {
-                "name": "Astral Attic",
-                "price": 10000,
-                "color": 0xe67e22,
-                "items": {
-                    "common": [("Meteorite Fragment", 400), ("Stellar Bookmark", 400)],
-                    "rare": [("Solar Prism", 900), ("Lunar Artifact", 900)],
-                    "epic": [("Nebula Sphere", 2000), ("Galactic Navigator", 2000)],
-                    "legendary": [("Interstellar Capsule", 5000), ("Cosmic Archive", 5000)]
-                }
-            },
-            "infinity_insight": {
-                "name": "Infinity Insight",
-                "price": 11000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Holo-Projector", 450), ("Galactic Token", 450)],
-                    "rare": [("Quantum Shard", 1000), ("Celestial Compass", 1000)],
-                    "epic": [("Stellar Map", 2200), ("Astral Telescope", 2200)],
-                    "legendary": [("Cosmic Relic", 5500), ("Galactic Navigator", 5500)]
-                }
-            },
-            "transcendent_treasure": {
-                "name": "Transcendent Treasure",
-                "price": 12000,
-                "color": 0xf1c40f,
-                "items": {
-                    "common": [("Cosmic Chip", 500), ("Stellar Key", 500)],
-                    "rare": [("Astral Gem", 1100), ("Nebula Pendant", 1100)],
-                    "epic": [("Galactic Atlas", 2500), ("Quantum Cube", 2500)],
-                    "legendary": [("Celestial Sphere", 6000), ("Ethereal Relic", 6000)]
-                }
-            },
-            "quantum_quiver": {
-                "name": "Quantum Quiver",
-                "price": 13000,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Lunar Coin", 550), ("Stellar Badge", 550)],
-                    "rare": [("Cosmic Lantern", 1200), ("Nebula Map", 1200)],
-                    "epic": [("Galactic Telescope", 2800), ("Astral Projector", 2800)],
-                    "legendary": [("Interstellar Engine", 6500), ("Quantum Relic", 6500)]
-                }
-            },
-            "omniversal_orb": {
-                "name": "Omniversal Orb",
-                "price": 14000,
-                "color": 0x2ecc71,
-                "items": {
-                    "common": [("Galactic Fragment", 600), ("Stellar Token", 600)],
-                    "rare": [("Astral Compass", 1300), ("Celestial Beacon", 1300)],
-                    "epic": [("Nebula Telescope", 3000), ("Cosmic Sphere", 3000)],
-                    "legendary": [("Quantum Nexus", 7000), ("Interstellar Artifact", 7000)]
-                }
-            }
-        }
-
-    async def run_battle(self, ctx, battle_message, selected_cases, total_bet, teams, is_bot_battle):
-        team_totals = {1: 0, 2: 0}
-        player_totals = {player: 0 for team in teams.values() for player in team}
-
-        embed = battle_message.embeds[0]
-        embed.set_field_at(-1, name="Battle Progress", value="Opening cases...", inline=False)
-        await battle_message.edit(embed=embed)
-
-        for case_type, amount in selected_cases.items():
-            for _ in range(amount):
-                for team_num, team in teams.items():
-                    for player in team:
-                        rarity = random.choices(["common", "rare", "epic", "legendary"], weights=[60, 30, 9, 1])[0]
-                        item_name, item_value = random.choice(self.case_data[case_type]["items"][rarity])
-                        
-                        player_totals[player] += item_value
-                        team_totals[team_num] += item_value
-
-                        # Update embed
-                        progress = "Battle Progress:\n"
-                        for t_num, t_total in team_totals.items():
-                            progress += f"Team {t_num}: ${t_total:,}\n"
-                        embed.set_field_at(-1, name="Battle Progress", value=progress, inline=False)
-                        
-                        embed.add_field(name=f"{self.case_data[case_type]['name']} Case", 
-                                        value=f"{player}: {item_name} (${item_value:,})", 
-                                        inline=False)
-                        await battle_message.edit(embed=embed)
-                        await asyncio.sleep(1)  # Add some delay for suspense
-
-        # Determine winner
-        if team_totals[1] > team_totals[2]:
-            result = f"Team 1 wins ${total_bet:,}!"
-        elif team_totals[1] < team_totals[2]:
-            result = f"Team 2 wins ${total_bet:,}!"
-        else:
-            result = "It's a tie! Bets are returned."
-
-        embed.add_field(name="Result", value=result, inline=False)
-        
-        # Show individual player totals
-        player_results = "Player Totals:\n"
-        for player, total in player_totals.items():
-            player_results += f"{player}: ${total:,}\n"
-        embed.add_field(name="Player Totals", value=player_results, inline=False)
-        
-        await battle_message.edit(embed=embed)
-
-
-class SliderGame(View):
-    def __init__(self, ctx, economy_cog):
-        super().__init__(timeout=None)
-        self.ctx = ctx
-        self.economy_cog = economy_cog
-        self.players = {}
-        self.message = None
-        self.countdown = 30
-        self.max_players = 10
-        self.game_ended = False
-        self.game_started = False
-        self.check_message_task = None
-        self.result = None
-        self.start_time = None
-        self.result_dict = {'🥉': 'Bronze', '🥈': 'Silver', '🥇': 'Gold'}
-        self.result_animation = ''
-
-        # Setup buttons
-        self.add_item(Button(label="Join Game", style=discord.ButtonStyle.blurple, custom_id="join"))
-
-    async def run_game(self):
-        self.message = await self.ctx.send(embed=self.create_embed())
-        self.check_message_task = self.check_message_exists.start()
-        for i in range(self.countdown, 0, -1):
-            self.countdown = i
-            await asyncio.sleep(1)
-            await self.update_message()
-        
-        self.game_started = True
-        self.start_time = discord.utils.utcnow()
-        self.result = await self.generate_result_with_animation()
-        await self.process_bets()
-        await self.update_message()
-        await self.end_game()
-
-    async def generate_result_with_animation(self):
-        symbols = ['🥉', '🥈', '🥇']
-        weights = [0.45, 0.45, 0.10]  # Probabilities for Bronze, Silver, Gold
-        result = random.choices(symbols, weights=weights)[0]
-        
-        # Create sliding animation
-        for _ in range(20):  # Number of animation frames
-            animation = [random.choices(symbols, weights)[0] for _ in range(9)]
-            self.result_animation = f"{''.join(animation)}\n"
-            self.result_animation += "🟦🟦🟦🟦⬆️🟦🟦🟦🟦"
-            await self.update_message()
-            await asyncio.sleep(0.5)  # Adjust speed of animation
-        
-        # Final result
-        final_animation = [random.choices(symbols, weights)[0] for _ in range(9)]
-        final_animation[4] = result  # Put the winning symbol in the middle only for the final result
-        self.result_animation = f"{''.join(final_animation)}\n"
-        self.result_animation += "🟦🟦🟦🟦⬆️🟦🟦🟦🟦"
-        self.result = self.result_dict[result]
-        await self.update_message()
-        
-        return self.result
-
-
-
-
-    async def update_message(self):
-        if self.message:
-            await self.message.edit(embed=self.create_embed(), view=self)
-
-    async def process_bets(self):
-        for player_id, data in self.players.items():
-            winnings = 0
-            if data['bet_bronze'] > 0 and self.result == "Bronze":
-                winnings += data['bet_bronze'] * 2
-            if data['bet_silver'] > 0 and self.result == "Silver":
-                winnings += data['bet_silver'] * 2
-            if data['bet_gold'] > 0 and self.result == "Gold":
-                winnings += data['bet_gold'] * 14
-
-            total_bet = data['bet_bronze'] + data['bet_silver'] + data['bet_gold']
-            profit = winnings - total_bet
-            data['winnings'] = winnings
-            data['profit'] = profit
-
-            user_data = await self.economy_cog.get_user_data(player_id)
-            user_data['balance'] += winnings  # Add winnings, not profit
-            await self.economy_cog.update_user_data(player_id, user_data['balance'], user_data['bank'])
-
-    def create_embed(self):
-        if not self.game_started:
-            title = "🎰 Slider Game Starting Soon"
-            color = discord.Color.blue()
-            description = f"```\nGame starts in {self.countdown} seconds\nPlayers: {len(self.players)}/{self.max_players}\n```"
-        elif self.result is None:
-            title = "🎰 Slider Game in Progress"
-            color = discord.Color.gold()
-            description = f"```\n{self.result_animation}\n```"
-        else:
-            title = f"🎰 Slider Game Result: {self.result}"
-            color = discord.Color.green()
-            description = f"```\n{self.result_animation}\n```"
-
-        embed = discord.Embed(title=title, description=description, color=color)
-
-
-        for player_id, data in self.players.items():
-            player = self.ctx.guild.get_member(player_id)
-            total_bet = data['bet_bronze'] + data['bet_silver'] + data['bet_gold']
-            bet_colors = []
-            if data['bet_bronze'] > 0: bet_colors.append(f"Bronze **({data['bet_bronze']:.2f})**")
-            if data['bet_silver'] > 0: bet_colors.append(f"Silver **({data['bet_silver']:.2f})**")
-            if data['bet_gold'] > 0: bet_colors.append(f"Gold **({data['bet_gold']:.2f})**")
-            
-            bet_str = f"**Bet:** ${total_bet:.2f}"
-            colors_str = f"**Colors:** {', '.join(bet_colors)}"
-            
-            if self.result is None:
-                status_str = "**Status:** In game"
-                profit_str = ""
-            else:
-                won_colors = [color.split()[0] for color in bet_colors if color.split()[0] == self.result]
-                lost_colors = [color.split()[0] for color in bet_colors if color.split()[0] != self.result]
-                status_parts = []
-                if won_colors:
-                    status_parts.append(f"Won: {', '.join(won_colors)}")
-                if lost_colors:
-                    status_parts.append(f"Lost: {', '.join(lost_colors)}")
-                status_str = f"**Status:** {', '.join(status_parts)}"
-                profit_str = f"**Profit:** ${data.get('profit', 0):.2f}"
-
-            value = f"{bet_str}\n{colors_str}\n{status_str}\n{profit_str}"
-            embed.add_field(name=player.display_name, value=value, inline=False)
-
-        return embed
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.data["custom_id"] == "join":
-            await self.join_game(interaction)
-        return True
-
-    async def join_game(self, interaction: discord.Interaction):
-        if self.game_started:
-            await interaction.response.send_message("The game has already started!", ephemeral=True)
-            return
-        if self.result is not None:
-            await interaction.response.send_message("The game has already ended!", ephemeral=True)
-            return
-        if len(self.players) >= self.max_players:
-            await interaction.response.send_message("The game is full! Please wait for the next round.", ephemeral=True)
-            return
-        modal = SliderJoinModal(self, interaction.user.id)
-        await interaction.response.send_modal(modal)
-
-    async def end_game(self):
-        self.game_ended = True
-        if self.check_message_task:
-            self.check_message_task.cancel()
-
-    @tasks.loop(seconds=5.0)
-    async def check_message_exists(self):
-        try:
-            await self.ctx.fetch_message(self.message.id)
-        except discord.NotFound:
-            self.game_ended = True
-            self.check_message_task.cancel()
-            return
-
-    @check_message_exists.before_loop
-    async def before_check_message_exists(self):
-        await self.bot.wait_until_ready()
-
-class SliderJoinModal(Modal):
-    def __init__(self, game, player_id):
-        super().__init__(title="Join Slider Game")
-        self.game = game
-        self.player_id = player_id
-
-        self.add_item(TextInput(label="Bet on Bronze (🥉)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
-        self.add_item(TextInput(label="Bet on Silver (🥈)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
-        self.add_item(TextInput(label="Bet on Gold (🥇)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
-
-    async def on_submit(self, interaction: discord.Interaction):
-        user_data = await self.game.economy_cog.get_user_data(self.player_id)
-        current_balance = user_data['balance']
-
-        bets = {}
-        total_bet = 0
-        special_bets = []
-
-        for item in self.children:
-            bet_input = item.value.lower() if item.value else ''
-            color = item.label.split()[2].lower()
-            if bet_input:
-                if bet_input in ['quarter', 'half', 'all']:
-                    special_bets.append((color, bet_input))
-                else:
-                    try:
-                        bet = float(bet_input)
-                        bets[color] = round(bet, 2)
-                        total_bet += bet
-                    except ValueError:
-                        await interaction.response.send_message(f"Invalid bet value for {item.label}.", ephemeral=True)
-                        return
-
-        if len(special_bets) > 2:
-            await interaction.response.send_message("You can only use special bets on up to two colors.", ephemeral=True)
-            return
-
-        if len(special_bets) == 2:
-            colors = [bet[0] for bet in special_bets]
-            if 'bronze' in colors and 'silver' in colors:
-                await interaction.response.send_message("You can't bet on both Bronze and Silver together.", ephemeral=True)
-                return
-
-        total_fraction = 0
-        for color, special_bet in special_bets:
-            if special_bet == 'quarter':
-                fraction = 0.25
-            elif special_bet == 'half':
-                fraction = 0.5
-            else:  # 'all'
-                fraction = 1.0
-            total_fraction += fraction
-            bet_amount = round(current_balance * fraction, 2)
-            bets[color] = bet_amount
-            total_bet += bet_amount
-
-        if total_fraction > 1:
-            await interaction.response.send_message("Your total bet exceeds your balance.", ephemeral=True)
-            return
-
-        if len(bets) > 2:
-            await interaction.response.send_message("You can only bet on up to two colors.", ephemeral=True)
-            return
-
-        if total_bet <= 0:
-            await interaction.response.send_message("You must place at least one bet.", ephemeral=True)
-            return
-
-        if total_bet > current_balance:
-            await interaction.response.send_message("You don't have enough balance for this bet.", ephemeral=True)
-            return
-
-        self.game.players[self.player_id] = {
-            'bet_bronze': bets.get('bronze', 0),
-            'bet_silver': bets.get('silver', 0),
-            'bet_gold': bets.get('gold', 0)
-        }
-
-        user_data['balance'] = round(user_data['balance'] - total_bet, 2)
-        await self.game.economy_cog.update_user_data(self.player_id, user_data['balance'], user_data['bank'])
-
-        await interaction.response.send_message(f"You've joined the game with a total bet of ${total_bet:.2f}", ephemeral=True)
-        await self.game.update_message()
-
-class CrashGame(View):
-    def __init__(self, ctx, economy_cog):
-        super().__init__(timeout=None)
-        self.ctx = ctx
-        self.economy_cog = economy_cog
-        self.multiplier = 1.00
-        self.crashed = False
-        self.players = {}
-        self.crash_point = self.generate_crash_point()
-        self.message = None
-        self.start_time = None
-        self.countdown = 30
-        self.max_players = 10
-        self.animation_frames = 0
-        self.game_ended = False
-        self.check_message_task = None
-
-        # Setup buttons
-        self.add_item(Button(label="Join Game", style=discord.ButtonStyle.blurple, custom_id="join"))
-        self.add_item(Button(label="Cash Out", style=discord.ButtonStyle.green, custom_id="cashout"))
-
-    def generate_crash_point(self):
-        # Use a distribution similar to some popular crash games
-        r = random.random()
-        
-        # House edge (adjustable)
-        house_edge = 0.02  # 2% house edge
-        
-        # Calculate crash point
-        if r == 0:  # Extremely rare case to prevent division by zero
-            return 100.00
-        else:
-            crash_point = 0.99 / (1 - r)  # This creates a distribution favoring lower numbers
-            return max(1.00, round(crash_point, 2))  # Ensure minimum of 1.00
-
-    async def run_game(self):
-        self.message = await self.ctx.send(embed=self.create_embed())
-        self.check_message_task = self.check_message_exists.start()
-
-        for i in range(self.countdown, 0, -1):
-            self.countdown = i
-            await asyncio.sleep(1)
-            await self.update_message()
-
-        self.start_time = discord.utils.utcnow()
-
-        while self.multiplier < self.crash_point and not self.crashed:
-            await asyncio.sleep(0.1)
-            self.multiplier = round(self.multiplier + 0.01, 2)
-            self.animation_frames += 1
-            for player_id, data in self.players.items():
-                if not data['cashed_out'] and data['auto_cashout'] and self.multiplier >= data['auto_cashout']:
-                    await self.cash_out_player(player_id)
-            if self.animation_frames % 5 == 0:  # Update every 0.5 seconds
-                await self.update_message()
-
-        self.crashed = True
-        for player_id, data in self.players.items():
-            if not data['cashed_out']:
-                user_data = await self.economy_cog.get_user_data(player_id)
-                user_data['balance'] = max(0, user_data['balance'] - data['bet'])
-                await self.economy_cog.update_user_data(player_id, user_data['balance'], user_data['bank'])
-
-        await self.update_message()
-        await self.end_game()
-
-    @tasks.loop(seconds=5.0)
-    async def check_message_exists(self):
-        try:
-            await self.ctx.channel.fetch_message(self.message.id)
-        except discord.NotFound:
-            await self.reimburse_players()
-            self.check_message_task.cancel()
-        except discord.HTTPException:
-            pass
-
-    async def reimburse_players(self):
-        if self.game_ended:
-            return
-
-        for player_id, data in self.players.items():
-            if not data['cashed_out']:
-                user_data = await self.economy_cog.get_user_data(player_id)
-                user_data['balance'] += data['bet']
-                await self.economy_cog.update_user_data(player_id, user_data['balance'], user_data['bank'])
-                
-                player = self.ctx.guild.get_member(player_id)
-                if player:
-                    try:
-                        await player.send(f"The Crash game was unexpectedly ended. Your bet of ${data['bet']:.2f} has been reimbursed.")
-                    except discord.HTTPException:
-                        pass
-
-        self.game_ended = True
-
-    async def end_game(self):
-        self.game_ended = True
-        if self.check_message_task:
-            self.check_message_task.cancel()
-
-    async def cash_out_player(self, player_id):
-        if player_id not in self.players or self.players[player_id]['cashed_out']:
-            return
-
-        self.players[player_id]['cashed_out'] = True
-        self.players[player_id]['cashout_multiplier'] = self.multiplier
-        winnings = self.players[player_id]['bet'] * self.multiplier
-        user_data = await self.economy_cog.get_user_data(player_id)
-        user_data['balance'] += winnings
-        await self.economy_cog.update_user_data(player_id, user_data['balance'], user_data['bank'])
-
-    async def update_message(self):
-        await self.message.edit(embed=self.create_embed(), view=self)
-
-    def create_embed(self):
-        if not self.start_time:
-            title = "🚀 Crash Game Starting Soon"
-            color = discord.Color.blue()
-            description = f"Game starts in {self.countdown} seconds\nPlayers: {len(self.players)}/{self.max_players}"
-        elif self.crashed:
-            title = f"💥 Crashed at {self.multiplier}x"
-            color = discord.Color.red()
-            description = self.generate_rocket_ascii(crashed=True)
-        else:
-            title = f"🚀 Current Multiplier: {self.multiplier}x"
-            color = discord.Color.green()
-            description = self.generate_rocket_ascii()
-
-        embed = discord.Embed(title=title, description=f"```\n{description}\n```", color=color)
-        
-        for player_id, data in self.players.items():
-            player = self.ctx.guild.get_member(player_id)
-            
-            bet_str = f"**Bet:** ${data['bet']:.2f}"
-            auto_cashout_str = f"**Auto Cashout:** {data['auto_cashout']}x" if data['auto_cashout'] else "**Auto Cashout:** None"
-            
-            if data['cashed_out']:
-                status = f"Cashed out at {data['cashout_multiplier']}x"
-                profit = data['bet'] * (data['cashout_multiplier'] - 1)
-                status_str = f"**Status:** {status}"
-                profit_str = f"**Profit:** ${profit:.2f}"
-            elif self.crashed:
-                status_str = "**Status:** Crashed"
-                profit_str = f"**Profit:** -${data['bet']:.2f}"
-            else:
-                status_str = "**Status:** In game"
-                if self.start_time:
-                    current_profit = data['bet'] * (self.multiplier - 1)
-                    profit_str = f"**Profit:** ${current_profit:.2f}"
-                else:
-                    profit_str = ""
-
-            value = f"{bet_str}\n{auto_cashout_str}\n{status_str}"
-            if self.start_time or self.crashed:
-                value += f"\n{profit_str}"
-            
-            embed.add_field(name=player.display_name, value=value, inline=False)
-
-        return embed
-
-    def generate_rocket_ascii(self, crashed=False):
-        if crashed:
-            return "💥 CRASHED!"
-        
-        rocket = "🚀"
-        trail = "." * (self.animation_frames % 10)
-        space = " " * (10 - len(trail))
-        return f"{space}{trail}{rocket}"
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.data["custom_id"] == "join":
-            await self.join_game(interaction)
-        elif interaction.data["custom_id"] == "cashout":
-            await self.cash_out(interaction)
-        return True
-
-    async def join_game(self, interaction: discord.Interaction):
-        if self.start_time:
-            await interaction.response.send_message("The game has already started!", ephemeral=True)
-            return
-
-        if len(self.players) >= self.max_players:
-            await interaction.response.send_message("The game is full! Please wait for the next round.", ephemeral=True)
-            return
-
-        modal = CrashJoinModal(self, interaction.user.id)
-        await interaction.response.send_modal(modal)
-
-    async def cash_out(self, interaction: discord.Interaction):
-        player_id = interaction.user.id
-        if player_id not in self.players or self.players[player_id]['cashed_out'] or self.crashed:
-            return
-
-        await self.cash_out_player(player_id)
-        await self.update_message()
-        await interaction.response.defer()
-
-class CrashJoinModal(Modal):
-    def __init__(self, game, player_id):
-        super().__init__(title="Join Crash Game")
-        self.game = game
-        self.player_id = player_id
-
-        self.bet = TextInput(label="Bet Amount", placeholder="Enter amount or 'quarter', 'half', 'all'")
-        self.auto_cashout = TextInput(label="Auto Cashout (optional)", placeholder="Enter multiplier (e.g., 2 for 2x)", required=False)
-        
-        self.add_item(self.bet)
-        self.add_item(self.auto_cashout)
-
-    async def on_submit(self, interaction: discord.Interaction):
-        user_data = await self.game.economy_cog.get_user_data(self.player_id)
-        current_balance = user_data['balance']
-
-        try:
-            bet_input = self.bet.value.lower()
-            if bet_input == 'quarter':
-                bet = current_balance / 4
-            elif bet_input == 'half':
-                bet = current_balance / 2
-            elif bet_input == 'all':
-                bet = current_balance  # Bet the entire balance
-            else:
-                bet = float(bet_input)
-
-            bet = round(bet, 2)  # Round to 2 decimal places
-            auto_cashout = float(self.auto_cashout.value) if self.auto_cashout.value else None
-        except ValueError:
-            await interaction.response.send_message("Invalid bet or auto cashout value.", ephemeral=True)
-            return
-
-        if bet <= 0:
-            await interaction.response.send_message("Bet amount must be positive.", ephemeral=True)
-            return
-
-        if bet > current_balance:
-            bet = current_balance  # Adjust bet to match current balance if it's somehow higher
-
-        self.game.players[self.player_id] = {
-            'bet': bet,
-            'auto_cashout': auto_cashout,
-            'cashed_out': False,
-            'cashout_multiplier': None
-        }
-        user_data['balance'] -= bet
-        await self.game.economy_cog.update_user_data(self.player_id, user_data['balance'], user_data['bank'])
-
-        await interaction.response.send_message(f"You've joined the game with a bet of ${bet:.2f}", ephemeral=True)
-        await self.game.update_message()
-
-
-class TowerGame(View):
-    def __init__(self, ctx, bet, economy_cog):
-        super().__init__(timeout=60)
-        self.ctx = ctx
-        self.bet = bet
-        self.economy_cog = economy_cog
-        self.current_level = 0
-        self.max_levels = 10
-        self.multipliers = [1.2, 1.5, 1.8, 2.1, 2.5, 3, 3.5, 4, 5, 6]
-        self.win_chance = 0.66  # 66% chance to win at each level (2 out of 3 tiles are safe)
-        self.towers = [['⬜'] * 10 for _ in range(3)]
-        self.safe_tiles = self.generate_safe_tiles()
-        self.game_over = False
-        self.stopped_at = None
-        self.last_safe_level = -1
-
-    def generate_safe_tiles(self):
-        return [random.sample(range(3), 2) for _ in range(self.max_levels)]
-
-    @discord.ui.button(label="Left", style=discord.ButtonStyle.blurple)
-    async def left(self, interaction: discord.Interaction, button: Button):
-        await self.make_move(interaction, 0)
-
-    @discord.ui.button(label="Middle", style=discord.ButtonStyle.blurple)
-    async def middle(self, interaction: discord.Interaction, button: Button):
-        await self.make_move(interaction, 1)
-
-    @discord.ui.button(label="Right", style=discord.ButtonStyle.blurple)
-    async def right(self, interaction: discord.Interaction, button: Button):
-        await self.make_move(interaction, 2)
-
-    @discord.ui.button(label="Cash Out", style=discord.ButtonStyle.red)
-    async def cash_out(self, interaction: discord.Interaction, button: Button):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("This is not your game!", ephemeral=True)
-            return
-        self.stopped_at = (self.last_safe_level, None)
-        await self.end_game(interaction, won=True, cash_out=True)
-
-    async def make_move(self, interaction: discord.Interaction, choice: int):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("This is not your game!", ephemeral=True)
-            return
-
-        if choice in self.safe_tiles[self.current_level]:
-            self.towers[choice][self.current_level] = '🟩'
-            self.last_safe_level = self.current_level
-            self.current_level += 1
-            if self.current_level == self.max_levels:
-                await self.end_game(interaction, won=True)
-            else:
-                await self.update_message(interaction)
-        else:
-            self.stopped_at = (self.current_level, choice)
-            await self.end_game(interaction, won=False)
-
-    async def update_message(self, interaction):
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    async def end_game(self, interaction, won, cash_out=False):
-        self.game_over = True
-        user_id = self.ctx.author.id
-        user_data = await self.economy_cog.get_user_data(user_id)
-
-        if won:
-            winnings = self.bet * self.multipliers[self.current_level - 1]
-            user_data['balance'] += winnings - self.bet
-            color = discord.Color.green()
-            if cash_out:
-                title = f"You Cashed Out at Level {self.current_level}!"
-            else:
-                title = f"You Reached the Top! Level {self.current_level}"
-        else:
-            winnings = 0
-            user_data['balance'] -= self.bet
-            color = discord.Color.red()
-            title = f"You Fell at Level {self.current_level + 1}!"
-
-        self.reveal_board()
-
-        await self.economy_cog.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        embed = self.create_embed()
-        embed.title = title
-        embed.color = color
-        embed.add_field(name="Result", value=f"You bet **${self.bet:,.2f}** and {'won' if won else 'lost'} **${winnings:,.2f}**.\n"
-                                             f"Your new balance is **${user_data['balance']:,.2f}**. 💵", inline=False)
-
-        for child in self.children:
-            child.disabled = True
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    def reveal_board(self):
-        for level in range(self.max_levels):
-            for tower in range(3):
-                if self.towers[tower][level] == '⬜':
-                    if tower in self.safe_tiles[level]:
-                        self.towers[tower][level] = '🟩'
-                    else:
-                        self.towers[tower][level] = '🟥'
-        
-        if self.stopped_at:
-            level, choice = self.stopped_at
-            if choice is not None:
-                # Player fell
-                self.towers[choice][level] = '🟨'
-            else:
-                # Player cashed out, mark the last safe level
-                for tower in range(3):
-                    if self.towers[tower][level] == '🟩':
-                        self.towers[tower][level] = '🟨'
-                        break  # Only mark one tile as yellow
-
-    def create_embed(self):
-        tower_display = "".join(f"{''.join(row)}\n" for row in zip(*[tower[::-1] for tower in self.towers]))
-        potential_win = self.bet * self.multipliers[self.current_level] if self.current_level < self.max_levels else self.bet * self.multipliers[-1]
-        current_win = self.bet * self.multipliers[self.current_level - 1] if self.current_level > 0 else 0
-        
-        embed = discord.Embed(
-            title="Tower Game",
-            description=f"**Current Level:** {self.current_level + 1}\n"
-                        f"**Potential Win:** ${potential_win:,.2f}\n"
-                        f"**Current Win:** ${current_win:,.2f}\n\n"
-                        f"```\n{tower_display}```",
-            color=discord.Color.blue()
-        )
-        embed.set_author(name=self.ctx.author.display_name, icon_url=self.ctx.author.display_avatar.url)
-        
-        footer_text = "🟩 = Safe | 🟥 = Bomb | ⬜ = Unknown"
-        if self.game_over:
-            footer_text += " | 🟨 = Where You Stopped"
-        
-        embed.set_footer(text=footer_text)
-        return embed
-
-class HighLowGame(View):
-    def __init__(self, ctx, bet, economy_cog):
-        super().__init__(timeout=30)
-        self.ctx = ctx
-        self.bet = bet
-        self.economy_cog = economy_cog
-        self.first_number = random.randint(1, 100)
-        self.second_number = random.randint(1, 100)
-
-    @discord.ui.button(label="Higher", style=discord.ButtonStyle.green)
-    async def higher(self, interaction: discord.Interaction, button: Button):
-        await self.make_guess(interaction, "higher")
-
-    @discord.ui.button(label="Lower", style=discord.ButtonStyle.red)
-    async def lower(self, interaction: discord.Interaction, button: Button):
-        await self.make_guess(interaction, "lower")
-
-    @discord.ui.button(label="Jackpot", style=discord.ButtonStyle.blurple)
-    async def jackpot(self, interaction: discord.Interaction, button: Button):
-        await self.make_guess(interaction, "jackpot")
-
-    async def make_guess(self, interaction: discord.Interaction, guess):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("This is not your game!", ephemeral=True)
-            return
-
-        result = self.check_result(guess)
-        await self.end_game(interaction, result)
-
-    def check_result(self, guess):
-        if guess == "higher" and self.second_number > self.first_number:
-            return "win"
-        elif guess == "lower" and self.second_number < self.first_number:
-            return "win"
-        elif guess == "jackpot" and self.second_number == self.first_number:
-            return "jackpot"
-        else:
-            return "lose"
-
-    async def end_game(self, interaction, result):
-        user_id = self.ctx.author.id
-        user_data = await self.economy_cog.get_user_data(user_id)
-        
-        if result == "win":
-            winnings = self.bet  # This is the profit
-            user_data['balance'] += winnings  # Add only the profit to the balance
-            color = discord.Color.green()
-            message = f"You won! The number was {self.second_number}."
-        elif result == "jackpot":
-            winnings = self.bet * 9  # This is the profit (10x bet minus the original bet)
-            user_data['balance'] += winnings  # Add only the profit to the balance
-            color = discord.Color.gold()
-            message = f"JACKPOT! The number was {self.second_number}."
-        else:
-            winnings = -self.bet  # This is the loss
-            user_data['balance'] += winnings  # Subtract the bet from the balance
-            color = discord.Color.red()
-            message = f"You lost. The number was {self.second_number}."
-
-        await self.economy_cog.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        embed = discord.Embed(
-            title="Highlow Game Result",
-            description=f"First number: {self.first_number}\n{message}\n\n"
-                        f"You {'won' if result != 'lose' else 'lost'} **${abs(winnings):,.2f}**.\n"
-                        f"Your new balance is **${user_data['balance']:,.2f}**. 💵",
-            color=color
-        )
-        embed.set_author(name=self.ctx.author.display_name, icon_url=self.ctx.author.display_avatar.url)
-
-        for child in self.children:
-            child.disabled = True
-
-        await interaction.response.edit_message(embed=embed, view=self)
-
-
-
-class Economy(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-        self.db_name = 'economy_database.db'
-        self.lock = asyncio.Lock()
-        self.db = None
-        self.bot.loop.create_task(self.setup_database())
-        self.case_data = self.load_case_data()
-
-    def generate_bot_name(self):
-        prefixes = ["Cyber", "Quantum", "Nexus", "Astro", "Cosmic", "Nova", "Stellar", "Galactic"]
-        suffixes = ["Bot", "AI", "Mind", "Core", "Unit", "Droid", "Sentinel", "Agent"]
-        return f"{random.choice(prefixes)}{random.choice(suffixes)}"
-
-    def load_case_data(self):
-        return {
-            "starter_spark": {
-                "name": "Starter Spark",
-                "price": 500,
-                "color": 0x1abc9c,
-                "items": {
-                    "common": [("Rusty Combat Knife", 75), ("Worn Tactical Vest", 75)],
-                    "rare": [("Custom Engraved Pistol", 200), ("Enhanced Night Vision Goggles", 200)],
-                    "epic": [("Stealth Recon Outfit", 500), ("Dragonfire Grenade", 500)],
-                    "legendary": [("Phoenix Revolver", 1200), ("Spectral Cloak", 1200)]
-                }
-            },
-            "novice_nest": {
-                "name": "Novice Nest",
-                "price": 1000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Basic Survival Gear", 100), ("Entry-Level Drone", 100)],
-                    "rare": [("Advanced Sniper Rifle", 300), ("Deployable Shield", 300)],
-                    "epic": [("Titanium Combat Armor", 750), ("Quantum Stealth Module", 750)],
-                    "legendary": [("Nebula Assault Rifle", 1800), ("Hyperion Battle Suit", 1800)]
-                }
-            },
-            "wanderers_way": {
-                "name": "Wanderer's Way",
-                "price": 1500,
-                "color": 0x9b59b6,
-                "items": {
-                    "common": [("Standard Issue Handgun", 150), ("Utility Belt", 150)],
-                    "rare": [("Exotic Survival Knife", 400), ("Adaptive Camouflage", 400)],
-                    "epic": [("Mark II Combat Drone", 900), ("Phantom Suppressor", 900)],
-                    "legendary": [("Aurora Energy Blaster", 2200), ("Eclipse Power Armor", 2200)]
-                }
-            },
-            "common_cache": {
-                "name": "Common Cache",
-                "price": 2000,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Basic Survival Kit", 200), ("Entry-Level Gadget", 200)],
-                    "rare": [("Advanced Utility Belt", 500), ("Compact Drone", 500)],
-                    "epic": [("Nano-Tech Armor", 1200), ("High-Performance Backpack", 1200)],
-                    "legendary": [("Omni-Tool Kit", 3000), ("Elite Tactical Gear", 3000)]
-                }
-            },
-            "cosmic_chest": {
-                "name": "Cosmic Chest",
-                "price": 3000,
-                "color": 0xf39c12,
-                "items": {
-                    "common": [("Starlight Pendant", 100), ("Galactic Bookmark", 100)],
-                    "rare": [("Celestial Map", 300), ("Lunar Lantern", 300)],
-                    "epic": [("Nebula Crystal", 700), ("Astral Telescope", 700)],
-                    "legendary": [("Quantum Starship Model", 1600), ("Galactic Voyage Diary", 1600)]
-                }
-            },
-            "mystic_box": {
-                "name": "Mystic Box",
-                "price": 3500,
-                "color": 0x8e44ad,
-                "items": {
-                    "common": [("Enchanted Journal", 150), ("Runic Keychain", 150)],
-                    "rare": [("Ancient Rune Stones", 400), ("Mystic Potion Set", 400)],
-                    "epic": [("Wizards' Staff Replica", 900), ("Sorcerer's Amulet", 900)],
-                    "legendary": [("Arcane Grimoire", 2100), ("Dragon's Heart Crystal", 2100)]
-                }
-            },
-            "futuristic_fortune": {
-                "name": "Futuristic Fortune",
-                "price": 4000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Holo-Glasses", 200), ("Neon Keycard", 200)],
-                    "rare": [("Techno Wristband", 500), ("Digital Pet", 500)],
-                    "epic": [("Virtual Reality Headset", 1100), ("Holographic Projector", 1100)],
-                    "legendary": [("Anti-Gravity Boots", 2500), ("Cybernetic Companion Drone", 2500)]
-                }
-            },
-            "fantasy_bundle": {
-                "name": "Fantasy Bundle",
-                "price": 4500,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Magic Wand Trinket", 125), ("Fairy Dust Pouch", 125)],
-                    "rare": [("Enchanted Necklace", 350), ("Dragon Scale Brooch", 350)],
-                    "epic": [("Unicorn Figurine", 800), ("Phoenix Feather Quill", 800)],
-                    "legendary": [("Wizard's Cloak", 1900), ("Griffin's Talon", 1900)]
-                }
-            },
-            "retro_vault": {
-                "name": "Retro Vault",
-                "price": 5000,
-                "color": 0xf1c40f,
-                "items": {
-                    "common": [("Vintage Cassette Tape", 180), ("Retro Game Console Keychain", 180)],
-                    "rare": [("Classic Arcade Token Set", 450), ("Old School Action Figure", 450)],
-                    "epic": [("Retro Game Cartridge Collection", 1000), ("Vintage Comic Book Collection", 1000)],
-                    "legendary": [("Limited Edition Vinyl Record", 2300), ("Retro Gaming Cabinet Model", 2300)]
-                }
-            },
-            "mythic_cache": {
-                "name": "Mythic Cache",
-                "price": 6000,
-                "color": 0x2ecc71,
-                "items": {
-                    "common": [("Legendary Coin", 200), ("Mystic Amulet", 200)],
-                    "rare": [("Ancient Artifact", 500), ("Celestial Pendant", 500)],
-                    "epic": [("Elder Relic", 1100), ("Mythic Tome", 1100)],
-                    "legendary": [("Godly Crown", 2500), ("Epic Orb of Power", 2500)]
-                }
-            },
-            "celestial_cache": {
-                "name": "Celestial Cache",
-                "price": 7000,
-                "color": 0x34495e,
-                "items": {
-                    "common": [("Nebula Gem", 250), ("Galactic Scroll", 250)],
-                    "rare": [("Solar Flare Pendant", 600), ("Cosmic Ring", 600)],
-                    "epic": [("Stellar Map", 1400), ("Astral Compass", 1400)],
-                    "legendary": [("Interstellar Telescope", 3200), ("Celestial Artifact", 3200)]
-                }
-            },
-            "arcane_arsenal": {
-                "name": "Arcane Arsenal",
-                "price": 8000,
-                "color": 0x9b59b6,
-                "items": {
-                    "common": [("Enchanted Mirror", 300), ("Mystic Bracelet", 300)],
-                    "rare": [("Arcane Scroll", 750), ("Wizard's Wand", 750)],
-                    "epic": [("Sorcerer's Tome", 1700), ("Magical Crystal Ball", 1700)],
-                    "legendary": [("Ancient Grimoire", 4000), ("Dragon's Breath Amulet", 4000)]
-                }
-            },
-            "cosmic_conundrum": {
-                "name": "Cosmic Conundrum",
-                "price": 9000,
-                "color": 0x1abc9c,
-                "items": {
-                    "common": [("Stardust Pendant", 350), ("Galactic Charm", 350)],
-                    "rare": [("Lunar Orb", 800), ("Astral Beacon", 800)],
-                    "epic": [("Cosmic Map", 1800), ("Nebula Compass", 1800)],
-                    "legendary": [("Quantum Starship", 4200), ("Galactic Relic", 4200)]
-                }
-            },
-            "astral_attic": {
-                "name": "Astral Attic",
-                "price": 10000,
-                "color": 0xe67e22,
-                "items": {
-                    "common": [("Meteorite Fragment", 400), ("Stellar Bookmark", 400)],
-                    "rare": [("Solar Prism", 900), ("Lunar Artifact", 900)],
-                    "epic": [("Nebula Sphere", 2000), ("Galactic Navigator", 2000)],
-                    "legendary": [("Interstellar Capsule", 5000), ("Cosmic Archive", 5000)]
-                }
-            },
-            "infinity_insight": {
-                "name": "Infinity Insight",
-                "price": 11000,
-                "color": 0x3498db,
-                "items": {
-                    "common": [("Holo-Projector", 450), ("Galactic Token", 450)],
-                    "rare": [("Quantum Shard", 1000), ("Celestial Compass", 1000)],
-                    "epic": [("Stellar Map", 2200), ("Astral Telescope", 2200)],
-                    "legendary": [("Cosmic Relic", 5500), ("Galactic Navigator", 5500)]
-                }
-            },
-            "transcendent_treasure": {
-                "name": "Transcendent Treasure",
-                "price": 12000,
-                "color": 0xf1c40f,
-                "items": {
-                    "common": [("Cosmic Chip", 500), ("Stellar Key", 500)],
-                    "rare": [("Astral Gem", 1100), ("Nebula Pendant", 1100)],
-                    "epic": [("Galactic Atlas", 2500), ("Quantum Cube", 2500)],
-                    "legendary": [("Celestial Sphere", 6000), ("Ethereal Relic", 6000)]
-                }
-            },
-            "quantum_quiver": {
-                "name": "Quantum Quiver",
-                "price": 13000,
-                "color": 0xe74c3c,
-                "items": {
-                    "common": [("Lunar Coin", 550), ("Stellar Badge", 550)],
-                    "rare": [("Cosmic Lantern", 1200), ("Nebula Map", 1200)],
-                    "epic": [("Galactic Telescope", 2800), ("Astral Projector", 2800)],
-                    "legendary": [("Interstellar Engine", 6500), ("Quantum Relic", 6500)]
-                }
-            },
-            "omniversal_orb": {
-                "name": "Omniversal Orb",
-                "price": 14000,
-                "color": 0x2ecc71,
-                "items": {
-                    "common": [("Galactic Fragment", 600), ("Stellar Token", 600)],
-                    "rare": [("Astral Compass", 1300), ("Celestial Beacon", 1300)],
-                    "epic": [("Nebula Telescope", 3000), ("Cosmic Sphere", 3000)],
-                    "legendary": [("Quantum Nexus", 7000), ("Interstellar Artifact", 7000)]
-                }
-            }
-        }
-
-    async def check_balance(self, user, amount):
-        async with aiosqlite.connect(self.db_name) as db:
-            await db.execute('CREATE TABLE IF NOT EXISTS users (user_id INTEGER PRIMARY KEY, balance INTEGER)')
-            async with db.execute('SELECT balance FROM users WHERE user_id = ?', (user.id,)) as cursor:
-                result = await cursor.fetchone()
-            
-            if result is None:
-                await db.execute('INSERT INTO users (user_id, balance) VALUES (?, 0)', (user.id,))
-                await db.commit()
-                return False
-            
-            return result[0] >= amount
-
-    async def setup_database(self):
-        self.db = await aiosqlite.connect(self.db_name)
-        await self.db.execute('''
-            CREATE TABLE IF NOT EXISTS user_data (
-                user_id INTEGER PRIMARY KEY,
-                balance REAL,
-                bank REAL
-            )
-        ''')
-        await self.db.commit()
-
-    async def get_user_data(self, user_id: int):
-        async with self.lock:
-            async with self.db.execute('SELECT balance, bank FROM user_data WHERE user_id = ?', (user_id,)) as cursor:
-                result = await cursor.fetchone()
-                if result:
-                    return {'balance': result[0], 'bank': result[1]}
-                else:
-                    return {'balance': 0, 'bank': 0}
-
-    async def update_user_data(self, user_id: int, new_balance: float, new_bank: float):
-        async with self.lock:
-            new_balance = round(max(0, new_balance), 2)
-            new_bank = round(max(0, new_bank), 2)
-            await self.db.execute('''
-                INSERT OR REPLACE INTO user_data (user_id, balance, bank)
-                VALUES (?, ?, ?)
-            ''', (user_id, new_balance, new_bank))
-            await self.db.commit()
-
-    async def send_embed(self, ctx, description: str, color: discord.Color, delete_after: int = None):
-        embed = discord.Embed(description=description, color=color)
-        message = await ctx.send(embed=embed)
-        if delete_after:
-            await message.delete(delay=delete_after)
-
-    def cog_unload(self):
-        asyncio.create_task(self.close_db())
-
-    async def close_db(self):
-        if self.db:
-            await self.db.close()
-
-
-    @commands.command(aliases=['cb'])
-    async def casebattle(self, ctx):
-        embed = discord.Embed(title="Case Battle", color=discord.Color.gold())
-        
-        embed.add_field(name="Host", value=ctx.author.mention, inline=False)
-        embed.add_field(name="Cases", value="Not selected yet", inline=False)
-        embed.add_field(name="Total Bet", value="$0", inline=False)
-        embed.add_field(name="Players", value="Waiting for players to join...", inline=False)
-        embed.add_field(name="Mode", value="Player Battle", inline=False)
-        embed.add_field(name="Status", value="Waiting for case selection and players...", inline=False)
-        
-        view = CaseBattleView(ctx.author, self, self.case_data)  # Pass self.case_data here
-        message = await ctx.send(embed=embed, view=view)
-        
-        await view.wait()
-        
-        if view.selected_cases:
-            await self.run_battle(ctx, message, view.selected_cases, view.total_bet, view.teams, view.is_bot_battle)
-        else:
-            embed.set_field_at(5, name="Status", value="Battle cancelled - no cases selected", inline=False)
-            await message.edit(embed=embed, view=None)
-
-
-    async def run_battle(self, ctx, battle_message, selected_cases, total_bet, teams, is_bot_battle):
-        embed = battle_message.embeds[0]
-        team_totals = {1: 0, 2: 0}
-        player_totals = {player: 0 for team in teams.values() for player in team}
-
-        embed.set_field_at(5, name="Status", value="Opening cases...", inline=False)
-        await battle_message.edit(embed=embed)
-
-        for case_type, amount in selected_cases.items():
-            for _ in range(amount):
-                for team_num, team in teams.items():
-                    for player in team:
-                        rarity = random.choices(["common", "rare", "epic", "legendary"], weights=[60, 30, 9, 1])[0]
-                        item_name, item_value = random.choice(self.case_data[case_type]["items"][rarity])
-                        
-                        player_totals[player] += item_value
-                        team_totals[team_num] += item_value
-
-                        progress = "Battle Progress:\n"
-                        for t_num, t_total in team_totals.items():
-                            progress += f"Team {t_num}: ${t_total:,}\n"
-                        embed.set_field_at(5, name="Status", value=progress, inline=False)
-                        
-                        embed.add_field(name=f"{self.case_data[case_type]['name']} Case", 
-                                        value=f"{player}: {item_name} (${item_value:,})", 
-                                        inline=False)
-                        await battle_message.edit(embed=embed)
-                        await asyncio.sleep(1)  # Add some delay for suspense
-
-        # Determine winner
-        if team_totals[1] > team_totals[2]:
-            result = f"Team 1 wins ${total_bet:,}!"
-        elif team_totals[1] < team_totals[2]:
-            result = f"Team 2 wins ${total_bet:,}!"
-        else:
-            result = "It's a tie! Bets are returned."
-
-        embed.add_field(name="Result", value=result, inline=False)
-        
-        # Show individual player totals
-        player_results = "Player Totals:\n"
-        for player, total in player_totals.items():
-            player_results += f"{player}: ${total:,}\n"
-        embed.add_field(name="Player Totals", value=player_results, inline=False)
-        
-        # Update player balances based on the results
-        winning_team = 1 if team_totals[1] > team_totals[2] else 2
-        losing_team = 2 if winning_team == 1 else 1
-
-        async with aiosqlite.connect('your_database.db') as db:
-            if team_totals[1] != team_totals[2]:  # If it's not a tie
-                for player in teams[winning_team]:
-                    if not isinstance(player, str):  # Check if it's not a bot
-                        await db.execute(
-                            "UPDATE users SET balance = balance + ? WHERE user_id = ?",
-                            (total_bet // len(teams[winning_team]), player.id)
-                        )
-                
-                for player in teams[losing_team]:
-                    if not isinstance(player, str):  # Check if it's not a bot
-                        await db.execute(
-                            "UPDATE users SET balance = balance - ? WHERE user_id = ?",
-                            (total_bet // len(teams[losing_team]), player.id)
-                        )
-            else:
-                # If it's a tie, return the bets
-                for team in teams.values():
-                    for player in team:
-                        if not isinstance(player, str):  # Check if it's not a bot
-                            await db.execute(
-                                "UPDATE users SET balance = balance + ? WHERE user_id = ?",
-                                (total_bet // (len(teams[1]) + len(teams[2])), player.id)
-                            )
-            
-            await db.commit()
-
-            # Update the embed to show the new balances
-            for team_num, team in teams.items():
-                for player in team:
-                    if not isinstance(player, str):  # Check if it's not a bot
-                        async with db.execute("SELECT balance FROM users WHERE user_id = ?", (player.id,)) as cursor:
-                            result = await cursor.fetchone()
-                            new_balance = result[0] if result else 0
-                        embed.add_field(name=f"{player} New Balance", value=f"${new_balance:,}", inline=True)
-
-        await battle_message.edit(embed=embed)
-
-
-
-    @commands.command()
-    async def slider(self, ctx):
-        game = SliderGame(ctx, self)
-        await game.run_game()
-
-    @commands.command(name='balance', description='Check your balance or the balance of another user.', aliases=['bal', 'money', 'cash', 'bank', 'wallet', 'networth'])
-    async def balance(self, ctx, member: discord.Member = None):
-        if member is None:
-            user_id = ctx.author.id
-            user_data = await self.get_user_data(user_id)
-            user = ctx.author
-        else:
-            user_id = member.id
-            user_data = await self.get_user_data(user_id)
-            user = member
-
-        balance = user_data['balance']
-        bank = user_data['bank']
-        networth = balance + bank
-
-        await self.send_embed(ctx, f"🏦 {user.mention}, **Wallet**: ${balance:,.2f}, **Bank**: ${bank:,.2f}, **Networth**: ${networth:,.2f}", 0x747c8c)
-
-    @commands.command(name='deposit', description='Deposit dollars into your bank.', aliases=['dep', 'depo'])
-    async def deposit(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-                return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must deposit a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to deposit.", discord.Color.red(), delete_after=5)
-            return
-
-        user_data['balance'] -= amount
-        user_data['bank'] += amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Amount Deposited**: ${amount:,.2f}", discord.Color.green(), delete_after=5)
-
-    @commands.command(name='withdraw', description='Withdraw dollars from your bank.', aliases=['with', 'bankwithdraw'])
-    async def withdraw(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['bank'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['bank']
-        elif amount.lower() == 'quarter':
-            amount = user_data['bank'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-                return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must withdraw a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        if user_data['bank'] < amount:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough money in the bank to withdraw.", discord.Color.red(), delete_after=5)
-            return
-
-        user_data['balance'] += amount
-        user_data['bank'] -= amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Amount Withdrawn**: ${amount:,.2f}", discord.Color.green(), delete_after=5)
-
-
-
-    @commands.command(name='beg', description='Beg for money.')
-    @commands.cooldown(1, 30, commands.BucketType.user)  # 30 second cooldown
-    async def beg(self, ctx):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        celebrities = [
-            "Elon Musk", "Jeff Bezos", "Bill Gates", "Mark Zuckerberg", "Kanye West", 
-            "Drake", "Rihanna", "Taylor Swift", "PewDiePie", "MrBeast", "Ninja", 
-            "Jacksepticeye", "Kylie Jenner", "Ariana Grande", "Justin Bieber", "Cardi B", 
-            "Travis Scott", "Lil Nas X", "Selena Gomez", "Zendaya", "Logan Paul", 
-            "Jake Paul", "Shane Dawson", "James Charles", "Snoop Dogg", "Eminem", 
-            "Nicki Minaj", "Lil Wayne", "Kendrick Lamar", "Migos", "Post Malone", 
-            "Your Mom", "Gordon Ramsay", "Oprah Winfrey", "Ellen DeGeneres", 
-            "Your Sister", "Fanum", "Jimmy Kimmel", "Your Brother", 
-            "Cristiano Ronaldo", "LeBron James", "Tom Brady", "Michael Jackson", 
-            "Usain Bolt", "Kim Kardashian", "Dwayne Johnson", "Ryan Reynolds", 
-            "Jason Momoa", "Kevin Hart", "Henry Cavill", "Margot Robbie", 
-            "Timothée Chalamet", "Andrew Tate", "Robert Downey Jr.", 
-            "Kai Cenat", "Chris Hemsworth", "Tom Holland", 
-            "Johnny Depp", "Angelina Jolie", "Brad Pitt", "Matthew McConaughey",
-            "Will Smith", "Jada Pinkett Smith", "Javier Bardem", "Duke Dennis",
-            "Beyoncé", "Adele", "Shakira", "Miley Cyrus", "Jesus Christ", "Zayn Malik", 
-            "Ed Sheeran", "Sam Smith", "Halsey", "Post Malone", "Doja Cat", 
-            "Halsey", "The Weeknd", "Megan Thee Stallion", "Billie Eilish", 
-            "J Cole", "Drake", "Lil Uzi Vert", "Future", "Tyler, The Creator", 
-            "SZA", "A$AP Rocky", "Travis Scott", "Juice WRLD", "21 Savage"
-        ]
-
-        scenarios = [
-            "You begged and received **${:,.2f}** from **{}**. Say thank you!",
-            "You begged and found **${:,.2f}** on the ground.",
-            "You begged and a generous person gave you **${:,.2f}**.",
-            "You begged and found a hidden stash of **${:,.2f}**.",
-            "You begged and **{}** gave you **${:,.2f}**.",
-            "You begged **{}** and they were feeling generous and gave you **${:,.2f}**.",
-            "You begged and **Random Stranger** gave you **${:,.2f}**.",
-            "You begged **{}** and they gave you **${:,.2f}**.",
-            "You begged **{}** and they gave you **${:,.2f}**. They said you might have better luck next time.",
-            "You begged **{}** and they gave you **${:,.2f}** and some advice on how to improve your begging skills.",
-            "You begged and **{}** was in a good mood, so they gave you **${:,.2f}**.",
-            "You begged and **{}** was so impressed by your persistence that they gave you **${:,.2f}**.",
-            "You begged **{}** and they gave you **${:,.2f}** because they felt sorry for you.",
-            "You begged **{}** and they gave you **${:,.2f}** as a reward for your efforts.",
-            "You begged **{}** and they generously gave you **${:,.2f}**.",
-            "You begged **{}** and they gave you **${:,.2f}** along with some motivational words.",
-            "You begged **{}** and they gave you **${:,.2f}**. They said, 'Keep going!'",
-            "You begged and **{}** decided to help you out with **${:,.2f}**.",
-            "You begged and **{}** gave you **${:,.2f}** because they liked your determination.",
-            "You begged and **{}** gave you **${:,.2f}** after you told them your story.",
-            "You begged **{}** and they gave you **${:,.2f}**. They wished you good luck!",
-            "You begged **{}** and they gave you **${:,.2f}** and said to pass it on when you can.",
-            "You begged **{}** and they gave you **${:,.2f}**. They were impressed by your perseverance.",
-            "You begged **{}** and they gave you **${:,.2f}** and a smile.",
-            "You begged **{}** for money and they gave you a **${:,.2f}** gift card instead.",
-            "You begged **{}** and they gave you **${:,.2f}** to help with your situation.",
-            "You begged **{}** but they said they couldn’t help today.",
-            "You begged **{}** and they were not in the mood to give.",
-            "You begged **{}** and they told you to try asking someone else.",
-            "You begged **{}** and they said they’re out of cash.",
-            "You begged **{}** and they gave you a pep talk but no money.",
-            "You begged **{}** but they just walked away without saying a word.",
-            "You begged **{}** and they told you to get a job instead.",
-            "You begged **{}** and they gave you a discount coupon instead.",
-            "You begged **{}** and they said they had no money to spare.",
-            "You begged **{}** and they told you to try your luck elsewhere.",
-            "You begged **{}** but they were not interested in helping."
-        ]
-
-        scenario = random.choice(scenarios)
-        if "{}" in scenario:
-            if "received" in scenario or "found" in scenario or "gave you" in scenario:
-                amount = random.uniform(10, 500)
-                user_data['balance'] += amount
-                await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-                if "Random Stranger" in scenario:
-                    scenario = scenario.format(amount)
-                else:
-                    celebrity = random.choice(celebrities)
-                    scenario = scenario.format(celebrity, amount)
-            else:
-                celebrity = random.choice(celebrities)
-                scenario = scenario.format(celebrity)
-        else:
-            scenario = scenario.format(random.choice(celebrities))  # For scenarios that don't need an amount
-
-        # Format the amount in the message if present
-        scenario = scenario.replace("{amount:,.2f}", f"{amount:,.2f}")
-
-        await self.send_embed(ctx, f"🤲 {ctx.author.mention}, {scenario}", discord.Color.yellow())
-
-
-
-
-    @commands.command(name='search', description='Search for items or money.')
-    @commands.cooldown(1, 60, commands.BucketType.user)  # 1 minute cooldown
-    async def search(self, ctx):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        scenarios = [
-            "You searched the local trash can and found **${:,.2f}**.",
-            "You searched under the couch and found **${:,.2f}**.",
-            "You searched the park and found a hidden treasure of **${:,.2f}**.",
-            "You searched the alley and found **${:,.2f}** in an old wallet.",
-            "You searched the dumpster and found **${:,.2f}** in a discarded bag.",
-            "You searched the old bookstore and found **${:,.2f}** in a forgotten book.",
-            "You searched the abandoned warehouse and discovered **${:,.2f}** in a hidden compartment.",
-            "You searched the beach and stumbled upon **${:,.2f}** in a buried chest.",
-            "You searched the attic and found **${:,.2f}** in a dusty old trunk.",
-            "You searched the park bench and found **${:,.2f}** stuffed between the cushions.",
-            "You searched the train station and discovered **${:,.2f}** in an old suitcase.",
-            "You searched the library and found **${:,.2f}** in a misplaced book.",
-            "You searched the carnival and stumbled upon **${:,.2f}** in a forgotten game booth.",
-            "You searched the abandoned mall and discovered **${:,.2f}** in a broken vending machine.",
-            "You searched the old theater and found **${:,.2f}** in a hidden drawer.",
-            "You searched the old circus tent and found **${:,.2f}** in a forgotten box.",
-            "You searched the zoo and discovered **${:,.2f}** hidden behind the animal enclosure.",
-            "You searched the museum and found **${:,.2f}** in a hidden display.",
-            "You searched the hospital and stumbled upon **${:,.2f}** in an old donation box.",
-            "You searched the police station and found **${:,.2f}** in a lost and found box.",
-            "You searched the airport and discovered **${:,.2f}** in abandoned luggage.",
-            "You searched the college campus and found **${:,.2f}** in a forgotten locker.",
-            "You searched the amusement park and discovered **${:,.2f}** in a broken ride.",
-            "You searched the farmers' market and found **${:,.2f}** in a misplaced produce crate.",
-            "You searched the botanical garden and found **${:,.2f}** in a hidden plant pot.",
-            "You searched the abandoned factory and discovered **${:,.2f}** in a dusty crate.",
-            "You searched the historical monument and found **${:,.2f}** in a hidden alcove.",
-            "You searched the old library and found **${:,.2f}** in a secret compartment.",
-            "You searched the hiking trail and stumbled upon **${:,.2f}** buried in a cave.",
-            "You searched the construction site and discovered **${:,.2f}** in an old tool box.",
-            "You searched the marina and found **${:,.2f}** in a sunken boat.",
-            "You searched the stadium and discovered **${:,.2f}** in a forgotten concession stand.",
-            "You searched the old diner and found **${:,.2f}** in a hidden drawer.",
-            "You searched the abandoned amusement park and discovered **${:,.2f}** in an old ticket booth.",
-            "You searched the parking garage and found **${:,.2f}** in a discarded parking ticket.",
-            "You searched the botanical garden and discovered **${:,.2f}** in a hidden garden gnome.",
-            "You searched the local gym and found **${:,.2f}** in an abandoned locker.",
-            "You searched the historic battlefield and discovered **${:,.2f}** buried in the ground.",
-            "You searched the city aquarium and found **${:,.2f}** in an old fish tank.",
-            "You searched the rooftop and discovered **${:,.2f}** in a hidden container.",
-            "You searched the ancient ruins and found **${:,.2f}** in a hidden chamber."
-        ]
-
-        scenario = random.choice(scenarios)
-        if "found" in scenario or "discovered" in scenario:
-            amount = random.uniform(10, 500)
-            user_data['balance'] += amount
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-            scenario = scenario.format(amount)
-
-        await self.send_embed(ctx, f"🔍 {ctx.author.mention}, {scenario}", discord.Color.blue())
-
-    @commands.command(name='daily', description='Claim a daily reward.')
-    async def daily(self, ctx):
-        user_id = ctx.author.id
-        current_time = int(time.time())
-        cooldown_end = await self.db.get_cooldown(user_id, 'daily')
-
-        if cooldown_end and current_time < cooldown_end:
-            remaining_time = cooldown_end - current_time
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your daily reward again.", discord.Color.yellow(), delete_after=5)
-            return
-
-        user_data = await self.get_user_data(user_id)
-        reward_amount = random.uniform(100, 500)
-        user_data['balance'] += reward_amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        # Set cooldown
-        await self.db.set_cooldown(user_id, 'daily', current_time + 86400)  # 24 hours cooldown
-
-        await self.send_embed(ctx, f"💸 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your daily reward!", discord.Color.yellow())
-
-    @commands.command(name='weekly', description='Claim a weekly reward.')
-    async def weekly(self, ctx):
-        user_id = ctx.author.id
-        current_time = int(time.time())
-        cooldown_end = await self.db.get_cooldown(user_id, 'weekly')
-
-        if cooldown_end and current_time < cooldown_end:
-            remaining_time = cooldown_end - current_time
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your weekly reward again.", discord.Color.yellow(), delete_after=5)
-            return
-
-        user_data = await self.get_user_data(user_id)
-        reward_amount = random.uniform(500, 2000)
-        user_data['balance'] += reward_amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        # Set cooldown
-        await self.db.set_cooldown(user_id, 'weekly', current_time + 604800)  # 7 days cooldown
-
-        await self.send_embed(ctx, f"💰 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your weekly reward!", discord.Color.yellow())
-
-    @commands.command(name='monthly', description='Claim a monthly reward.')
-    async def monthly(self, ctx):
-        user_id = ctx.author.id
-        current_time = int(time.time())
-        cooldown_end = await self.db.get_cooldown(user_id, 'monthly')
-
-        if cooldown_end and current_time < cooldown_end:
-            remaining_time = cooldown_end - current_time
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your monthly reward again.", discord.Color.yellow(), delete_after=5)
-            return
-
-        user_data = await self.get_user_data(user_id)
-        reward_amount = random.uniform(2000, 5000)
-        user_data['balance'] += reward_amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        # Set cooldown
-        await self.db.set_cooldown(user_id, 'monthly', current_time + 2592000)  # 30 days cooldown
-
-        await self.send_embed(ctx, f"💵 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your monthly reward!", discord.Color.yellow())
-
-
-
-    @commands.command(name='crime', aliases=['heist'], description='Commit a crime and potentially gain or lose money.')
-    async def crime(self, ctx):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-        balance = user_data['balance']
-
-        # List of 50 possible outcomes and their impact on balance
-        scenarios = [
-            ("You successfully robbed a bank and got away with **${:,.2f}**!", 0.5),
-            ("You managed to steal **${:,.2f}** from a wealthy businessman!", 0.4),
-            ("You pulled off a daring heist and got **${:,.2f}**!", 0.35),
-            ("You raided a jewelry store and found **${:,.2f}**!", 0.3),
-            ("You picked the lock and nabbed **${:,.2f}**!", 0.25),
-            ("You sneaked into a casino and won **${:,.2f}**!", 0.2),
-            ("You looted a rich person's house and found **${:,.2f}**!", 0.15),
-            ("You intercepted a money truck and seized **${:,.2f}**!", 0.4),
-            ("You managed a small-time robbery and got **${:,.2f}**!", 0.1),
-            ("You lifted some cash from a street vendor and ended up with **${:,.2f}**!", 0.05),
-            ("You successfully stole **${:,.2f}** from a high-end boutique!", 0.3),
-            ("You picked up **${:,.2f}** from a petty theft!", 0.1),
-            ("You swiped **${:,.2f}** from a careless wallet snatcher!", 0.2),
-            ("You jacked **${:,.2f}** from a local bank!", 0.35),
-            ("You snagged **${:,.2f}** from a gambling den!", 0.25),
-            ("You scored **${:,.2f}** from an ATM heist!", 0.4),
-            ("You nabbed **${:,.2f}** from a convenience store!", 0.1),
-            ("You pulled off a successful burglary and got **${:,.2f}**!", 0.3),
-            ("You got away with **${:,.2f}** after a quick smash-and-grab!", 0.2),
-            ("You robbed a high-roller and scored **${:,.2f}**!", 0.35),
-            ("You got **${:,.2f}** from a poker game heist!", 0.3),
-            ("You snagged **${:,.2f}** from a museum robbery!", 0.4),
-            ("You scored **${:,.2f}** from a successful shoplifting!", 0.15),
-            ("You managed to grab **${:,.2f}** from a wealthy benefactor!", 0.25),
-            ("You acquired **${:,.2f}** from a daring pickpocket!", 0.1),
-            ("You came away with **${:,.2f}** from a risky burglary!", 0.3),
-            ("You snatched **${:,.2f}** from a pawn shop!", 0.2),
-            ("You lifted **${:,.2f}** from an unsuspecting shopper!", 0.1),
-            ("You scored **${:,.2f}** from a lavish party!", 0.4),
-            ("You managed to rob a casino and got **${:,.2f}**!", 0.35),
-            ("You pulled in **${:,.2f}** from a well-planned heist!", 0.3),
-            ("You seized **${:,.2f}** from a daring safe-crack!", 0.2),
-            ("You snatched **${:,.2f}** from an elite club!", 0.15),
-            ("You robbed a rich mansion and walked away with **${:,.2f}**!", 0.4),
-            ("You grabbed **${:,.2f}** from an abandoned warehouse!", 0.25),
-            ("You scored **${:,.2f}** from a successful carjacking!", 0.1),
-            ("You netted **${:,.2f}** from a quick stick-up!", 0.35),
-            ("You successfully heisted **${:,.2f}** from a tech mogul!", 0.3),
-            ("You nabbed **${:,.2f}** from a high-stakes poker game!", 0.4),
-            ("You acquired **${:,.2f}** from an upscale mall!", 0.25),
-            ("You stole **${:,.2f}** from a big-shot entrepreneur!", 0.35),
-            ("You lifted **${:,.2f}** from a luxury apartment!", 0.3),
-            ("You seized **${:,.2f}** from a diamond store!", 0.4),
-            ("You made off with **${:,.2f}** from a quick robbery!", 0.2),
-            ("You grabbed **${:,.2f}** from a high-end restaurant!", 0.3),
-            ("You successfully pilfered **${:,.2f}** from a casino vault!", 0.35),
-            ("You snagged **${:,.2f}** from a rich celebrity!", 0.4),
-            ("You came away with **${:,.2f}** from a wealthy patron!", 0.25),
-            ("You scored **${:,.2f}** from a risky theft!", 0.3),
-            ("You nabbed **${:,.2f}** from a busy marketplace!", 0.15),
-            ("You pulled in **${:,.2f}** from a daring robbery!", 0.35),
-            ("You stole **${:,.2f}** from a high-end auction!", 0.4),
-            ("You acquired **${:,.2f}** from a quick stick-up!", 0.25),
-            ("You lifted **${:,.2f}** from a large warehouse!", 0.3),
-            ("You successfully pilfered **${:,.2f}** from a luxury yacht!", 0.35),
-            ("You managed to snag **${:,.2f}** from a major heist!", 0.4),
-            ("You scored **${:,.2f}** from a successful burglary!", 0.3),
-            ("You grabbed **${:,.2f}** from a lavish event!", 0.35),
-            ("You successfully lifted **${:,.2f}** from a rich philanthropist!", 0.4),
-            ("You were caught during the robbery and fined **${:,.2f}**!", -0.5),
-            ("You attempted a heist but got nothing and lost **${:,.2f}** in legal fees!", -0.35),
-            ("You were apprehended and lost **${:,.2f}** to the authorities!", -0.4),
-            ("You failed the crime and lost **${:,.2f}** to your accomplices!", -0.3),
-            ("You got caught and had to pay **${:,.2f}** in damages!", -0.25),
-            ("You attempted a robbery but ended up with a **${:,.2f}** fine!", -0.2),
-            ("You were unsuccessful and **${:,.2f}** was stolen from you by others!", -0.15),
-            ("You botched the crime and lost **${:,.2f}** in bribes!", -0.1),
-            ("You were caught in the act and **${:,.2f}** was confiscated!", -0.35),
-            ("Your crime failed miserably and you owe **${:,.2f}** in repairs!", -0.4),
-            ("You attempted a crime but ended up in jail, losing **${:,.2f}**!", -0.5),
-            ("Your heist was a flop and you lost **${:,.2f}** to the police!", -0.3),
-            ("You failed and had to cover **${:,.2f}** in damages!", -0.25),
-            ("You got caught trying to rob a bank and lost **${:,.2f}**!", -0.4),
-            ("Your crime was unsuccessful and you lost **${:,.2f}** to legal fees!", -0.35),
-            ("You were arrested and had to pay **${:,.2f}** in fines!", -0.3),
-            ("Your robbery failed and you had to cover **${:,.2f}** in damages!", -0.25),
-            ("You attempted a robbery and lost **${:,.2f}** to the cops!", -0.4),
-            ("Your crime went awry and you lost **${:,.2f}** in bribes!", -0.35),
-            ("You were unsuccessful and **${:,.2f}** was taken from you by rivals!", -0.3),
-            ("You got caught and had to pay **${:,.2f}** in legal costs!", -0.25),
-            ("You tried a robbery but ended up with **${:,.2f}** in fines!", -0.4),
-            ("You failed and **${:,.2f}** was seized by the authorities!", -0.3),
-            ("You were apprehended and lost **${:,.2f}** to legal issues!", -0.35),
-            ("You botched the heist and had to pay **${:,.2f}** in fines!", -0.2),
-            ("Your robbery failed and you lost **${:,.2f}** to damages!", -0.25),
-            ("You attempted a crime but had to pay **${:,.2f}** in compensation!", -0.3),
-            ("Your crime was unsuccessful and you lost **${:,.2f}** in bribes!", -0.4),
-            ("You were caught and had to pay **${:,.2f}** in legal fees!", -0.35),
-            ("You failed the robbery and lost **${:,.2f}** to the police!", -0.4),
-            ("Your heist went wrong and you lost **${:,.2f}** in damages!", -0.3),
-            ("You attempted a robbery and ended up with **${:,.2f}** in fines!", -0.25),
-        ]
-
-        # Minimum gain amount for successful crimes
-        min_gain = 50  # Minimum gain amount in dollars
-
-        # Select a random outcome
-        outcome, multiplier = random.choice(scenarios)
-
-        # Determine gain or loss
-        if multiplier > 0:
-            if balance == 0:
-                gain = min_gain  # Ensure minimum gain if balance is 0
-            else:
-                gain = balance * multiplier
-            user_data['balance'] += gain
-            embed_title = f"You Gained ${gain:,.2f}!"
-            embed_color = discord.Color.green()
-        elif multiplier < 0:
-            if balance == 0:
-                loss = 0  # No loss if balance is 0
-            else:
-                loss = abs(balance * multiplier)
-            user_data['balance'] -= loss
-            embed_title = f"You Lost ${loss:,.2f}!"
-            embed_color = discord.Color.red()
-        else:
-            embed_title = "Nothing Happened"
-            embed_color = discord.Color.gray()
-
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        # Send feedback message
-        await self.send_embed(ctx, f"💰{ctx.author.mention}, {outcome.format(gain if multiplier > 0 else loss)}\nYour current balance is **${user_data['balance']:,.2f}**.", embed_color)
-
-
-    @commands.command(name='highlow', aliases=['hl'], description='Play the Highlow game.')
-    async def highlow(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
-                return
-
-        if amount <= 0:
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", delete_after=5)
-            return
-
-        game = HighLowGame(ctx, amount, self)
-        embed = discord.Embed(
-            title="Highlow Game",
-            description=f"The number is **{game.first_number}**.\n"
-                        f"Will the next number be higher, lower, or the same?\n"
-                        f"Your bet: **${amount:,.2f}**",
-            color=discord.Color.blue()
-        )
-        embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-        await ctx.send(embed=embed, view=game)
-
-    @highlow.error
-    async def highlow_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
-
-    @commands.command(name='crash', description='Start a Crash game.')
-    async def crash(self, ctx):
-        game = CrashGame(ctx, self)
-        await game.run_game()
-
-    @crash.error
-    async def crash_error(self, ctx, error):
-        await ctx.send(f"🚫 {ctx.author.mention}, **Error**: An error occurred while starting the game.", delete_after=5)
-
-
-
-
-
-    @commands.command(name='tower', description='Play the Tower game.')
-    async def tower(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
-                return
-
-        if amount <= 0:
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", delete_after=5)
-            return
-
-        game = TowerGame(ctx, amount, self)
-        embed = game.create_embed()
-        await ctx.send(embed=embed, view=game)
-
-    @tower.error
-    async def tower_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
-
-    @commands.command(name='slots', description='Play the slot machine.')
-    async def slots(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-                return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", discord.Color.red(), delete_after=5)
-            return
-
-        symbols = ['🍒', '🍋', '🍊', '🍇', '🔔', '💎']
-        result = [random.choice(symbols) for _ in range(3)]
-
-        if result[0] == result[1] == result[2]:
-            if result[0] == '💎':
-                winnings = amount * 10
-            elif result[0] == '🔔':
-                winnings = amount * 5
-            else:
-                winnings = amount * 3
-        elif result[0] == result[1] or result[1] == result[2]:
-            winnings = amount * 1.5
-        else:
-            winnings = 0
-
-        user_data['balance'] += winnings - amount
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-        result_str = ' '.join(result)
-        if winnings > amount:
-            color = discord.Color.green()
-            title = f"You Won ${winnings - amount:,.2f}!"
-        elif winnings == amount:
-            color = discord.Color.yellow()
-            title = "You Broke Even!"
-        else:
-            color = discord.Color.red()
-            title = f"You Lost ${amount - winnings:,.2f}!"
-
-        embed = discord.Embed(
-            title=title,
-            description=f"🎰 {result_str} 🎰\n\nYou bet **${amount:,.2f}** and won **${winnings:,.2f}**.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-            color=color
-        )
-        embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-        await ctx.send(embed=embed)
-
-    @slots.error
-    async def slots_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-
-
-    @commands.command(name='coinflip', aliases=['cf'], description='Flip a coin and gamble your money.')
-    async def coinflip(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-                return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must gamble a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to gamble.", discord.Color.red(), delete_after=5)
-            return
-
-        # Coin flip outcome
-        outcome = random.choice(['Heads', 'Tails'])
-        
-        # Assume the user calls 'Heads' or 'Tails' as the guess. You could add that as an argument if you want.
-        guess = random.choice(['Heads', 'Tails'])  # For example purposes; replace with actual user guess if available
-
-        if guess == outcome:
-            winnings = amount
-            user_data['balance'] += winnings
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-            embed = discord.Embed(
-                title=f"You Won ${winnings:,.2f}!",
-                description=f"Flipped a coin and guessed **{guess}**.\nThe coin landed on **{outcome}**.\nYou bet **${amount:,.2f}** and won **${winnings:,.2f}**.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-                color=discord.Color.green()
-            )
-            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-            await ctx.send(embed=embed)
-        else:
-            user_data['balance'] -= amount
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-            embed = discord.Embed(
-                title=f"You Lost ${amount:,.2f}!",
-                description=f"Flipped a coin and guessed **{guess}**.\nThe coin landed on **{outcome}**.\nYou bet **${amount:,.2f}** and lost.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-                color=discord.Color.red()
-            )
-            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-            await ctx.send(embed=embed)
-
-
-
-    @commands.command(name='gamble', description='Gamble your money.')
-    async def gamble(self, ctx, amount: str):
-        user_id = ctx.author.id
-        user_data = await self.get_user_data(user_id)
-
-        if amount.lower() == 'half':
-            amount = user_data['balance'] / 2
-        elif amount.lower() == 'all':
-            amount = user_data['balance']
-        elif amount.lower() == 'quarter':
-            amount = user_data['balance'] / 4
-        else:
-            try:
-                amount = float(amount)
-            except ValueError:
-                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-                return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must gamble a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        if user_data['balance'] < amount:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to gamble.", discord.Color.red(), delete_after=5)
-            return
-
-        dice_roll = random.randint(1, 100)
-        if dice_roll < 50:
-            user_data['balance'] -= amount
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-            embed = discord.Embed(
-                title=f"You Lost ${amount:,.2f}!",
-                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] + amount:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Better luck next time. 📉\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-                color=discord.Color.red()
-            )
-            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-            await ctx.send(embed=embed)
-        elif dice_roll == 50:
-            user_data['balance'] -= amount / 2
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-            embed = discord.Embed(
-                title=f"You Lost ${amount / 2:,.2f}!",
-                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] + amount:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Couldve Been Worse. 🟰\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-                color=discord.Color.yellow()
-            )
-            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-            await ctx.send(embed=embed)
-        else:
-            winnings = amount * (dice_roll / 100)
-            user_data['balance'] += winnings
-            await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-
-            embed = discord.Embed(
-                title=f"You Won ${winnings:,.2f}!",
-                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] - winnings:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Congratulations! 📈\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
-                color=discord.Color.green()
-            )
-            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
-            await ctx.send(embed=embed)
-
-    @commands.command(name='pay', description='Transfer money to another user.', aliases=['give'])
-    async def pay(self, ctx, member: discord.Member, amount: float):
-        if member == ctx.author:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You cannot pay yourself.", discord.Color.red(), delete_after=5)
-            return
-
-        if amount <= 0:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must transfer a positive amount.", discord.Color.red(), delete_after=5)
-            return
-
-        user_id = ctx.author.id
-        target_id = member.id
-
-        user_data = await self.get_user_data(user_id)
-        target_data = await self.get_user_data(target_id)
-
-        # Add a small tolerance to account for floating-point precision errors
-        tolerance = 1e-6
-        if user_data['balance'] < amount + tolerance:
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to transfer.", discord.Color.red(), delete_after=5)
-            return
-
-        # Calculate the fee based on the amount
-        if amount < 1000:
-            fee_percentage = 0
-        elif amount < 5000:
-            fee_percentage = 0.05  # 5% fee
-        elif amount < 10000:
-            fee_percentage = 0.10  # 10% fee
-        else:
-            fee_percentage = 0.15  # 15% fee
-
-        fee_amount = amount * fee_percentage
-        amount_after_fee = amount - fee_amount
-
-        user_data['balance'] -= amount
-        target_data['balance'] += amount_after_fee
-
-        await self.update_user_data(user_id, user_data['balance'], user_data['bank'])
-        await self.update_user_data(target_id, target_data['balance'], target_data['bank'])
-
-        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Transferred**: ${amount_after_fee:,.2f} to {member.mention} with a **{fee_percentage * 100}%** fee.", discord.Color.green())
-
-
-    @commands.command(name='leaderboard', description='Display the top users by balance.', aliases=['leader', 'lb','gml'])
-    async def leaderboard(self, ctx):
-        async with aiosqlite.connect(self.db_name) as conn:
-            async with conn.execute('SELECT user_id, balance, bank FROM user_data ORDER BY (balance + bank) DESC LIMIT 100') as cursor:
-                results = await cursor.fetchall()
-
-        if not results:
-            await ctx.send(f"{ctx.author.mention}, No users found.", delete_after=5)
-            return
-
-        pages = [results[i:i + 10] for i in range(0, len(results), 10)]
-        view = LeaderboardView(self.bot, pages)
-        embed = view.create_embed(pages[0], 0)
-        view.message = await ctx.send(embed=embed, view=view)
-
-    @balance.error
-    async def balance_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid user.", discord.Color.red(), delete_after=5)
-
-    @deposit.error
-    async def deposit_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-
-    @withdraw.error
-    async def withdraw_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
-
-    @beg.error
-    async def beg_error(self, ctx, error):
-        if isinstance(error, commands.CommandOnCooldown):
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can beg again.", discord.Color.yellow(), delete_after=5)
-
-    @search.error
-    async def search_error(self, ctx, error):
-        if isinstance(error, commands.CommandOnCooldown):
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can search again.", discord.Color.yellow(), delete_after=5)
-
-    @daily.error
-    async def daily_error(self, ctx, error):
-        if isinstance(error, commands.CommandOnCooldown):
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your daily reward again.", discord.Color.yellow(), delete_after=5)
-
-    @weekly.error
-    async def weekly_error(self, ctx, error):
-        if isinstance(error, commands.CommandOnCooldown):
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your weekly reward again.", discord.Color.yellow(), delete_after=5)
-
-    @monthly.error
-    async def monthly_error(self, ctx, error):
-        if isinstance(error, commands.CommandOnCooldown):
-            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your monthly reward again.", discord.Color.yellow(), delete_after=5)
-
-    @pay.error
-    async def pay_error(self, ctx, error):
-        if isinstance(error, commands.MissingRequiredArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Missing required arguments.", discord.Color.red(), delete_after=5)
-        elif isinstance(error, commands.BadArgument):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid user or amount.", discord.Color.red(), delete_after=5)
-
-    @leaderboard.error
-    async def leaderboard_error(self, ctx, error):
-        if isinstance(error, commands.CommandInvokeError):
-            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: An error occurred while fetching the leaderboard.", discord.Color.red(), delete_after=5)
-
-class LeaderboardView(View):
-    def __init__(self, bot, pages):
-        super().__init__(timeout=360)
-        self.bot = bot
-        self.pages = pages
-        self.current_page = 0
-        self.message = None
-        self.update_button_states()
-
-    def update_button_states(self):
-        # Disable buttons if there is only one page
-        if len(self.pages) <= 1:
-            self.disable_all_buttons()
-        else:
-            # Manage button states based on current page
-            self.children[0].disabled = self.current_page == 0  # Previous button
-            self.children[1].disabled = self.current_page == len(self.pages) - 1  # Next button
-
-    def disable_all_buttons(self):
-        for child in self.children:
-            child.disabled = True
-
-    def create_embed(self, page, page_num):
-        def format_position(i, page_num):
-            if page_num == 0:
-                if i == 0:
-                    return "👑"
-                elif i == 1:
-                    return "🥈"
-                elif i == 2:
-                    return "🥉"
-            return f"`{i + 1 + page_num * 10}.`"
-
-        leaderboard_text = "\n".join([
-            f"{format_position(i, page_num)} **{self.bot.get_user(user_id).name if self.bot.get_user(user_id) else 'Unknown User'}** - ${net_worth:,.2f}"
-            for i, (user_id, balance, bank) in enumerate(page)
-            if (net_worth := balance + bank)
-        ])
-        embed = discord.Embed(title="Global Money Leaderboard", description=leaderboard_text, color=discord.Color.blue())
-        embed.set_footer(text=f"Page {page_num + 1}/{len(self.pages)}")
-        return embed
-
-    async def update_embed(self, interaction: discord.Interaction):
-        embed = self.create_embed(self.pages[self.current_page], self.current_page)
-        self.update_button_states()
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary)
-    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page > 0:
-            self.current_page -= 1
-        else:
-            self.current_page = len(self.pages) - 1
-        await self.update_embed(interaction)
-
-    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
-    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page < len(self.pages) - 1:
-            self.current_page += 1
-        else:
-            self.current_page = 0
-        await self.update_embed(interaction)
-
-    @discord.ui.button(label="Go to Page", style=discord.ButtonStyle.secondary)
-    async def go_to_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_modal(PageModal(self))
-
-    async def on_timeout(self):
-        self.disable_all_buttons()
-        if self.message:
-            await self.message.edit(view=self)
-
-class PageModal(Modal, title='Go to Page'):
-    page_number = TextInput(label='Page Number', placeholder='Enter a page number...')
-
-    def __init__(self, view):
-        super().__init__()
-        self.view = view
-
-    async def on_submit(self, interaction: discord.Interaction):
-        try:
-            page = int(self.page_number.value) - 1
-            if 0 <= page < len(self.view.pages):
-                self.view.current_page = page
-                await self.view.update_embed(interaction)
-            else:
-                await interaction.response.send_message(f"Invalid page number. Please enter a number between 1 and {len(self.view.pages)}.", ephemeral=True)
-        except ValueError:
-            await interaction.response.send_message("Please enter a valid number.", ephemeral=True)
-
-async def setup(bot):
+import discord
+from discord.ext import commands, tasks
+import aiosqlite
+import asyncio
+import bisect
+import collections
+import collections.abc
+import contextlib
+import heapq
+import json
+import logging
+import math
+import random
+import sys
+import time
+import types
+from utils.db import Database  # Import the Database class from utils.db
+from discord.ui import View, Button, Modal, TextInput
+
+log = logging.getLogger(__name__)
+
+class AccountCache:
+    # In-memory copy of the user_data table. Reads are served from here and
+    # writes only mark the row dirty; Economy.flush_accounts writes the dirty
+    # rows back in one batched transaction.
+    def __init__(self, max_size=50000):
+        self.rows = {}
+        self.accrued_at = {}  # When interest was last added to the bank, None until the account is first touched
+        self.dirty = set()
+        self.uncommitted = set()  # Written on the writer connection but not committed yet
+        self.listeners = []  # Called with (user_id, balance, bank) whenever a row changes
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.flush_time = 0.0
+        self.last_flush_time = 0.0
+
+    def get(self, user_id):
+        row = self.rows.pop(user_id, None)
+        if row is None:
+            self.misses += 1
+            return None
+        self.rows[user_id] = row  # Move to the end so eviction drops the least recently used rows first
+        self.hits += 1
+        return row
+
+    def load(self, user_id, balance, bank, accrued_at):
+        # Rows read from the database never overwrite a newer cached value
+        if user_id not in self.rows:
+            self.rows[user_id] = (balance, bank)
+            self.accrued_at[user_id] = accrued_at
+
+    def put(self, user_id, balance, bank):
+        self.rows.pop(user_id, None)
+        self.rows[user_id] = (balance, bank)
+        self.dirty.add(user_id)
+        for listener in self.listeners:
+            listener(user_id, balance, bank)
+
+    def store(self, user_id, balance, bank, accrued_at):
+        # Values returned by the database after a write. A row that was dirtied
+        # in the meantime holds a newer value and is left alone.
+        if user_id in self.dirty:
+            return
+        self.rows.pop(user_id, None)
+        self.rows[user_id] = (balance, bank)
+        self.accrued_at[user_id] = accrued_at
+        self.uncommitted.add(user_id)
+        for listener in self.listeners:
+            listener(user_id, balance, bank)
+
+    def take_dirty(self):
+        rows = [(user_id, *self.rows[user_id], self.accrued_at.get(user_id)) for user_id in self.dirty]
+        self.dirty.clear()
+        return rows
+
+    def record_flush(self, row_count, elapsed):
+        self.flushes += 1
+        self.rows_flushed += row_count
+        self.flush_time += elapsed
+        self.last_flush_time = elapsed
+
+    def evict(self):
+        # Only committed rows can be dropped, the reader connections can't see anything else
+        overflow = len(self.rows) - self.max_size
+        if overflow <= 0:
+            return
+        pinned = self.dirty | self.uncommitted
+        for user_id in [user_id for user_id in self.rows if user_id not in pinned][:overflow]:
+            del self.rows[user_id]
+            self.accrued_at.pop(user_id, None)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.rows),
+            'dirty': len(self.dirty),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'flushes': self.flushes,
+            'rows_flushed': self.rows_flushed,
+            'avg_flush_time': self.flush_time / self.flushes if self.flushes else 0.0,
+            'last_flush_time': self.last_flush_time,
+        }
+
+class SettleStats:
+    # Timing for Economy.settle_many and capture_many, one entry per settled batch
+    def __init__(self):
+        self.rounds = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, row_count, elapsed):
+        self.rounds += 1
+        self.rows += row_count
+        self.total_time += elapsed
+        self.last_time = elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def stats(self):
+        return {
+            'rounds': self.rounds,
+            'rows': self.rows,
+            'avg_time': self.total_time / self.rounds if self.rounds else 0.0,
+            'last_time': self.last_time,
+            'max_time': self.max_time,
+        }
+
+class EscrowIndex:
+    # In-memory mirror of the holds table. Held money has already left the wallet,
+    # so the cached balance is what a player can spend and this only answers
+    # which hold belongs to whom and how much each player has in play.
+    def __init__(self):
+        self.holds = {}  # hold id -> (user id, amount, game)
+        self.held = {}  # user id -> total in escrow
+        self.total = 0.0
+        self.captured = 0
+        self.released = 0
+
+    def add(self, hold_id, user_id, amount, game):
+        self.holds[hold_id] = (user_id, amount, game)
+        self.held[user_id] = round(self.held.get(user_id, 0) + amount, 2)
+        self.total = round(self.total + amount, 2)
+
+    def get(self, hold_id):
+        return self.holds.get(hold_id)
+
+    def pop(self, hold_id):
+        entry = self.holds.pop(hold_id, None)
+        if entry is not None:
+            user_id, amount, game = entry
+            self.total = round(self.total - amount, 2)
+            remaining = round(self.held[user_id] - amount, 2)
+            if remaining > 0:
+                self.held[user_id] = remaining
+            else:
+                del self.held[user_id]
+        return entry
+
+    def held_by(self, user_id):
+        return self.held.get(user_id, 0)
+
+    def stats(self):
+        return {
+            'holds': len(self.holds),
+            'players': len(self.held),
+            'total': self.total,
+            'captured': self.captured,
+            'released': self.released,
+        }
+
+class EconomyStats:
+    # Running money supply and what each source (a command, a game, pay fees,
+    # interest) adds to or takes out of it. Every tagged balance change lands in
+    # an hourly bucket and in a running total per reporting window, so !ecostats
+    # reads a few numbers instead of scanning user_data. Buckets not written yet
+    # are kept in `pending` for Economy.persist_stats.
+    def __init__(self, bucket_size=3600, windows=(('24h', 24), ('7d', 168))):
+        self.bucket_size = bucket_size
+        self.windows = dict(windows)  # name -> length in buckets
+        self.supply = 0.0  # Wallets plus banks, escrow is tracked by EscrowIndex
+        self.buckets = {}  # bucket -> {source: [minted, burned, events]}
+        self.spans = {name: collections.deque() for name in self.windows}  # Buckets counted in each window, oldest first
+        self.totals = {name: {} for name in self.windows}  # name -> {source: [minted, burned, events]}
+        self.pending = {}  # (bucket, source) -> [minted, burned, events]
+
+    def bucket_at(self, now):
+        return int(now // self.bucket_size)
+
+    def adjust(self, delta):
+        self.supply += delta
+
+    def record(self, source, delta, now=None):
+        bucket = self.bucket_at(time.time() if now is None else now)
+        minted, burned = max(delta, 0), max(-delta, 0)
+        self.add(bucket, source, minted, burned, 1)
+        counters = self.pending.setdefault((bucket, source), [0.0, 0.0, 0])
+        counters[0] += minted
+        counters[1] += burned
+        counters[2] += 1
+
+    def add(self, bucket, source, minted, burned, events):
+        if bucket not in self.buckets:
+            self.buckets[bucket] = {}
+            for span in self.spans.values():
+                span.append(bucket)
+            self.expire(bucket)
+        for totals in (self.buckets[bucket], *self.totals.values()):
+            counters = totals.setdefault(source, [0.0, 0.0, 0])
+            counters[0] += minted
+            counters[1] += burned
+            counters[2] += events
+
+    def expire(self, current):
+        # Takes buckets that fell out of a window off its totals, once per new bucket
+        for name, length in self.windows.items():
+            span = self.spans[name]
+            totals = self.totals[name]
+            while span and span[0] <= current - length:
+                for source, (minted, burned, events) in self.buckets[span.popleft()].items():
+                    counters = totals[source]
+                    counters[0] -= minted
+                    counters[1] -= burned
+                    counters[2] -= events
+        oldest = current - max(self.windows.values())
+        for bucket in [bucket for bucket in self.buckets if bucket <= oldest]:
+            del self.buckets[bucket]
+
+    def load(self, rows):
+        # (bucket, source, minted, burned, events) rows from economy_stats, oldest first
+        for row in rows:
+            self.add(*row)
+
+    def take_pending(self):
+        rows = [(bucket, source, *counters) for (bucket, source), counters in self.pending.items()]
+        self.pending = {}
+        return rows
+
+    def restore(self, rows):
+        # Puts rows from take_pending back after a failed write
+        for bucket, source, minted, burned, events in rows:
+            counters = self.pending.setdefault((bucket, source), [0.0, 0.0, 0])
+            counters[0] += minted
+            counters[1] += burned
+            counters[2] += events
+
+    def report(self, now=None):
+        self.expire(self.bucket_at(time.time() if now is None else now))
+        return {
+            'supply': round(self.supply, 2),
+            'windows': {name: {source: (round(minted, 2), round(burned, 2), events) for source, (minted, burned, events) in totals.items() if events}
+                        for name, totals in self.totals.items()},
+        }
+
+class Ledger:
+    # Append-only record of every balance change as (ts, user_id, balance_delta,
+    # bank_delta, source, game_id). Commands only put entries on a bounded queue
+    # and Economy.write_ledger drains it in large batches. If the writer falls
+    # behind and the queue fills up, entries wait in `spill` in order rather than
+    # being dropped or holding up the command.
+    def __init__(self, maxsize=50000, batch_size=5000):
+        self.queue = asyncio.Queue(maxsize)
+        self.spill = collections.deque()  # Always newer than everything in the queue
+        self.unwritten = []  # A batch whose write failed, older than both
+        self.writing = asyncio.Lock()  # Held while a batch is being inserted, so a flush never cuts the queue under it
+        self.batch_size = batch_size
+        self.recorded = 0
+        self.spilled = 0
+        self.written = 0
+        self.batches = 0
+        self.write_time = 0.0
+
+    def record(self, user_id, balance_delta, bank_delta, source, game_id=None, now=None):
+        entry = (time.time() if now is None else now, user_id, balance_delta, bank_delta, source, game_id)
+        self.recorded += 1
+        if not self.spill:
+            try:
+                self.queue.put_nowait(entry)
+                return
+            except asyncio.QueueFull:
+                pass
+        self.spill.append(entry)
+        self.spilled += 1
+
+    def pending(self):
+        return len(self.unwritten) + self.queue.qsize() + len(self.spill)
+
+    def take(self, limit=None):
+        # Oldest entries first, up to limit (everything by default)
+        if limit is None:
+            limit = self.pending()
+        batch, self.unwritten = self.unwritten[:limit], self.unwritten[limit:]
+        while len(batch) < limit and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        while len(batch) < limit and self.spill:
+            batch.append(self.spill.popleft())
+        return batch
+
+    def restore(self, batch):
+        self.unwritten = batch + self.unwritten
+
+    def record_batch(self, row_count, elapsed):
+        self.written += row_count
+        self.batches += 1
+        self.write_time += elapsed
+
+    def stats(self):
+        return {
+            'recorded': self.recorded,
+            'written': self.written,
+            'queued': self.pending(),
+            'spilled': self.spilled,
+            'batches': self.batches,
+            'avg_batch_time': self.write_time / self.batches if self.batches else 0.0,
+        }
+
+class LockStripes:
+    # Fixed array of locks indexed by user id, so one account's slow write only
+    # blocks the accounts that share its stripe. Operations on several accounts
+    # take their stripes in index order, which rules out deadlocks.
+    def __init__(self, count=64):
+        self.locks = [asyncio.Lock() for _ in range(count)]
+        self.acquisitions = [0] * count
+        self.contended = [0] * count
+        self.wait_time = [0.0] * count
+
+    def stripe(self, user_id):
+        return hash(user_id) % len(self.locks)
+
+    def hold(self, *user_ids):
+        return self.hold_stripes({self.stripe(user_id) for user_id in user_ids})
+
+    def hold_all(self):
+        # Nothing that changes a balance can run until this is released
+        return self.hold_stripes(range(len(self.locks)))
+
+    @contextlib.asynccontextmanager
+    async def hold_stripes(self, indexes):
+        acquired = []
+        try:
+            for index in sorted(indexes):
+                lock = self.locks[index]
+                if lock.locked():
+                    self.contended[index] += 1
+                start = time.perf_counter()
+                await lock.acquire()
+                self.wait_time[index] += time.perf_counter() - start
+                self.acquisitions[index] += 1
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    def stats(self):
+        stripes = [
+            {'stripe': index, 'acquisitions': self.acquisitions[index], 'contended': self.contended[index], 'wait_time': self.wait_time[index]}
+            for index in range(len(self.locks)) if self.acquisitions[index]
+        ]
+        return {
+            'acquisitions': sum(self.acquisitions),
+            'contended': sum(self.contended),
+            'wait_time': sum(self.wait_time),
+            'stripes': sorted(stripes, key=lambda s: s['wait_time'], reverse=True),
+        }
+
+class ConnectionPool:
+    # One writer connection and a few read-only ones. Everything runs in WAL mode,
+    # so readers see the last committed state without waiting for the writer.
+    def __init__(self, db_name, readers=4):
+        self.db_name = db_name
+        self.reader_count = readers
+        self.writer = None
+        self.readers = []
+        self.idle_readers = asyncio.Queue()
+
+    async def connect(self, read_only=False):
+        db = await aiosqlite.connect(self.db_name)
+        await db.execute('PRAGMA journal_mode = WAL')
+        await db.execute('PRAGMA synchronous = NORMAL')  # WAL stays consistent, only the last commits can be lost on power failure
+        await db.execute('PRAGMA cache_size = -16000')  # 16 MB page cache per connection
+        await db.execute('PRAGMA mmap_size = 268435456')  # 256 MB
+        await db.execute('PRAGMA busy_timeout = 5000')
+        if read_only:
+            await db.execute('PRAGMA query_only = ON')
+        return db
+
+    async def open(self):
+        self.writer = await self.connect()
+        for _ in range(self.reader_count):
+            db = await self.connect(read_only=True)
+            self.readers.append(db)
+            self.idle_readers.put_nowait(db)
+
+    @contextlib.asynccontextmanager
+    async def reader(self):
+        db = await self.idle_readers.get()
+        try:
+            yield db
+        finally:
+            self.idle_readers.put_nowait(db)
+
+    async def close(self):
+        for db in self.readers:
+            await db.close()
+        self.readers = []
+        if self.writer:
+            await self.writer.close()
+            self.writer = None
+
+class RealClock:
+    # Game timing goes through a clock so tests and benchmarks can swap in VirtualClock
+    def monotonic(self):
+        return time.monotonic()
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+    async def wait(self, event, timeout=None):
+        # Waits for the event for at most timeout seconds, returns whether it was set
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return event.is_set()
+
+class VirtualClock:
+    # Time only moves when every sleeper is parked. Once the event loop has had a
+    # few passes to settle, the clock jumps straight to the earliest deadline, so
+    # a 30 second countdown costs a handful of loop iterations.
+    def __init__(self, start=0.0, settle_passes=5):
+        self.now = start
+        self.settle_passes = settle_passes
+        self.waiters = []  # Min-heap of (deadline, sequence, future)
+        self.sequence = 0
+        self.task = None
+        self.jumps = 0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        future = asyncio.get_running_loop().create_future()
+        self.sequence += 1
+        heapq.heappush(self.waiters, (self.now + max(0.0, seconds), self.sequence, future))
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        await future
+
+    async def wait(self, event, timeout=None):
+        if timeout is None:
+            await event.wait()
+            return True
+        if event.is_set():
+            return True
+        waiter = asyncio.ensure_future(event.wait())
+        sleeper = asyncio.ensure_future(self.sleep(timeout))
+        try:
+            await asyncio.wait({waiter, sleeper}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+            sleeper.cancel()
+        return event.is_set()
+
+    async def advance(self, seconds):
+        # Moves time forward by hand, waking every sleeper whose deadline passes on the way
+        target = self.now + seconds
+        while self.waiters and self.waiters[0][0] <= target:
+            self.wake_next()
+            await asyncio.sleep(0)
+        self.now = target
+
+    def wake_next(self):
+        deadline = self.waiters[0][0]
+        self.now = max(self.now, deadline)
+        self.jumps += 1
+        while self.waiters and self.waiters[0][0] <= deadline:
+            future = heapq.heappop(self.waiters)[2]
+            if not future.done():
+                future.set_result(None)
+
+    async def run(self):
+        while True:
+            for _ in range(self.settle_passes):
+                await asyncio.sleep(0)
+            # Drop sleepers that were cancelled, e.g. a wait() whose event fired first
+            while self.waiters and self.waiters[0][2].done():
+                heapq.heappop(self.waiters)
+            if not self.waiters:
+                return
+            self.wake_next()
+
+class RenderScheduler:
+    # Every live game embed is edited through here. Only the newest frame per
+    # message is kept, and edits are paced per channel and against a global
+    # budget, so a busy channel slows its own animations down instead of
+    # piling up edits behind Discord's rate limits.
+    def __init__(self, channel_interval=1.0, global_rate=10.0, global_burst=10, clock=None):
+        self.clock = clock or RealClock()
+        self.channel_interval = channel_interval
+        self.global_rate = global_rate
+        self.global_burst = global_burst
+        self.tokens = float(global_burst)
+        self.refilled_at = self.clock.monotonic()
+        self.paused_until = 0.0  # Set by a global 429
+        self.pending = {}  # message id -> (message, edit kwargs), oldest first
+        self.channel_ready_at = {}
+        self.busy_channels = set()  # Channels with an edit in flight
+        self.wakeup = asyncio.Event()
+        self.task = None
+        self.queued = 0
+        self.dropped = 0
+        self.sent = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    def submit(self, message, **kwargs):
+        # A frame that hasn't gone out yet is replaced but keeps its place in line
+        if message.id in self.pending:
+            self.dropped += 1
+        self.pending[message.id] = (message, kwargs)
+        self.queued += 1
+        self.wakeup.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def forget(self, message_id):
+        self.pending.pop(message_id, None)
+
+    def refill(self, now):
+        self.tokens = min(self.global_burst, self.tokens + (now - self.refilled_at) * self.global_rate)
+        self.refilled_at = now
+
+    def next_ready(self, now):
+        # Oldest frame whose channel can take an edit, or how long until one can
+        wait = None
+        for message_id, (message, kwargs) in self.pending.items():
+            channel_id = message.channel.id
+            if channel_id in self.busy_channels:
+                continue
+            ready_in = self.channel_ready_at.get(channel_id, 0.0) - now
+            if ready_in <= 0:
+                return message_id, None
+            wait = ready_in if wait is None else min(wait, ready_in)
+        return None, wait
+
+    async def run(self):
+        while True:
+            now = self.clock.monotonic()
+            self.refill(now)
+            wait = None
+            if self.pending:
+                if self.paused_until > now:
+                    wait = self.paused_until - now
+                elif self.tokens < 1 - 1e-9:  # Float error can leave a refilled bucket a hair short of a token
+                    wait = (1 - self.tokens) / self.global_rate
+                else:
+                    message_id, wait = self.next_ready(now)
+                    if message_id is not None:
+                        message, kwargs = self.pending.pop(message_id)
+                        self.tokens -= 1
+                        self.busy_channels.add(message.channel.id)
+                        asyncio.create_task(self.send(message, kwargs))
+                        continue
+
+            self.wakeup.clear()
+            await self.clock.wait(self.wakeup, wait)
+
+    async def send(self, message, kwargs):
+        channel_id = message.channel.id
+        backoff = 0.0
+        try:
+            await message.edit(**kwargs)
+            self.sent += 1
+        except discord.NotFound:
+            self.failed += 1
+        except discord.RateLimited as e:
+            backoff = e.retry_after
+        except discord.HTTPException as e:
+            if e.status != 429:
+                self.failed += 1
+            else:
+                backoff = float(e.response.headers.get('Retry-After', 5.0))
+                if e.response.headers.get('X-RateLimit-Global'):
+                    self.paused_until = self.clock.monotonic() + backoff
+        finally:
+            if backoff:
+                # Try again later unless a newer frame for the message came in meanwhile
+                self.rate_limited += 1
+                self.pending.setdefault(message.id, (message, kwargs))
+            self.busy_channels.discard(channel_id)
+            self.channel_ready_at[channel_id] = self.clock.monotonic() + max(self.channel_interval, backoff)
+            self.wakeup.set()
+
+    def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        self.pending.clear()
+
+    def stats(self):
+        return {
+            'pending': len(self.pending),
+            'queued': self.queued,
+            'dropped': self.dropped,
+            'sent': self.sent,
+            'failed': self.failed,
+            'rate_limited': self.rate_limited,
+        }
+
+# Outcome rules for every game, shared by the commands and the simulation package
+
+SLOT_SYMBOLS = ('🍒', '🍋', '🍊', '🍇', '🔔', '💎')
+
+def slots_winnings(result, amount):
+    if result[0] == result[1] == result[2]:
+        if result[0] == '💎':
+            return amount * 10
+        elif result[0] == '🔔':
+            return amount * 5
+        else:
+            return amount * 3
+    elif result[0] == result[1] or result[1] == result[2]:
+        return amount * 1.5
+    return 0
+
+COIN_SIDES = ('Heads', 'Tails')
+
+def gamble_delta(dice_roll, amount):
+    if dice_roll < 50:
+        return -amount
+    elif dice_roll == 50:
+        return -amount / 2
+    return amount * (dice_roll / 100)
+
+# List of possible crime outcomes and their impact on balance
+CRIME_SCENARIOS = [
+    ("You successfully robbed a bank and got away with **${:,.2f}**!", 0.5),
+    ("You managed to steal **${:,.2f}** from a wealthy businessman!", 0.4),
+    ("You pulled off a daring heist and got **${:,.2f}**!", 0.35),
+    ("You raided a jewelry store and found **${:,.2f}**!", 0.3),
+    ("You picked the lock and nabbed **${:,.2f}**!", 0.25),
+    ("You sneaked into a casino and won **${:,.2f}**!", 0.2),
+    ("You looted a rich person's house and found **${:,.2f}**!", 0.15),
+    ("You intercepted a money truck and seized **${:,.2f}**!", 0.4),
+    ("You managed a small-time robbery and got **${:,.2f}**!", 0.1),
+    ("You lifted some cash from a street vendor and ended up with **${:,.2f}**!", 0.05),
+    ("You successfully stole **${:,.2f}** from a high-end boutique!", 0.3),
+    ("You picked up **${:,.2f}** from a petty theft!", 0.1),
+    ("You swiped **${:,.2f}** from a careless wallet snatcher!", 0.2),
+    ("You jacked **${:,.2f}** from a local bank!", 0.35),
+    ("You snagged **${:,.2f}** from a gambling den!", 0.25),
+    ("You scored **${:,.2f}** from an ATM heist!", 0.4),
+    ("You nabbed **${:,.2f}** from a convenience store!", 0.1),
+    ("You pulled off a successful burglary and got **${:,.2f}**!", 0.3),
+    ("You got away with **${:,.2f}** after a quick smash-and-grab!", 0.2),
+    ("You robbed a high-roller and scored **${:,.2f}**!", 0.35),
+    ("You got **${:,.2f}** from a poker game heist!", 0.3),
+    ("You snagged **${:,.2f}** from a museum robbery!", 0.4),
+    ("You scored **${:,.2f}** from a successful shoplifting!", 0.15),
+    ("You managed to grab **${:,.2f}** from a wealthy benefactor!", 0.25),
+    ("You acquired **${:,.2f}** from a daring pickpocket!", 0.1),
+    ("You came away with **${:,.2f}** from a risky burglary!", 0.3),
+    ("You snatched **${:,.2f}** from a pawn shop!", 0.2),
+    ("You lifted **${:,.2f}** from an unsuspecting shopper!", 0.1),
+    ("You scored **${:,.2f}** from a lavish party!", 0.4),
+    ("You managed to rob a casino and got **${:,.2f}**!", 0.35),
+    ("You pulled in **${:,.2f}** from a well-planned heist!", 0.3),
+    ("You seized **${:,.2f}** from a daring safe-crack!", 0.2),
+    ("You snatched **${:,.2f}** from an elite club!", 0.15),
+    ("You robbed a rich mansion and walked away with **${:,.2f}**!", 0.4),
+    ("You grabbed **${:,.2f}** from an abandoned warehouse!", 0.25),
+    ("You scored **${:,.2f}** from a successful carjacking!", 0.1),
+    ("You netted **${:,.2f}** from a quick stick-up!", 0.35),
+    ("You successfully heisted **${:,.2f}** from a tech mogul!", 0.3),
+    ("You nabbed **${:,.2f}** from a high-stakes poker game!", 0.4),
+    ("You acquired **${:,.2f}** from an upscale mall!", 0.25),
+    ("You stole **${:,.2f}** from a big-shot entrepreneur!", 0.35),
+    ("You lifted **${:,.2f}** from a luxury apartment!", 0.3),
+    ("You seized **${:,.2f}** from a diamond store!", 0.4),
+    ("You made off with **${:,.2f}** from a quick robbery!", 0.2),
+    ("You grabbed **${:,.2f}** from a high-end restaurant!", 0.3),
+    ("You successfully pilfered **${:,.2f}** from a casino vault!", 0.35),
+    ("You snagged **${:,.2f}** from a rich celebrity!", 0.4),
+    ("You came away with **${:,.2f}** from a wealthy patron!", 0.25),
+    ("You scored **${:,.2f}** from a risky theft!", 0.3),
+    ("You nabbed **${:,.2f}** from a busy marketplace!", 0.15),
+    ("You pulled in **${:,.2f}** from a daring robbery!", 0.35),
+    ("You stole **${:,.2f}** from a high-end auction!", 0.4),
+    ("You acquired **${:,.2f}** from a quick stick-up!", 0.25),
+    ("You lifted **${:,.2f}** from a large warehouse!", 0.3),
+    ("You successfully pilfered **${:,.2f}** from a luxury yacht!", 0.35),
+    ("You managed to snag **${:,.2f}** from a major heist!", 0.4),
+    ("You scored **${:,.2f}** from a successful burglary!", 0.3),
+    ("You grabbed **${:,.2f}** from a lavish event!", 0.35),
+    ("You successfully lifted **${:,.2f}** from a rich philanthropist!", 0.4),
+    ("You were caught during the robbery and fined **${:,.2f}**!", -0.5),
+    ("You attempted a heist but got nothing and lost **${:,.2f}** in legal fees!", -0.35),
+    ("You were apprehended and lost **${:,.2f}** to the authorities!", -0.4),
+    ("You failed the crime and lost **${:,.2f}** to your accomplices!", -0.3),
+    ("You got caught and had to pay **${:,.2f}** in damages!", -0.25),
+    ("You attempted a robbery but ended up with a **${:,.2f}** fine!", -0.2),
+    ("You were unsuccessful and **${:,.2f}** was stolen from you by others!", -0.15),
+    ("You botched the crime and lost **${:,.2f}** in bribes!", -0.1),
+    ("You were caught in the act and **${:,.2f}** was confiscated!", -0.35),
+    ("Your crime failed miserably and you owe **${:,.2f}** in repairs!", -0.4),
+    ("You attempted a crime but ended up in jail, losing **${:,.2f}**!", -0.5),
+    ("Your heist was a flop and you lost **${:,.2f}** to the police!", -0.3),
+    ("You failed and had to cover **${:,.2f}** in damages!", -0.25),
+    ("You got caught trying to rob a bank and lost **${:,.2f}**!", -0.4),
+    ("Your crime was unsuccessful and you lost **${:,.2f}** to legal fees!", -0.35),
+    ("You were arrested and had to pay **${:,.2f}** in fines!", -0.3),
+    ("Your robbery failed and you had to cover **${:,.2f}** in damages!", -0.25),
+    ("You attempted a robbery and lost **${:,.2f}** to the cops!", -0.4),
+    ("Your crime went awry and you lost **${:,.2f}** in bribes!", -0.35),
+    ("You were unsuccessful and **${:,.2f}** was taken from you by rivals!", -0.3),
+    ("You got caught and had to pay **${:,.2f}** in legal costs!", -0.25),
+    ("You tried a robbery but ended up with **${:,.2f}** in fines!", -0.4),
+    ("You failed and **${:,.2f}** was seized by the authorities!", -0.3),
+    ("You were apprehended and lost **${:,.2f}** to legal issues!", -0.35),
+    ("You botched the heist and had to pay **${:,.2f}** in fines!", -0.2),
+    ("Your robbery failed and you lost **${:,.2f}** to damages!", -0.25),
+    ("You attempted a crime but had to pay **${:,.2f}** in compensation!", -0.3),
+    ("Your crime was unsuccessful and you lost **${:,.2f}** in bribes!", -0.4),
+    ("You were caught and had to pay **${:,.2f}** in legal fees!", -0.35),
+    ("You failed the robbery and lost **${:,.2f}** to the police!", -0.4),
+    ("Your heist went wrong and you lost **${:,.2f}** in damages!", -0.3),
+    ("You attempted a robbery and ended up with **${:,.2f}** in fines!", -0.25),
+]
+
+CRIME_MIN_GAIN = 50  # Minimum gain amount in dollars
+
+def crime_delta(multiplier, balance):
+    if multiplier > 0:
+        if balance == 0:
+            return CRIME_MIN_GAIN  # Ensure minimum gain if balance is 0
+        return balance * multiplier
+    elif multiplier < 0:
+        if balance == 0:
+            return 0  # No loss if balance is 0
+        return -abs(balance * multiplier)
+    return 0
+
+def crash_point(r):
+    # Use a distribution similar to some popular crash games
+    if r == 0:  # Extremely rare case to prevent division by zero
+        return 100.00
+    point = 0.99 / (1 - r)  # This creates a distribution favoring lower numbers
+    return max(1.00, round(point, 2))  # Ensure minimum of 1.00
+
+SLIDER_SYMBOLS = ('🥉', '🥈', '🥇')
+SLIDER_WEIGHTS = (0.45, 0.45, 0.10)  # Probabilities for Bronze, Silver, Gold
+SLIDER_NAMES = {'🥉': 'Bronze', '🥈': 'Silver', '🥇': 'Gold'}
+SLIDER_PAYOUTS = {'Bronze': 2, 'Silver': 2, 'Gold': 14}
+
+def slider_winnings(data, outcome):
+    # Bets are taken when the player joins, this is the amount paid back
+    return data[f'bet_{outcome.lower()}'] * SLIDER_PAYOUTS[outcome]
+
+TOWER_MULTIPLIERS = (1.2, 1.5, 1.8, 2.1, 2.5, 3, 3.5, 4, 5, 6)
+TOWER_SAFE_TILES = 2  # 2 out of 3 tiles are safe on every level
+
+def highlow_result(guess, first_number, second_number):
+    if guess == "higher" and second_number > first_number:
+        return "win"
+    elif guess == "lower" and second_number < first_number:
+        return "win"
+    elif guess == "jackpot" and second_number == first_number:
+        return "jackpot"
+    else:
+        return "lose"
+
+HIGHLOW_PROFIT = {'win': 1, 'jackpot': 9, 'lose': -1}  # Multiples of the bet
+
+BANK_INTEREST_RATE = 0.005  # Per day, compounded continuously
+LEADERBOARD_ACCRUAL_INTERVAL = 60  # Seconds between interest passes over the top pages
+LEADERBOARD_TOP = 100  # Accounts on the pages !lb opens with, the ones the interest pass covers
+LEADERBOARD_PAGE_SIZE = 10
+
+def accrue(bank, last_accrued_at, now):
+    # Bank balance after interest from last_accrued_at to now, in closed form so an
+    # account that sat untouched for a month costs the same as one touched a minute ago
+    if not bank or last_accrued_at is None or now <= last_accrued_at:
+        return bank
+    return round(bank * math.exp(BANK_INTEREST_RATE * (now - last_accrued_at) / 86400), 2)
+
+RARITIES = ("common", "rare", "epic", "legendary")
+RARITY_WEIGHTS = (60, 30, 9, 1)
+
+Case = collections.namedtuple('Case', 'case_id name price color items table')
+
+class AliasTable:
+    # Walker's alias method: after an O(n) build, every draw is one random index
+    # and one coin flip no matter how many outcomes there are.
+    def __init__(self, weights):
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        prob = [1.0] * count
+        alias = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        self.prob = tuple(prob)
+        self.alias = tuple(alias)
+
+    def draw(self, rng=random):
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+class CaseCatalog(collections.abc.Mapping):
+    # Read-only case catalog compiled once per process and shared by both cogs.
+    # Each case's items are flattened into (name, value, rarity) tuples with one
+    # alias table over rarity weight / items in that rarity.
+    def __init__(self, definitions):
+        cases = {}
+        for case_id, case in definitions.items():
+            items = []
+            weights = []
+            for rarity, rarity_weight in zip(RARITIES, RARITY_WEIGHTS):
+                pool = case["items"][rarity]
+                for item_name, item_value in pool:
+                    items.append((sys.intern(item_name), item_value, sys.intern(rarity)))
+                    weights.append(rarity_weight / len(pool))
+            case_id = sys.intern(case_id)
+            cases[case_id] = Case(case_id, sys.intern(case["name"]), case["price"], case["color"], tuple(items), AliasTable(weights))
+        self.cases = types.MappingProxyType(cases)
+
+    def __getitem__(self, case_id):
+        return self.cases[case_id]
+
+    def __iter__(self):
+        return iter(self.cases)
+
+    def __len__(self):
+        return len(self.cases)
+
+    def open(self, case_id, rng=random):
+        case = self.cases[case_id]
+        return case.items[case.table.draw(rng)]
+
+    def sample(self, case_id, n, rng=random):
+        case = self.cases[case_id]
+        draw = case.table.draw
+        return [case.items[draw(rng)] for _ in range(n)]
+
+    def roll_battle(self, selected_cases, teams, rng=random):
+        # Every pull of a battle up front, one round per case opened by all players
+        players = [(team_num, player) for team_num, team in teams.items() for player in team]
+        team_totals = {1: 0, 2: 0}
+        player_totals = {player: 0 for team_num, player in players}
+        rounds = []
+        for case_type, amount in selected_cases.items():
+            for _ in range(amount):
+                pulls = []
+                for (team_num, player), (item_name, item_value, rarity) in zip(players, self.sample(case_type, len(players), rng)):
+                    player_totals[player] += item_value
+                    team_totals[team_num] += item_value
+                    pulls.append((team_num, player, item_name, item_value, rarity))
+                rounds.append((case_type, pulls))
+        return rounds, team_totals, player_totals
+
+class BattleReveal:
+    # Presentation of a battle that has already been rolled and paid out. Each
+    # frame reveals one round as a single field, and only the last few rounds stay
+    # on the embed so the result fields always fit under Discord's 25 field cap.
+    def __init__(self, embed, catalog, rounds, status_index, status_name, reserved_fields, window=5, delay=2.0):
+        self.embed = embed
+        self.catalog = catalog
+        self.rounds = rounds
+        self.status_index = status_index
+        self.status_name = status_name
+        self.base_fields = len(embed.fields)
+        self.window = max(1, min(window, 25 - self.base_fields - reserved_fields))
+        self.delay = delay
+
+    def frames(self):
+        team_totals = {1: 0, 2: 0}
+        shown = 0
+        for number, (case_type, pulls) in enumerate(self.rounds, 1):
+            lines = []
+            for team_num, player, item_name, item_value, rarity in pulls:
+                team_totals[team_num] += item_value
+                lines.append(f"{player}: {item_name} (${item_value:,})")
+
+            progress = "Battle Progress:\n"
+            for t_num, t_total in team_totals.items():
+                progress += f"Team {t_num}: ${t_total:,}\n"
+            progress += f"Round {number}/{len(self.rounds)}"
+            self.embed.set_field_at(self.status_index, name=self.status_name, value=progress, inline=False)
+
+            if shown == self.window:
+                self.embed.remove_field(self.base_fields)
+                shown -= 1
+            self.embed.add_field(name=f"Round {number}: {self.catalog[case_type].name} Case", value="\n".join(lines), inline=False)
+            shown += 1
+            yield self.embed
+
+    def finish(self, total_bet, team_totals, player_totals):
+        # Determine winner
+        if team_totals[1] > team_totals[2]:
+            result = f"Team 1 wins ${total_bet:,}!"
+        elif team_totals[1] < team_totals[2]:
+            result = f"Team 2 wins ${total_bet:,}!"
+        else:
+            result = "It's a tie! Bets are returned."
+
+        self.embed.add_field(name="Result", value=result, inline=False)
+
+        # Show individual player totals
+        player_results = "Player Totals:\n"
+        for player, total in player_totals.items():
+            player_results += f"{player}: ${total:,}\n"
+        self.embed.add_field(name="Player Totals", value=player_results, inline=False)
+        return self.embed
+
+def case_definitions():
+    return {
+        "starter_spark": {
+            "name": "Starter Spark",
+            "price": 500,
+            "color": 0x1abc9c,
+            "items": {
+                "common": [("Rusty Combat Knife", 75), ("Worn Tactical Vest", 75)],
+                "rare": [("Custom Engraved Pistol", 200), ("Enhanced Night Vision Goggles", 200)],
+                "epic": [("Stealth Recon Outfit", 500), ("Dragonfire Grenade", 500)],
+                "legendary": [("Phoenix Revolver", 1200), ("Spectral Cloak", 1200)]
+            }
+        },
+        "novice_nest": {
+            "name": "Novice Nest",
+            "price": 1000,
+            "color": 0x3498db,
+            "items": {
+                "common": [("Basic Survival Gear", 100), ("Entry-Level Drone", 100)],
+                "rare": [("Advanced Sniper Rifle", 300), ("Deployable Shield", 300)],
+                "epic": [("Titanium Combat Armor", 750), ("Quantum Stealth Module", 750)],
+                "legendary": [("Nebula Assault Rifle", 1800), ("Hyperion Battle Suit", 1800)]
+            }
+        },
+        "wanderers_way": {
+            "name": "Wanderer's Way",
+            "price": 1500,
+            "color": 0x9b59b6,
+            "items": {
+                "common": [("Standard Issue Handgun", 150), ("Utility Belt", 150)],
+                "rare": [("Exotic Survival Knife", 400), ("Adaptive Camouflage", 400)],
+                "epic": [("Mark II Combat Drone", 900), ("Phantom Suppressor", 900)],
+                "legendary": [("Aurora Energy Blaster", 2200), ("Eclipse Power Armor", 2200)]
+            }
+        },
+        "common_cache": {
+            "name": "Common Cache",
+            "price": 2000,
+            "color": 0xe74c3c,
+            "items": {
+                "common": [("Basic Survival Kit", 200), ("Entry-Level Gadget", 200)],
+                "rare": [("Advanced Utility Belt", 500), ("Compact Drone", 500)],
+                "epic": [("Nano-Tech Armor", 1200), ("High-Performance Backpack", 1200)],
+                "legendary": [("Omni-Tool Kit", 3000), ("Elite Tactical Gear", 3000)]
+            }
+        },
+        "cosmic_chest": {
+            "name": "Cosmic Chest",
+            "price": 3000,
+            "color": 0xf39c12,
+            "items": {
+                "common": [("Starlight Pendant", 100), ("Galactic Bookmark", 100)],
+                "rare": [("Celestial Map", 300), ("Lunar Lantern", 300)],
+                "epic": [("Nebula Crystal", 700), ("Astral Telescope", 700)],
+                "legendary": [("Quantum Starship Model", 1600), ("Galactic Voyage Diary", 1600)]
+            }
+        },
+        "mystic_box": {
+            "name": "Mystic Box",
+            "price": 3500,
+            "color": 0x8e44ad,
+            "items": {
+                "common": [("Enchanted Journal", 150), ("Runic Keychain", 150)],
+                "rare": [("Ancient Rune Stones", 400), ("Mystic Potion Set", 400)],
+                "epic": [("Wizards' Staff Replica", 900), ("Sorcerer's Amulet", 900)],
+                "legendary": [("Arcane Grimoire", 2100), ("Dragon's Heart Crystal", 2100)]
+            }
+        },
+        "futuristic_fortune": {
+            "name": "Futuristic Fortune",
+            "price": 4000,
+            "color": 0x3498db,
+            "items": {
+                "common": [("Holo-Glasses", 200), ("Neon Keycard", 200)],
+                "rare": [("Techno Wristband", 500), ("Digital Pet", 500)],
+                "epic": [("Virtual Reality Headset", 1100), ("Holographic Projector", 1100)],
+                "legendary": [("Anti-Gravity Boots", 2500), ("Cybernetic Companion Drone", 2500)]
+            }
+        },
+        "fantasy_bundle": {
+            "name": "Fantasy Bundle",
+            "price": 4500,
+            "color": 0xe74c3c,
+            "items": {
+                "common": [("Magic Wand Trinket", 125), ("Fairy Dust Pouch", 125)],
+                "rare": [("Enchanted Necklace", 350), ("Dragon Scale Brooch", 350)],
+                "epic": [("Unicorn Figurine", 800), ("Phoenix Feather Quill", 800)],
+                "legendary": [("Wizard's Cloak", 1900), ("Griffin's Talon", 1900)]
+            }
+        },
+        "retro_vault": {
+            "name": "Retro Vault",
+            "price": 5000,
+            "color": 0xf1c40f,
+            "items": {
+                "common": [("Vintage Cassette Tape", 180), ("Retro Game Console Keychain", 180)],
+                "rare": [("Classic Arcade Token Set", 450), ("Old School Action Figure", 450)],
+                "epic": [("Retro Game Cartridge Collection", 1000), ("Vintage Comic Book Collection", 1000)],
+                "legendary": [("Limited Edition Vinyl Record", 2300), ("Retro Gaming Cabinet Model", 2300)]
+            }
+        },
+        "mythic_cache": {
+            "name": "Mythic Cache",
+            "price": 6000,
+            "color": 0x2ecc71,
+            "items": {
+                "common": [("Legendary Coin", 200), ("Mystic Amulet", 200)],
+                "rare": [("Ancient Artifact", 500), ("Celestial Pendant", 500)],
+                "epic": [("Elder Relic", 1100), ("Mythic Tome", 1100)],
+                "legendary": [("Godly Crown", 2500), ("Epic Orb of Power", 2500)]
+            }
+        },
+        "celestial_cache": {
+            "name": "Celestial Cache",
+            "price": 7000,
+            "color": 0x34495e,
+            "items": {
+                "common": [("Nebula Gem", 250), ("Galactic Scroll", 250)],
+                "rare": [("Solar Flare Pendant", 600), ("Cosmic Ring", 600)],
+                "epic": [("Stellar Map", 1400), ("Astral Compass", 1400)],
+                "legendary": [("Interstellar Telescope", 3200), ("Celestial Artifact", 3200)]
+            }
+        },
+        "arcane_arsenal": {
+            "name": "Arcane Arsenal",
+            "price": 8000,
+            "color": 0x9b59b6,
+            "items": {
+                "common": [("Enchanted Mirror", 300), ("Mystic Bracelet", 300)],
+                "rare": [("Arcane Scroll", 750), ("Wizard's Wand", 750)],
+                "epic": [("Sorcerer's Tome", 1700), ("Magical Crystal Ball", 1700)],
+                "legendary": [("Ancient Grimoire", 4000), ("Dragon's Breath Amulet", 4000)]
+            }
+        },
+        "cosmic_conundrum": {
+            "name": "Cosmic Conundrum",
+            "price": 9000,
+            "color": 0x1abc9c,
+            "items": {
+                "common": [("Stardust Pendant", 350), ("Galactic Charm", 350)],
+                "rare": [("Lunar Orb", 800), ("Astral Beacon", 800)],
+                "epic": [("Cosmic Map", 1800), ("Nebula Compass", 1800)],
+                "legendary": [("Quantum Starship", 4200), ("Galactic Relic", 4200)]
+            }
+        },
+        "astral_attic": {
+            "name": "Astral Attic",
+            "price": 10000,
+            "color": 0xe67e22,
+            "items": {
+                "common": [("Meteorite Fragment", 400), ("Stellar Bookmark", 400)],
+                "rare": [("Solar Prism", 900), ("Lunar Artifact", 900)],
+                "epic": [("Nebula Sphere", 2000), ("Galactic Navigator", 2000)],
+                "legendary": [("Interstellar Capsule", 5000), ("Cosmic Archive", 5000)]
+            }
+        },
+        "infinity_insight": {
+            "name": "Infinity Insight",
+            "price": 11000,
+            "color": 0x3498db,
+            "items": {
+                "common": [("Holo-Projector", 450), ("Galactic Token", 450)],
+                "rare": [("Quantum Shard", 1000), ("Celestial Compass", 1000)],
+                "epic": [("Stellar Map", 2200), ("Astral Telescope", 2200)],
+                "legendary": [("Cosmic Relic", 5500), ("Galactic Navigator", 5500)]
+            }
+        },
+        "transcendent_treasure": {
+            "name": "Transcendent Treasure",
+            "price": 12000,
+            "color": 0xf1c40f,
+            "items": {
+                "common": [("Cosmic Chip", 500), ("Stellar Key", 500)],
+                "rare": [("Astral Gem", 1100), ("Nebula Pendant", 1100)],
+                "epic": [("Galactic Atlas", 2500), ("Quantum Cube", 2500)],
+                "legendary": [("Celestial Sphere", 6000), ("Ethereal Relic", 6000)]
+            }
+        },
+        "quantum_quiver": {
+            "name": "Quantum Quiver",
+            "price": 13000,
+            "color": 0xe74c3c,
+            "items": {
+                "common": [("Lunar Coin", 550), ("Stellar Badge", 550)],
+                "rare": [("Cosmic Lantern", 1200), ("Nebula Map", 1200)],
+                "epic": [("Galactic Telescope", 2800), ("Astral Projector", 2800)],
+                "legendary": [("Interstellar Engine", 6500), ("Quantum Relic", 6500)]
+            }
+        },
+        "omniversal_orb": {
+            "name": "Omniversal Orb",
+            "price": 14000,
+            "color": 0x2ecc71,
+            "items": {
+                "common": [("Galactic Fragment", 600), ("Stellar Token", 600)],
+                "rare": [("Astral Compass", 1300), ("Celestial Beacon", 1300)],
+                "epic": [("Nebula Telescope", 3000), ("Cosmic Sphere", 3000)],
+                "legendary": [("Quantum Nexus", 7000), ("Interstellar Artifact", 7000)]
+            }
+        }
+    }
+
+CASE_CATALOG = CaseCatalog(case_definitions())
+
+class BotSelectionModal(discord.ui.Modal):
+    def __init__(self):
+        super().__init__(title="Select Bot Battle Mode")
+        self.bot_mode = None
+        self.add_item(discord.ui.TextInput(
+            label="Bot Battle Mode",
+            placeholder="Enter 1v1, 2v2, 3v3, or 4v4",
+            required=True,
+            max_length=3
+        ))
+
+    async def on_submit(self, interaction: discord.Interaction):
+        self.bot_mode = self.children[0].value
+        if self.bot_mode not in ['1v1', '2v2', '3v3', '4v4']:
+            await interaction.response.send_message("Invalid mode. Please choose 1v1, 2v2, 3v3, or 4v4.", ephemeral=True)
+        else:
+            await interaction.response.defer()
+
+class CaseBattleView(discord.ui.View):
+    def __init__(self, ctx, host, cog, case_data):  
+        super().__init__(timeout=300) 
+        self.ctx = ctx  # Store the context
+        self.host = host
+        self.cog = cog
+        self.players = [host]
+        self.case_data = case_data
+
+    @discord.ui.button(label="Select Cases", style=discord.ButtonStyle.primary)
+    async def select_cases(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user != self.host:
+            await interaction.response.send_message("Only the host can select cases!", ephemeral=True)
+            return
+
+        modal = CaseSelectionModal(self.case_data)
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        
+        if modal.selected_cases:
+            potential_total_bet = sum(
+                self.case_data[case].price * amount 
+                for case, amount in modal.selected_cases.items()
+            )
+            
+            # Check if host has enough balance before updating selected cases
+            if not await self.cog.check_balance(self.host, potential_total_bet):
+                await interaction.followup.send("You don't have enough balance to select these cases!", ephemeral=True)
+            else:
+                self.selected_cases.update(modal.selected_cases)
+                self.total_bet = potential_total_bet
+                await interaction.followup.send(f"Added cases to your selection. Total bet: ${self.total_bet:,}", ephemeral=True)
+                await self.update_message(interaction)
+
+
+
+        
+        if modal.selected_cases:
+            self.selected_cases.update(modal.selected_cases)
+            self.total_bet = self.calculate_total_bet()
+            
+            # Check if host has enough balance
+            if not await self.economy_cog.check_balance(self.host, self.total_bet):
+                await interaction.followup.send("You don't have enough balance to start this battle!", ephemeral=True)
+                self.selected_cases = {}
+                self.total_bet = 0
+            else:
+                await self.update_message(interaction)
+
+    @discord.ui.button(label="Bot Battle", style=discord.ButtonStyle.blurple)
+    async def bot_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user != self.host:
+            await interaction.response.send_message("Only the host can start a bot battle!", ephemeral=True)
+        elif len(self.players) > 1:
+            await interaction.response.send_message("Can't switch to bot battle after players have joined!", ephemeral=True)
+        else:
+            modal = BotSelectionModal()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            
+            if modal.bot_mode:
+                self.is_bot_battle = True
+                self.bot_mode = modal.bot_mode
+                num_bots = int(self.bot_mode[0]) - 1  # Number of bots on the host's team
+                self.teams = {
+                    1: [self.host] + [self.economy_cog.generate_bot_name() for _ in range(num_bots)],
+                    2: [self.economy_cog.generate_bot_name() for _ in range(int(self.bot_mode[0]))]
+                }
+                await self.update_message(interaction)
+
+    @discord.ui.button(label="Join Battle", style=discord.ButtonStyle.green)
+    async def join_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.is_bot_battle:
+            await interaction.response.send_message("This is a bot battle. Players can't join.", ephemeral=True)
+        elif not self.selected_cases:
+            await interaction.response.send_message("The host hasn't selected cases yet!", ephemeral=True)
+        elif interaction.user in self.players:
+            await interaction.response.send_message("You've already joined this battle!", ephemeral=True)
+        elif len(self.players) >= 8:
+            await interaction.response.send_message("This battle is already full!", ephemeral=True)
+        else:
+            # Check if joining player has enough balance
+            if not await self.economy_cog.check_balance(interaction.user, self.total_bet):
+                await interaction.response.send_message("You don't have enough balance to join this battle!", ephemeral=True)
+                return
+
+            self.players.append(interaction.user)
+            if len(self.teams[1]) <= len(self.teams[2]):
+                self.teams[1].append(interaction.user)
+            else:
+                self.teams[2].append(interaction.user)
+            await interaction.response.send_message(f"You've joined the battle on Team {1 if interaction.user in self.teams[1] else 2}!", ephemeral=True)
+            await self.update_message(interaction)
+
+    @discord.ui.button(label="Start Battle", style=discord.ButtonStyle.danger)
+    async def start_battle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user != self.host:
+            await interaction.response.send_message("Only the host can start the battle!", ephemeral=True)
+        elif not self.selected_cases:
+            await interaction.response.send_message("You need to select cases first!", ephemeral=True)
+        elif not self.is_bot_battle and len(self.players) < 2:
+            await interaction.response.send_message("You need at least 2 players to start the battle!", ephemeral=True)
+        else:
+            await interaction.response.send_message("Starting the battle!", ephemeral=True)
+            self.stop()
+
+    def calculate_total_bet(self):
+        return sum(self.case_data[case].price * amount 
+                   for case, amount in self.selected_cases.items())
+
+    async def update_message(self, interaction):
+        embed = discord.Embed(title="Case Battle", color=discord.Color.gold())
+        embed.add_field(name="Host", value=self.host.mention, inline=False)
+        
+        cases_field = "Selected Cases:\n" + "\n".join(f"{self.case_data[case].name}: {amount}" 
+                                                      for case, amount in self.selected_cases.items())
+        embed.add_field(name="Cases", value=cases_field, inline=False)
+        
+        embed.add_field(name="Total Bet", value=f"${self.total_bet:,}", inline=False)
+        
+        players_field = "Players:\n"
+        for team_num, team in self.teams.items():
+            players_field += f"Team {team_num}: {', '.join(str(player) for player in team)}\n"
+        embed.add_field(name="Players", value=players_field, inline=False)
+        
+        if self.is_bot_battle:
+            embed.add_field(name="Mode", value=f"Bot Battle ({self.bot_mode})", inline=False)
+        else:
+            embed.add_field(name="Mode", value="Player Battle", inline=False)
+        
+        embed.add_field(name="Status", value="Waiting for case selection and players...", inline=False)
+        
+        await interaction.message.edit(embed=embed)
+
+class CaseSelectionModal(discord.ui.Modal, title="Select Cases"):
+    def __init__(self, case_data):
+        super().__init__()
+        self.case_data = case_data
+        self.selected_cases = {}
+
+        self.case_select = discord.ui.TextInput(
+            label="Case Name",
+            placeholder="Enter the name of the case",
+            required=True
+        )
+        self.add_item(self.case_select)
+
+        self.quantity_input = discord.ui.TextInput(
+            label="Quantity",
+            placeholder="Enter a number between 1 and 5",
+            min_length=1,
+            max_length=1,
+            required=True
+        )
+        self.add_item(self.quantity_input)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        selected_case = self.case_select.value.lower()
+        try:
+            quantity = int(self.quantity_input.value)
+            if selected_case not in self.case_data:
+                await interaction.response.send_message("Invalid case name. Please try again.", ephemeral=True)
+                return
+
+            if 1 <= quantity <= 5:
+                if selected_case in self.selected_cases:
+                    self.selected_cases[selected_case] += quantity
+                else:
+                    self.selected_cases[selected_case] = quantity
+                
+                total_cases = sum(self.selected_cases.values())
+                if total_cases > 10:
+                    self.selected_cases[selected_case] -= quantity
+                    await interaction.response.send_message("You can't select more than 10 cases in total.", ephemeral=True)
+                else:
+                    await interaction.response.defer()
+            else:
+                await interaction.response.send_message("Please enter a quantity between 1 and 5.", ephemeral=True)
+        except ValueError:
+            await interaction.response.send_message("Please enter a valid number for the quantity.", ephemeral=True)
+
+
+
+class CaseBattle(commands.Cog):
+    def __init__(self, bot, clock=None):
+        self.bot = bot
+        self.clock = clock or RealClock()
+        self.case_data = CASE_CATALOG
+
+    async def run_battle(self, ctx, battle_message, selected_cases, total_bet, teams, is_bot_battle):
+        embed = battle_message.embeds[0]
+        status_index = len(embed.fields) - 1
+        embed.set_field_at(status_index, name="Battle Progress", value="Opening cases...", inline=False)
+        await self.render(battle_message, embed=embed)
+
+        # Roll and pay out the whole battle before the reveal starts.
+        # Payouts go through the Economy cog so they land in the same balances as !bal
+        rounds, team_totals, player_totals = self.case_data.roll_battle(selected_cases, teams)
+        economy_cog = self.bot.get_cog('Economy')
+        balances = None
+        if economy_cog:
+            balances = await economy_cog.settle_battle(teams, team_totals, total_bet, battle_message.id)
+            await economy_cog.record_battle(battle_message, selected_cases, teams, rounds, team_totals, total_bet)
+
+        humans = sum(1 for team in teams.values() for player in team if not isinstance(player, str))
+        reveal = BattleReveal(embed, self.case_data, rounds, status_index, "Battle Progress", reserved_fields=2 + humans)
+        for frame in reveal.frames():
+            await self.render(battle_message, embed=frame)
+            await self.clock.sleep(reveal.delay)  # Add some delay for suspense
+
+        reveal.finish(total_bet, team_totals, player_totals)
+        if balances is not None:
+            economy_cog.add_battle_balances(embed, teams, balances)
+
+        await self.render(battle_message, embed=embed)
+
+    async def render(self, message, **kwargs):
+        # Share the Economy cog's edit budget when it's loaded
+        economy_cog = self.bot.get_cog('Economy')
+        if economy_cog:
+            economy_cog.renderer.submit(message, **kwargs)
+        else:
+            await message.edit(**kwargs)
+
+
+class GameTicker:
+    # A single task advances every live Slider/Crash round. Ticks land on a fixed
+    # grid so a slow pass doesn't push every later tick back, and the task exits
+    # when the last game leaves.
+    def __init__(self, interval=0.1, clock=None):
+        self.interval = interval
+        self.clock = clock or RealClock()
+        self.games = {}  # Insertion ordered, games tick in the order they started
+        self.task = None
+        self.ticks = 0
+        self.tick_time = 0.0
+        self.max_tick_time = 0.0
+
+    def add(self, game):
+        self.games[game] = None
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def remove(self, game):
+        self.games.pop(game, None)
+
+    async def run(self):
+        next_tick = self.clock.monotonic()
+        while self.games:
+            next_tick += self.interval
+            now = self.clock.monotonic()
+            if next_tick < now:
+                next_tick = now  # Fell behind, skip the missed ticks instead of bursting through them
+            await self.clock.sleep(next_tick - now)
+
+            now = self.clock.monotonic()
+            started = time.perf_counter()
+            for game in list(self.games):
+                try:
+                    running = game.tick(now)
+                except Exception:
+                    log.exception("Game tick failed")
+                    game.failed = True
+                    game.finished.set()
+                    running = False
+                if not running:
+                    self.remove(game)
+            elapsed = time.perf_counter() - started
+            self.ticks += 1
+            self.tick_time += elapsed
+            self.max_tick_time = max(self.max_tick_time, elapsed)
+
+    def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for game in self.games:
+            game.finished.set()
+        self.games.clear()
+
+    def stats(self):
+        return {
+            'games': len(self.games),
+            'ticks': self.ticks,
+            'avg_tick_time': self.tick_time / self.ticks if self.ticks else 0.0,
+            'max_tick_time': self.max_tick_time,
+        }
+
+class LiveGame(View):
+    # Shared rendering for the multiplayer games. Player fields are rebuilt only
+    # when the state they show changes, and a frame identical to the last one
+    # never reaches the render scheduler.
+    def __init__(self, ctx, economy_cog):
+        super().__init__(timeout=None)
+        self.ctx = ctx
+        self.economy_cog = economy_cog
+        self.message = None
+        self.display_names = {}
+        self.player_fields = {}  # player_id -> (state key, field name, field value)
+        self.last_frame = None
+        self.game_ended = False
+        self.countdown_ends = None
+        self.finished = asyncio.Event()
+        self.failed = False  # Set by the ticker when a tick raised
+
+    async def run_game(self):
+        self.message = await self.ctx.send(embed=self.create_embed())
+        self.economy_cog.active_games[self.message.id] = self
+        self.countdown_ends = self.economy_cog.clock.monotonic() + self.countdown
+        self.economy_cog.ticker.add(self)
+        await self.finished.wait()
+
+        deleted = self.game_ended  # Bets were already refunded by message_deleted
+        await self.end_game()
+        if self.failed and not deleted:
+            # The round can't be played out, so whatever it settled stands and
+            # every bet still held goes back instead of being lost
+            await self.finish_round(True)
+            await self.reimburse_players()
+            return
+        await self.finish_round(deleted)
+
+    def tick(self, now):
+        # Driven by Economy.ticker, returns False once the round needs no more ticks
+        if self.game_ended:
+            self.finished.set()
+            return False
+        if self.countdown_ends is not None:
+            if now < self.countdown_ends:
+                countdown = math.ceil(self.countdown_ends - now)
+                if countdown != self.countdown:
+                    self.countdown = countdown
+                    self.render()
+                return True
+            self.countdown_ends = None
+            self.start_round(now)
+        if not self.advance(now):
+            self.finished.set()
+            return False
+        return True
+
+    async def end_game(self):
+        self.game_ended = True
+        if self.message:
+            self.economy_cog.active_games.pop(self.message.id, None)
+
+    async def message_deleted(self):
+        # Called by the Economy cog's delete listeners while the round is still live
+        if self.game_ended:
+            return
+        self.game_ended = True
+        self.economy_cog.renderer.forget(self.message.id)
+        self.message = None
+        await self.reimburse_players()
+
+    async def send_refund_notices(self, refunds, game_name):
+        for player_id, bet in refunds:
+            player = self.ctx.guild.get_member(player_id)
+            if player:
+                try:
+                    await player.send(f"The {game_name} game was unexpectedly ended. Your bet of ${bet:.2f} has been reimbursed.")
+                except discord.HTTPException:
+                    pass
+
+    def display_name(self, player_id):
+        if player_id not in self.display_names:
+            player = self.ctx.guild.get_member(player_id)
+            self.display_names[player_id] = player.display_name if player else str(player_id)
+        return self.display_names[player_id]
+
+    def player_field(self, player_id, key, build):
+        cached = self.player_fields.get(player_id)
+        if cached is None or cached[0] != key:
+            cached = (key, self.display_name(player_id), build())
+            self.player_fields[player_id] = cached
+        return cached[1], cached[2]
+
+    async def update_message(self):
+        self.render()
+
+    def render(self):
+        if not self.message:
+            return
+        embed = self.create_embed()
+        frame = embed.to_dict()
+        if frame == self.last_frame:
+            return
+        self.last_frame = frame
+        self.economy_cog.renderer.submit(self.message, embed=embed, view=self)
+
+class SliderFrames:
+    # Animation strips for the Slider game, rendered once when the cog loads. A
+    # round only picks frame indices, and the final strip is a precomputed left
+    # and right half spliced around the winning symbol.
+    def __init__(self, symbols, weights, size=256, width=9):
+        half = width // 2
+        self.pointer = "🟦" * half + "⬆️" + "🟦" * half
+        self.frames = [self.strip(''.join(random.choices(symbols, weights, k=width))) for _ in range(size)]
+        self.lefts = [''.join(random.choices(symbols, weights, k=half)) for _ in range(size)]
+        self.rights = [''.join(random.choices(symbols, weights, k=half)) for _ in range(size)]
+
+    def strip(self, row):
+        return f"{row}\n{self.pointer}"
+
+    def sequence(self, count):
+        return random.sample(range(len(self.frames)), count)
+
+    def final(self, symbol):
+        return self.strip(f"{random.choice(self.lefts)}{symbol}{random.choice(self.rights)}")
+
+class SliderGame(LiveGame):
+    def __init__(self, ctx, economy_cog):
+        super().__init__(ctx, economy_cog)
+        self.players = {}
+        self.countdown = 30
+        self.max_players = 10
+        self.game_started = False
+        self.result = None
+        self.start_time = None
+        self.result_dict = SLIDER_NAMES
+        self.result_animation = ''
+        self.symbols = SLIDER_SYMBOLS
+        self.weights = SLIDER_WEIGHTS
+        self.winning_symbol = None
+        self.outcome = None  # Known and settled at the start of the round, shown as self.result at the end
+        self.settle_task = None
+        self.animation_started = None
+        self.animation_frames = []
+        self.animation_frame = -1
+        self.frame_interval = 0.5  # Adjust speed of animation
+        self.frame_count = 20  # Number of animation frames
+
+        # Setup buttons
+        self.add_item(Button(label="Join Game", style=discord.ButtonStyle.blurple, custom_id="join"))
+
+    def start_round(self, now):
+        self.game_started = True
+        self.start_time = discord.utils.utcnow()
+        self.winning_symbol = random.choices(self.symbols, weights=self.weights)[0]
+        self.outcome = self.result_dict[self.winning_symbol]
+        self.animation_started = now
+        self.animation_frames = self.economy_cog.slider_frames.sequence(self.frame_count)
+        # Settle right away, the animation is only presentation
+        self.settle_task = asyncio.create_task(self.process_bets())
+
+    def advance(self, now):
+        frame = int((now - self.animation_started) / self.frame_interval)
+        if frame < self.frame_count:
+            # Create sliding animation
+            if frame != self.animation_frame:
+                self.animation_frame = frame
+                self.result_animation = self.economy_cog.slider_frames.frames[self.animation_frames[frame]]
+                self.render()
+            return True
+
+        # Final result, the winning symbol goes in the middle
+        self.result_animation = self.economy_cog.slider_frames.final(self.winning_symbol)
+        self.result = self.outcome
+        self.render()
+        return False
+
+    async def finish_round(self, deleted):
+        if self.settle_task:
+            await self.settle_task
+        if deleted:
+            return
+        await self.update_message()
+
+    async def process_bets(self):
+        payouts = {}
+        for player_id, data in self.players.items():
+            winnings = slider_winnings(data, self.outcome)
+
+            total_bet = data['bet_bronze'] + data['bet_silver'] + data['bet_gold']
+            profit = winnings - total_bet
+            data['winnings'] = winnings
+            data['profit'] = profit
+            payouts[data['hold']] = winnings  # Pays winnings, not profit, the bets are already held
+
+        await self.economy_cog.capture_many(payouts)
+
+    def create_embed(self):
+        if not self.game_started:
+            title = "🎰 Slider Game Starting Soon"
+            color = discord.Color.blue()
+            description = f"```\nGame starts in {self.countdown} seconds\nPlayers: {len(self.players)}/{self.max_players}\n```"
+        elif self.result is None:
+            title = "🎰 Slider Game in Progress"
+            color = discord.Color.gold()
+            description = f"```\n{self.result_animation}\n```"
+        else:
+            title = f"🎰 Slider Game Result: {self.result}"
+            color = discord.Color.green()
+            description = f"```\n{self.result_animation}\n```"
+
+        embed = discord.Embed(title=title, description=description, color=color)
+
+
+        for player_id, data in self.players.items():
+            key = (data['bet_bronze'], data['bet_silver'], data['bet_gold'], self.result, data.get('profit'))
+            name, value = self.player_field(player_id, key, lambda: self.player_value(data))
+            embed.add_field(name=name, value=value, inline=False)
+
+        return embed
+
+    def player_value(self, data):
+        total_bet = data['bet_bronze'] + data['bet_silver'] + data['bet_gold']
+        bet_colors = []
+        if data['bet_bronze'] > 0: bet_colors.append(f"Bronze **({data['bet_bronze']:.2f})**")
+        if data['bet_silver'] > 0: bet_colors.append(f"Silver **({data['bet_silver']:.2f})**")
+        if data['bet_gold'] > 0: bet_colors.append(f"Gold **({data['bet_gold']:.2f})**")
+        
+        bet_str = f"**Bet:** ${total_bet:.2f}"
+        colors_str = f"**Colors:** {', '.join(bet_colors)}"
+        
+        if self.result is None:
+            status_str = "**Status:** In game"
+            profit_str = ""
+        else:
+            won_colors = [color.split()[0] for color in bet_colors if color.split()[0] == self.result]
+            lost_colors = [color.split()[0] for color in bet_colors if color.split()[0] != self.result]
+            status_parts = []
+            if won_colors:
+                status_parts.append(f"Won: {', '.join(won_colors)}")
+            if lost_colors:
+                status_parts.append(f"Lost: {', '.join(lost_colors)}")
+            status_str = f"**Status:** {', '.join(status_parts)}"
+            profit_str = f"**Profit:** ${data.get('profit', 0):.2f}"
+
+        return f"{bet_str}\n{colors_str}\n{status_str}\n{profit_str}"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.data["custom_id"] == "join":
+            await self.join_game(interaction)
+        return True
+
+    async def join_game(self, interaction: discord.Interaction):
+        if self.game_started:
+            await interaction.response.send_message("The game has already started!", ephemeral=True)
+            return
+        if self.result is not None:
+            await interaction.response.send_message("The game has already ended!", ephemeral=True)
+            return
+        if len(self.players) >= self.max_players:
+            await interaction.response.send_message("The game is full! Please wait for the next round.", ephemeral=True)
+            return
+        modal = SliderJoinModal(self, interaction.user.id)
+        await interaction.response.send_modal(modal)
+
+    async def reimburse_players(self):
+        if self.settle_task:  # The round was already settled when it started
+            return
+        refunds = [(player_id, data['bet_bronze'] + data['bet_silver'] + data['bet_gold']) for player_id, data in self.players.items()]
+        await self.economy_cog.release_many([data['hold'] for data in self.players.values()])
+        await self.send_refund_notices(refunds, "Slider")
+
+class SliderJoinModal(Modal):
+    def __init__(self, game, player_id):
+        super().__init__(title="Join Slider Game")
+        self.game = game
+        self.player_id = player_id
+
+        self.add_item(TextInput(label="Bet on Bronze (🥉)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
+        self.add_item(TextInput(label="Bet on Silver (🥈)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
+        self.add_item(TextInput(label="Bet on Gold (🥇)", placeholder="Enter amount, 'quarter', 'half', 'all' or leave empty", style=discord.TextStyle.short, required=False))
+
+    async def on_submit(self, interaction: discord.Interaction):
+        user_data = await self.game.economy_cog.get_user_data(self.player_id)
+        current_balance = user_data['balance']
+
+        bets = {}
+        total_bet = 0
+        special_bets = []
+
+        for item in self.children:
+            bet_input = item.value.lower() if item.value else ''
+            color = item.label.split()[2].lower()
+            if bet_input:
+                if bet_input in ['quarter', 'half', 'all']:
+                    special_bets.append((color, bet_input))
+                else:
+                    try:
+                        bet = float(bet_input)
+                        bets[color] = round(bet, 2)
+                        total_bet += bet
+                    except ValueError:
+                        await interaction.response.send_message(f"Invalid bet value for {item.label}.", ephemeral=True)
+                        return
+
+        if len(special_bets) > 2:
+            await interaction.response.send_message("You can only use special bets on up to two colors.", ephemeral=True)
+            return
+
+        if len(special_bets) == 2:
+            colors = [bet[0] for bet in special_bets]
+            if 'bronze' in colors and 'silver' in colors:
+                await interaction.response.send_message("You can't bet on both Bronze and Silver together.", ephemeral=True)
+                return
+
+        total_fraction = 0
+        for color, special_bet in special_bets:
+            if special_bet == 'quarter':
+                fraction = 0.25
+            elif special_bet == 'half':
+                fraction = 0.5
+            else:  # 'all'
+                fraction = 1.0
+            total_fraction += fraction
+            bet_amount = round(current_balance * fraction, 2)
+            bets[color] = bet_amount
+            total_bet += bet_amount
+
+        if total_fraction > 1:
+            await interaction.response.send_message("Your total bet exceeds your balance.", ephemeral=True)
+            return
+
+        if len(bets) > 2:
+            await interaction.response.send_message("You can only bet on up to two colors.", ephemeral=True)
+            return
+
+        if total_bet <= 0:
+            await interaction.response.send_message("You must place at least one bet.", ephemeral=True)
+            return
+
+        if total_bet > current_balance:
+            await interaction.response.send_message("You don't have enough balance for this bet.", ephemeral=True)
+            return
+
+        if self.game.game_started:  # The round was settled when it started, late bets can't join it
+            await interaction.response.send_message("The game has already started!", ephemeral=True)
+            return
+
+        economy_cog = self.game.economy_cog
+        hold_id = await economy_cog.hold(self.player_id, total_bet, 'slider')
+        if hold_id is None:
+            await interaction.response.send_message("You don't have enough balance for this bet.", ephemeral=True)
+            return
+        if self.game.game_started or self.game.game_ended:  # Started while the bet was being held
+            await economy_cog.release(hold_id)
+            await interaction.response.send_message("The game has already started!", ephemeral=True)
+            return
+
+        previous = self.game.players.get(self.player_id)
+        self.game.players[self.player_id] = {
+            'bet_bronze': bets.get('bronze', 0),
+            'bet_silver': bets.get('silver', 0),
+            'bet_gold': bets.get('gold', 0),
+            'hold': hold_id
+        }
+        if previous:
+            await economy_cog.release(previous['hold'])  # Joining again replaces the earlier bet
+
+        await interaction.response.send_message(f"You've joined the game with a total bet of ${total_bet:.2f}", ephemeral=True)
+        await self.game.update_message()
+
+class CrashEngine:
+    # The multiplier is a pure function of monotonic time since launch, so what a
+    # player gets paid only depends on when they cashed out and never on how late
+    # the tick that noticed it ran.
+    def __init__(self, crash_point, growth_rate=0.07, frame=0.1):
+        self.crash_point = crash_point
+        self.growth_rate = growth_rate  # ~2x after 10 seconds, close to the old +0.01 per 0.1s pace
+        self.frame = frame
+        self.crash_after = math.log(crash_point) / growth_rate
+        self.started_at = None
+
+    def start(self, now):
+        self.started_at = now
+
+    def elapsed(self, now):
+        if self.started_at is None:
+            return 0.0
+        return now - self.started_at
+
+    def has_crashed(self, now):
+        return self.started_at is not None and self.elapsed(now) >= self.crash_after
+
+    def multiplier_at(self, now):
+        if self.has_crashed(now):
+            return self.crash_point
+        multiplier = math.floor(math.exp(self.growth_rate * self.elapsed(now)) * 100) / 100
+        return min(self.crash_point, multiplier)
+
+
+class CrashGame(LiveGame):
+    def __init__(self, ctx, economy_cog):
+        super().__init__(ctx, economy_cog)
+        self.multiplier = 1.00
+        self.crashed = False
+        self.players = {}
+        self.crash_point = self.generate_crash_point()
+        self.start_time = None
+        self.countdown = 30
+        self.max_players = 10
+        self.animation_frames = 0
+        self.engine = CrashEngine(self.crash_point)
+        self.render_interval = 0.5
+        self.next_render = None
+        self.settle_task = None
+        self.settlements = asyncio.Queue()
+        self.settle_attempts = 3
+        self.auto_cashouts = []  # Min-heap of (threshold, player_id)
+
+        # Setup buttons
+        self.add_item(Button(label="Join Game", style=discord.ButtonStyle.blurple, custom_id="join"))
+        self.add_item(Button(label="Cash Out", style=discord.ButtonStyle.green, custom_id="cashout"))
+
+    def generate_crash_point(self):
+        return crash_point(random.random())
+
+    def start_round(self, now):
+        self.start_time = discord.utils.utcnow()
+        self.engine.start(now)
+        self.settle_task = asyncio.create_task(self.settle_cashouts())
+        self.next_render = now
+
+    async def finish_round(self, deleted):
+        if self.settle_task:
+            await self.settlements.join()
+            self.settle_task.cancel()
+        if deleted:
+            return
+        # Lost bets were taken when the players joined, their holds settle at 0
+        await self.economy_cog.capture_many({data['hold']: 0 for data in self.players.values() if not data['cashed_out']})
+
+        await self.update_message()
+
+    def add_player(self, player_id, bet, auto_cashout, hold_id):
+        self.players[player_id] = {
+            'bet': bet,
+            'auto_cashout': auto_cashout,
+            'cashed_out': False,
+            'cashout_multiplier': None,
+            'hold': hold_id
+        }
+        if auto_cashout:
+            heapq.heappush(self.auto_cashouts, (auto_cashout, player_id))
+
+    def advance(self, now):
+        # Only reads the clock and queues payouts, it never waits on Discord or the database
+        self.multiplier = self.engine.multiplier_at(now)
+        self.animation_frames = int(self.engine.elapsed(now) / self.engine.frame)
+        # Only the thresholds crossed since the last tick are popped. Auto cashouts
+        # pay the exact threshold, however late this tick is.
+        while self.auto_cashouts and self.auto_cashouts[0][0] <= self.multiplier:
+            threshold, player_id = heapq.heappop(self.auto_cashouts)
+            if self.players.get(player_id, {}).get('auto_cashout') == threshold:  # Skip entries replaced by a later join
+                self.cash_out_player(player_id, threshold)
+        if self.engine.has_crashed(now):
+            self.crashed = True
+            return False
+        if now >= self.next_render:
+            self.next_render += self.render_interval
+            self.render()
+        return True
+
+    async def settle_cashouts(self):
+        # Drains cash outs queued by the tick and the button, whatever piled up
+        # while the last batch was being written goes out in the next one
+        while True:
+            batch = [await self.settlements.get()]
+            while not self.settlements.empty():
+                batch.append(self.settlements.get_nowait())
+            try:
+                await self.capture_cashouts(dict(batch))
+            finally:
+                for _ in batch:
+                    self.settlements.task_done()
+
+    async def capture_cashouts(self, payouts):
+        # A failed write leaves the holds open, so the same batch can simply be tried
+        # again. If it never goes through the holds stay open and the error is logged
+        # with every payout it was carrying.
+        for attempt in range(self.settle_attempts):
+            try:
+                await self.economy_cog.capture_many(payouts)
+                return
+            except aiosqlite.Error:
+                if attempt == self.settle_attempts - 1:
+                    log.exception("Failed to settle crash cash outs %s", payouts)
+                    return
+                await self.economy_cog.clock.sleep(0.5 * 2 ** attempt)
+
+    async def reimburse_players(self):
+        refunds = [(player_id, data['bet']) for player_id, data in self.players.items() if not data['cashed_out']]
+        await self.economy_cog.release_many([self.players[player_id]['hold'] for player_id, bet in refunds])
+        await self.send_refund_notices(refunds, "Crash")
+
+    def cash_out_player(self, player_id, multiplier):
+        if player_id not in self.players or self.players[player_id]['cashed_out']:
+            return
+
+        self.players[player_id]['cashed_out'] = True
+        self.players[player_id]['cashout_multiplier'] = multiplier
+        winnings = self.players[player_id]['bet'] * multiplier
+        self.settlements.put_nowait((self.players[player_id]['hold'], winnings))
+
+    def create_embed(self):
+        if not self.start_time:
+            title = "🚀 Crash Game Starting Soon"
+            color = discord.Color.blue()
+            description = f"Game starts in {self.countdown} seconds\nPlayers: {len(self.players)}/{self.max_players}"
+        elif self.crashed:
+            title = f"💥 Crashed at {self.multiplier:.2f}x"
+            color = discord.Color.red()
+            description = self.generate_rocket_ascii(crashed=True)
+        else:
+            title = f"🚀 Current Multiplier: {self.multiplier:.2f}x"
+            color = discord.Color.green()
+            description = self.generate_rocket_ascii()
+
+        embed = discord.Embed(title=title, description=f"```\n{description}\n```", color=color)
+        
+        for player_id, data in self.players.items():
+            live = self.start_time and not self.crashed and not data['cashed_out']
+            key = (data['bet'], data['auto_cashout'], data['cashout_multiplier'], bool(self.start_time), self.crashed, self.multiplier if live else None)
+            name, value = self.player_field(player_id, key, lambda: self.player_value(data))
+            embed.add_field(name=name, value=value, inline=False)
+
+        return embed
+
+    def player_value(self, data):
+        bet_str = f"**Bet:** ${data['bet']:.2f}"
+        auto_cashout_str = f"**Auto Cashout:** {data['auto_cashout']}x" if data['auto_cashout'] else "**Auto Cashout:** None"
+        
+        if data['cashed_out']:
+            status = f"Cashed out at {data['cashout_multiplier']}x"
+            profit = data['bet'] * (data['cashout_multiplier'] - 1)
+            status_str = f"**Status:** {status}"
+            profit_str = f"**Profit:** ${profit:.2f}"
+        elif self.crashed:
+            status_str = "**Status:** Crashed"
+            profit_str = f"**Profit:** -${data['bet']:.2f}"
+        else:
+            status_str = "**Status:** In game"
+            if self.start_time:
+                current_profit = data['bet'] * (self.multiplier - 1)
+                profit_str = f"**Profit:** ${current_profit:.2f}"
+            else:
+                profit_str = ""
+
+        value = f"{bet_str}\n{auto_cashout_str}\n{status_str}"
+        if self.start_time or self.crashed:
+            value += f"\n{profit_str}"
+        return value
+
+    def generate_rocket_ascii(self, crashed=False):
+        if crashed:
+            return "💥 CRASHED!"
+        
+        rocket = "🚀"
+        trail = "." * (self.animation_frames % 10)
+        space = " " * (10 - len(trail))
+        return f"{space}{trail}{rocket}"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.data["custom_id"] == "join":
+            await self.join_game(interaction)
+        elif interaction.data["custom_id"] == "cashout":
+            await self.cash_out(interaction)
+        return True
+
+    async def join_game(self, interaction: discord.Interaction):
+        if self.start_time:
+            await interaction.response.send_message("The game has already started!", ephemeral=True)
+            return
+
+        if len(self.players) >= self.max_players:
+            await interaction.response.send_message("The game is full! Please wait for the next round.", ephemeral=True)
+            return
+
+        modal = CrashJoinModal(self, interaction.user.id)
+        await interaction.response.send_modal(modal)
+
+    async def cash_out(self, interaction: discord.Interaction):
+        now = self.economy_cog.clock.monotonic()  # Timestamp the click before anything else can delay it
+        player_id = interaction.user.id
+        if not self.start_time:  # Nothing settles cash outs until the round starts
+            await interaction.response.send_message("The game hasn't started yet!", ephemeral=True)
+            return
+        if player_id not in self.players or self.players[player_id]['cashed_out'] or self.crashed or self.engine.has_crashed(now):
+            return
+
+        self.cash_out_player(player_id, self.engine.multiplier_at(now))
+        await interaction.response.defer()
+
+class CrashJoinModal(Modal):
+    def __init__(self, game, player_id):
+        super().__init__(title="Join Crash Game")
+        self.game = game
+        self.player_id = player_id
+
+        self.bet = TextInput(label="Bet Amount", placeholder="Enter amount or 'quarter', 'half', 'all'")
+        self.auto_cashout = TextInput(label="Auto Cashout (optional)", placeholder="Enter multiplier (e.g., 2 for 2x)", required=False)
+        
+        self.add_item(self.bet)
+        self.add_item(self.auto_cashout)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        user_data = await self.game.economy_cog.get_user_data(self.player_id)
+        current_balance = user_data['balance']
+
+        try:
+            bet_input = self.bet.value.lower()
+            if bet_input == 'quarter':
+                bet = current_balance / 4
+            elif bet_input == 'half':
+                bet = current_balance / 2
+            elif bet_input == 'all':
+                bet = current_balance  # Bet the entire balance
+            else:
+                bet = float(bet_input)
+
+            bet = round(bet, 2)  # Round to 2 decimal places
+            auto_cashout = float(self.auto_cashout.value) if self.auto_cashout.value else None
+        except ValueError:
+            await interaction.response.send_message("Invalid bet or auto cashout value.", ephemeral=True)
+            return
+
+        if bet <= 0:
+            await interaction.response.send_message("Bet amount must be positive.", ephemeral=True)
+            return
+
+        if bet > current_balance:
+            bet = current_balance  # Adjust bet to match current balance if it's somehow higher
+
+        economy_cog = self.game.economy_cog
+        hold_id = await economy_cog.hold(self.player_id, bet, 'crash')
+        if hold_id is None:
+            await interaction.response.send_message("You don't have enough balance for this bet.", ephemeral=True)
+            return
+        if self.game.start_time or self.game.game_ended:  # The round moved on while the bet was being held
+            await economy_cog.release(hold_id)
+            await interaction.response.send_message("The game has already started!", ephemeral=True)
+            return
+
+        previous = self.game.players.get(self.player_id)
+        self.game.add_player(self.player_id, bet, auto_cashout, hold_id)
+        if previous:
+            await economy_cog.release(previous['hold'])  # Joining again replaces the earlier bet
+
+        await interaction.response.send_message(f"You've joined the game with a bet of ${bet:.2f}", ephemeral=True)
+        await self.game.update_message()
+
+
+class TowerGame(View):
+    def __init__(self, ctx, bet, economy_cog, hold_id):
+        super().__init__(timeout=60)
+        self.ctx = ctx
+        self.bet = bet
+        self.economy_cog = economy_cog
+        self.hold_id = hold_id  # The bet sits in escrow until the game ends
+        self.current_level = 0
+        self.max_levels = 10
+        self.multipliers = TOWER_MULTIPLIERS
+        self.win_chance = 0.66  # 66% chance to win at each level (2 out of 3 tiles are safe)
+        self.towers = [['⬜'] * 10 for _ in range(3)]
+        self.safe_tiles = self.generate_safe_tiles()
+        self.game_over = False
+        self.stopped_at = None
+        self.last_safe_level = -1
+
+    def generate_safe_tiles(self):
+        return [random.sample(range(3), TOWER_SAFE_TILES) for _ in range(self.max_levels)]
+
+    @discord.ui.button(label="Left", style=discord.ButtonStyle.blurple)
+    async def left(self, interaction: discord.Interaction, button: Button):
+        await self.make_move(interaction, 0)
+
+    @discord.ui.button(label="Middle", style=discord.ButtonStyle.blurple)
+    async def middle(self, interaction: discord.Interaction, button: Button):
+        await self.make_move(interaction, 1)
+
+    @discord.ui.button(label="Right", style=discord.ButtonStyle.blurple)
+    async def right(self, interaction: discord.Interaction, button: Button):
+        await self.make_move(interaction, 2)
+
+    @discord.ui.button(label="Cash Out", style=discord.ButtonStyle.red)
+    async def cash_out(self, interaction: discord.Interaction, button: Button):
+        if interaction.user.id != self.ctx.author.id:
+            await interaction.response.send_message("This is not your game!", ephemeral=True)
+            return
+        self.stopped_at = (self.last_safe_level, None)
+        await self.end_game(interaction, won=True, cash_out=True)
+
+    async def make_move(self, interaction: discord.Interaction, choice: int):
+        if interaction.user.id != self.ctx.author.id:
+            await interaction.response.send_message("This is not your game!", ephemeral=True)
+            return
+
+        if choice in self.safe_tiles[self.current_level]:
+            self.towers[choice][self.current_level] = '🟩'
+            self.last_safe_level = self.current_level
+            self.current_level += 1
+            if self.current_level == self.max_levels:
+                await self.end_game(interaction, won=True)
+            else:
+                await self.update_message(interaction)
+        else:
+            self.stopped_at = (self.current_level, choice)
+            await self.end_game(interaction, won=False)
+
+    async def update_message(self, interaction):
+        embed = self.create_embed()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def end_game(self, interaction, won, cash_out=False):
+        self.game_over = True
+
+        if won:
+            winnings = self.bet * self.multipliers[self.current_level - 1]
+            color = discord.Color.green()
+            if cash_out:
+                title = f"You Cashed Out at Level {self.current_level}!"
+            else:
+                title = f"You Reached the Top! Level {self.current_level}"
+        else:
+            winnings = 0
+            color = discord.Color.red()
+            title = f"You Fell at Level {self.current_level + 1}!"
+
+        self.reveal_board()
+
+        user_data = await self.economy_cog.capture(self.hold_id, winnings)
+        if user_data is None:
+            await interaction.response.send_message("This game has expired.", ephemeral=True)
+            return
+
+        embed = self.create_embed()
+        embed.title = title
+        embed.color = color
+        embed.add_field(name="Result", value=f"You bet **${self.bet:,.2f}** and {'won' if won else 'lost'} **${winnings:,.2f}**.\n"
+                                             f"Your new balance is **${user_data['balance']:,.2f}**. 💵", inline=False)
+
+        for child in self.children:
+            child.disabled = True
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def on_timeout(self):
+        # An abandoned climb gets its bet back, like it did before bets were held
+        if not self.game_over:
+            self.game_over = True
+            await self.economy_cog.release(self.hold_id)
+
+    def reveal_board(self):
+        for level in range(self.max_levels):
+            for tower in range(3):
+                if self.towers[tower][level] == '⬜':
+                    if tower in self.safe_tiles[level]:
+                        self.towers[tower][level] = '🟩'
+                    else:
+                        self.towers[tower][level] = '🟥'
+        
+        if self.stopped_at:
+            level, choice = self.stopped_at
+            if choice is not None:
+                # Player fell
+                self.towers[choice][level] = '🟨'
+            else:
+                # Player cashed out, mark the last safe level
+                for tower in range(3):
+                    if self.towers[tower][level] == '🟩':
+                        self.towers[tower][level] = '🟨'
+                        break  # Only mark one tile as yellow
+
+    def create_embed(self):
+        tower_display = "".join(f"{''.join(row)}\n" for row in zip(*[tower[::-1] for tower in self.towers]))
+        potential_win = self.bet * self.multipliers[self.current_level] if self.current_level < self.max_levels else self.bet * self.multipliers[-1]
+        current_win = self.bet * self.multipliers[self.current_level - 1] if self.current_level > 0 else 0
+        
+        embed = discord.Embed(
+            title="Tower Game",
+            description=f"**Current Level:** {self.current_level + 1}\n"
+                        f"**Potential Win:** ${potential_win:,.2f}\n"
+                        f"**Current Win:** ${current_win:,.2f}\n\n"
+                        f"```\n{tower_display}```",
+            color=discord.Color.blue()
+        )
+        embed.set_author(name=self.ctx.author.display_name, icon_url=self.ctx.author.display_avatar.url)
+        
+        footer_text = "🟩 = Safe | 🟥 = Bomb | ⬜ = Unknown"
+        if self.game_over:
+            footer_text += " | 🟨 = Where You Stopped"
+        
+        embed.set_footer(text=footer_text)
+        return embed
+
+class HighLowGame(View):
+    def __init__(self, ctx, bet, economy_cog, hold_id):
+        super().__init__(timeout=30)
+        self.ctx = ctx
+        self.bet = bet
+        self.economy_cog = economy_cog
+        self.hold_id = hold_id
+        self.game_over = False
+        self.first_number = random.randint(1, 100)
+        self.second_number = random.randint(1, 100)
+
+    @discord.ui.button(label="Higher", style=discord.ButtonStyle.green)
+    async def higher(self, interaction: discord.Interaction, button: Button):
+        await self.make_guess(interaction, "higher")
+
+    @discord.ui.button(label="Lower", style=discord.ButtonStyle.red)
+    async def lower(self, interaction: discord.Interaction, button: Button):
+        await self.make_guess(interaction, "lower")
+
+    @discord.ui.button(label="Jackpot", style=discord.ButtonStyle.blurple)
+    async def jackpot(self, interaction: discord.Interaction, button: Button):
+        await self.make_guess(interaction, "jackpot")
+
+    async def make_guess(self, interaction: discord.Interaction, guess):
+        if interaction.user.id != self.ctx.author.id:
+            await interaction.response.send_message("This is not your game!", ephemeral=True)
+            return
+
+        if self.game_over:
+            await interaction.response.send_message("This game has already ended.", ephemeral=True)
+            return
+        self.game_over = True
+        result = self.check_result(guess)
+        await self.end_game(interaction, result)
+
+    def check_result(self, guess):
+        return highlow_result(guess, self.first_number, self.second_number)
+
+    async def end_game(self, interaction, result):
+        if result == "win":
+            winnings = self.bet * HIGHLOW_PROFIT[result]  # This is the profit
+            color = discord.Color.green()
+            message = f"You won! The number was {self.second_number}."
+        elif result == "jackpot":
+            winnings = self.bet * HIGHLOW_PROFIT[result]  # This is the profit (10x bet minus the original bet)
+            color = discord.Color.gold()
+            message = f"JACKPOT! The number was {self.second_number}."
+        else:
+            winnings = self.bet * HIGHLOW_PROFIT[result]  # This is the loss
+            color = discord.Color.red()
+            message = f"You lost. The number was {self.second_number}."
+
+        user_data = await self.economy_cog.capture(self.hold_id, self.bet + winnings)
+        if user_data is None:
+            await interaction.response.send_message("This game has expired.", ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title="Highlow Game Result",
+            description=f"First number: {self.first_number}\n{message}\n\n"
+                        f"You {'won' if result != 'lose' else 'lost'} **${abs(winnings):,.2f}**.\n"
+                        f"Your new balance is **${user_data['balance']:,.2f}**. 💵",
+            color=color
+        )
+        embed.set_author(name=self.ctx.author.display_name, icon_url=self.ctx.author.display_avatar.url)
+
+        for child in self.children:
+            child.disabled = True
+
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def on_timeout(self):
+        if not self.game_over:
+            self.game_over = True
+            await self.economy_cog.release(self.hold_id)
+
+
+class Economy(commands.Cog):
+    def __init__(self, bot, clock=None):
+        self.bot = bot
+        self.clock = clock or RealClock()  # Drives every timed game loop, see VirtualClock
+        self.db_name = 'economy_database.db'
+        self.locks = LockStripes()
+        self.pool = None
+        self.db = None
+        self.accounts = AccountCache()
+        self.ranks = RankIndex()
+        self.settle_stats = SettleStats()
+        self.escrow = EscrowIndex()
+        self.stats = EconomyStats()
+        self.ledger = Ledger()
+        self.speakers = RecentSpeakers()
+        self.leaderboard_accrued_at = 0.0
+        self.renderer = RenderScheduler(clock=self.clock)
+        self.active_games = {}  # message id -> live Slider/Crash game
+        self.ticker = GameTicker(clock=self.clock)
+        self.slider_frames = SliderFrames(SLIDER_SYMBOLS, SLIDER_WEIGHTS)
+        # Ahead of the rank index, which still holds the old net worth to diff against
+        self.accounts.listeners.append(lambda user_id, balance, bank: self.stats.adjust(balance + bank - self.ranks.networth.get(user_id, 0)))
+        self.accounts.listeners.append(lambda user_id, balance, bank: self.ranks.update(user_id, balance + bank))
+        self.bot.loop.create_task(self.setup_database())
+        self.case_data = CASE_CATALOG
+
+    def generate_bot_name(self):
+        prefixes = ["Cyber", "Quantum", "Nexus", "Astro", "Cosmic", "Nova", "Stellar", "Galactic"]
+        suffixes = ["Bot", "AI", "Mind", "Core", "Unit", "Droid", "Sentinel", "Agent"]
+        return f"{random.choice(prefixes)}{random.choice(suffixes)}"
+
+    async def check_balance(self, user, amount):
+        user_data = await self.get_user_data(user.id)
+        return user_data['balance'] >= amount
+
+    async def setup_database(self):
+        self.pool = ConnectionPool(self.db_name)
+        await self.pool.open()
+        self.db = self.pool.writer
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS user_data (
+                user_id INTEGER PRIMARY KEY,
+                balance REAL,
+                bank REAL,
+                last_accrued_at REAL,
+                networth REAL GENERATED ALWAYS AS (balance + bank) VIRTUAL
+            )
+        ''')
+        async with self.db.execute('PRAGMA table_xinfo(user_data)') as cursor:
+            columns = [row[1] for row in await cursor.fetchall()]
+        if 'networth' not in columns:
+            await self.db.execute('ALTER TABLE user_data ADD COLUMN networth REAL GENERATED ALWAYS AS (balance + bank) VIRTUAL')
+        if 'last_accrued_at' not in columns:
+            # Existing accounts start earning the first time they're touched, no backfill needed
+            await self.db.execute('ALTER TABLE user_data ADD COLUMN last_accrued_at REAL')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS user_data_networth ON user_data (networth DESC, user_id)')
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS battle_history (
+                battle_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                message_id INTEGER,
+                created_at REAL,
+                total_bet INTEGER,
+                winning_team INTEGER,
+                transcript TEXT
+            )
+        ''')
+        # Bets in play. Each hold moves money out of the wallet when it's taken and
+        # pays the payout back when it's settled, through these triggers, so hold,
+        # capture and release are one statement each and a flush can never commit
+        # half of one.
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS holds (
+                hold_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                amount REAL NOT NULL,
+                payout REAL,
+                game TEXT,
+                created_at REAL
+            )
+        ''')
+        await self.db.execute('''
+            CREATE TRIGGER IF NOT EXISTS holds_take AFTER INSERT ON holds BEGIN
+                UPDATE user_data SET balance = ROUND(balance - NEW.amount, 2) WHERE user_id = NEW.user_id;
+            END
+        ''')
+        await self.db.execute('''
+            CREATE TRIGGER IF NOT EXISTS holds_settle AFTER UPDATE OF payout ON holds
+            WHEN OLD.payout IS NULL AND NEW.payout IS NOT NULL BEGIN
+                UPDATE user_data SET balance = ROUND(balance + NEW.payout, 2) WHERE user_id = NEW.user_id;
+                DELETE FROM holds WHERE hold_id = NEW.hold_id;
+            END
+        ''')
+        # Hourly money flows per source, and the supply at the end of each hour
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS economy_stats (
+                bucket INTEGER,
+                source TEXT,
+                minted REAL,
+                burned REAL,
+                events INTEGER,
+                PRIMARY KEY (bucket, source)
+            )
+        ''')
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS economy_supply (
+                bucket INTEGER PRIMARY KEY,
+                supply REAL,
+                held REAL
+            )
+        ''')
+        # Why every balance changed, in order. Replaying it over a copy of user_data
+        # with python -m ledger gives back the table.
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS ledger (
+                entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL,
+                user_id INTEGER,
+                balance_delta REAL,
+                bank_delta REAL,
+                source TEXT,
+                game_id INTEGER
+            )
+        ''')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS ledger_user ON ledger (user_id, entry_id)')
+        # No game survives a restart, so every hold left over is refunded in one statement
+        orphaned = await self.db.execute_fetchall('UPDATE holds SET payout = amount WHERE payout IS NULL RETURNING hold_id, user_id, amount, game')
+        for hold_id, user_id, amount, game in orphaned:
+            self.ledger.record(user_id, amount, 0, game, hold_id)
+        if orphaned:
+            await self.write_ledger()
+            log.info("Released %d orphaned holds", len(orphaned))
+        await self.db.commit()
+        await self.load_rankings()
+        await self.load_stats()
+        self.flush_accounts.start()
+        self.persist_stats.start()
+        self.flush_ledger.start()
+
+    async def get_user_data(self, user_id: int):
+        row = self.accounts.get(user_id)
+        if row is None or self.interest_due(user_id):
+            async with self.locks.hold(user_id):
+                row = await self.load_account(user_id)
+        return {'balance': row[0], 'bank': row[1]}
+
+    async def load_account(self, user_id: int):
+        # The caller holds the account's stripe. Interest owed is added on the way out.
+        if user_id not in self.accounts.rows:
+            # Rows with uncommitted writes are never evicted, so the committed copy is current
+            async with self.pool.reader() as db:
+                async with db.execute('SELECT balance, bank, last_accrued_at FROM user_data WHERE user_id = ?', (user_id,)) as cursor:
+                    result = await cursor.fetchone()
+            if result:
+                self.accounts.load(user_id, *result)
+            else:
+                self.accounts.load(user_id, 0, 0, None)
+        self.accrue_interest(user_id)
+        return self.accounts.rows[user_id]
+
+    async def load_accounts(self, user_ids):
+        # load_account for many accounts, the ones missing from the cache are read
+        # in one query. The caller holds every account's stripe.
+        await self.cache_accounts(user_ids)
+        for user_id in user_ids:
+            self.accrue_interest(user_id)
+        return {user_id: self.accounts.rows[user_id] for user_id in user_ids}
+
+    async def cache_accounts(self, user_ids):
+        # The rows as they stand, interest not added. The caller holds every account's stripe.
+        missing = [user_id for user_id in user_ids if user_id not in self.accounts.rows]
+        if missing:
+            placeholders = ', '.join('?' * len(missing))
+            async with self.pool.reader() as db:
+                rows = await db.execute_fetchall(f'SELECT user_id, balance, bank, last_accrued_at FROM user_data WHERE user_id IN ({placeholders})', missing)
+            for row in rows:
+                self.accounts.load(*row)
+            for user_id in missing:
+                self.accounts.load(user_id, 0, 0, None)
+        return {user_id: self.accounts.rows[user_id] for user_id in user_ids}
+
+    def interest_due(self, user_id):
+        # Whether reading a cached account would change its bank, checked without the stripe
+        balance, bank = self.accounts.rows[user_id]
+        last_accrued_at = self.accounts.accrued_at.get(user_id)
+        return bool(bank) and (last_accrued_at is None or accrue(bank, last_accrued_at, time.time()) != bank)
+
+    def accrue_interest(self, user_id):
+        # Materializes the interest on a cached account. The caller holds its stripe,
+        # so nothing else can be between reading and writing the row. Less than a
+        # cent leaves the timestamp alone and keeps accruing from it.
+        balance, bank = self.accounts.rows[user_id]
+        now = time.time()
+        last_accrued_at = self.accounts.accrued_at.get(user_id)
+        if last_accrued_at is None:
+            self.accounts.accrued_at[user_id] = now
+            if bank:
+                self.accounts.put(user_id, balance, bank)  # Writes the start time back with the row
+            return
+        accrued = accrue(bank, last_accrued_at, now)
+        if accrued != bank:
+            self.accounts.accrued_at[user_id] = now
+            self.accounts.put(user_id, balance, accrued)
+            self.stats.record('interest', round(accrued - bank, 2), now)
+            self.ledger.record(user_id, 0, accrued - bank, 'interest', now=now)
+
+    async def accrue_leaderboard(self):
+        # Interest on the accounts !lb shows, so the top pages rank what they'd hold
+        # if they looked now. Nobody else is touched, and at most once a minute.
+        now = time.time()
+        if now - self.leaderboard_accrued_at < LEADERBOARD_ACCRUAL_INTERVAL:
+            return
+        self.leaderboard_accrued_at = now
+        user_ids = [user_id for user_id, networth in self.ranks.top(LEADERBOARD_TOP)]
+        if user_ids:
+            async with self.locks.hold(*user_ids):
+                await self.load_accounts(user_ids)
+
+    async def load_rankings(self):
+        # One pass over the networth index at startup, after that the cache keeps the rank index current
+        async with self.pool.reader() as db:
+            async with db.execute('SELECT user_id, networth FROM user_data WHERE networth > 0 ORDER BY networth DESC, user_id') as cursor:
+                rows = await cursor.fetchall()
+        self.ranks.build(rows)
+        # Cached writes that haven't been committed yet aren't visible to the reader
+        for user_id in self.accounts.dirty | self.accounts.uncommitted:
+            row = self.accounts.rows.get(user_id)
+            if row is not None:
+                self.ranks.update(user_id, row[0] + row[1])
+        self.stats.supply = math.fsum(self.ranks.networth.values())
+
+    async def load_stats(self):
+        # Only the buckets the reporting windows still cover
+        oldest = self.stats.bucket_at(time.time()) - max(self.stats.windows.values())
+        async with self.pool.reader() as db:
+            rows = await db.execute_fetchall('SELECT bucket, source, minted, burned, events FROM economy_stats WHERE bucket > ? ORDER BY bucket', (oldest,))
+        self.stats.load(rows)
+
+    def leaderboard_page(self, page_num):
+        # Every page comes straight from the rank index, the same positions !rank
+        # reports. The reader could be a flush behind the cache and repeat or skip
+        # accounts across a page boundary.
+        return self.ranks.slice(page_num * LEADERBOARD_PAGE_SIZE, LEADERBOARD_PAGE_SIZE)
+
+    async def update_user_data(self, user_id: int, new_balance: float, new_bank: float, source: str = None):
+        new_balance = round(max(0, new_balance), 2)
+        new_bank = round(max(0, new_bank), 2)
+        async with self.locks.hold(user_id):
+            balance, bank = await self.load_account(user_id)  # Also brings the interest timestamp up to date
+            self.accounts.put(user_id, new_balance, new_bank)
+            self.ledger.record(user_id, new_balance - balance, new_bank - bank, source)
+        if source:
+            self.stats.record(source, round(new_balance + new_bank - balance - bank, 2))
+
+    async def write(self, sql, parameters, many=False):
+        # Runs a statement on the writer and closes its cursor straight away. A cursor
+        # left to the garbage collector is finalized on the event loop thread, which
+        # can race the connection's worker and fail with "bad parameter or other API misuse".
+        execute = self.db.executemany if many else self.db.execute
+        async with execute(sql, parameters):
+            pass
+
+    async def apply_delta(self, user_id: int, wallet_delta: float = 0, bank_delta: float = 0, *, require_min: float = None, require_bank_min: float = None, source: str = None):
+        # Adds the deltas in a single conditional upsert instead of a get/update round trip.
+        # With require_min (or require_bank_min) the change only happens if the wallet (bank)
+        # holds at least that much, otherwise None is returned. Without it the result is
+        # floored at 0 like update_user_data. The commit is left to flush_accounts.
+        async with self.locks.hold(user_id):
+            return await self.apply_delta_locked(user_id, wallet_delta, bank_delta, require_min, require_bank_min, source)
+
+    async def sync_accounts(self, user_ids):
+        # Writes cached rows that are newer than the database copy, ahead of a
+        # statement that reads them. The caller holds the accounts' stripes.
+        stale = [(user_id, *self.accounts.rows[user_id], self.accounts.accrued_at.get(user_id)) for user_id in user_ids if user_id in self.accounts.dirty]
+        if not stale:
+            return
+        self.accounts.dirty.difference_update(row[0] for row in stale)
+        try:
+            await self.write('''
+                INSERT INTO user_data (user_id, balance, bank, last_accrued_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET balance = excluded.balance, bank = excluded.bank,
+                    last_accrued_at = COALESCE(excluded.last_accrued_at, last_accrued_at)
+            ''', stale, many=True)
+        except aiosqlite.Error:
+            self.accounts.dirty.update(row[0] for row in stale)
+            raise
+        self.accounts.uncommitted.update(row[0] for row in stale)
+
+    async def apply_delta_locked(self, user_id, wallet_delta, bank_delta, require_min=None, require_bank_min=None, source=None):
+        # apply_delta for callers that already hold the account's stripe
+        if bank_delta:
+            before = await self.load_account(user_id)  # Interest up to now is added before the bank changes
+        else:
+            before = (await self.cache_accounts([user_id]))[user_id]
+        await self.sync_accounts([user_id])
+
+        params = {
+            'user_id': user_id,
+            'wallet_delta': wallet_delta,
+            'bank_delta': bank_delta,
+            'wallet_min': require_min or 0,
+            'bank_min': require_bank_min or 0,
+            'now': time.time(),
+        }
+        # Fetched in the same call so the statement is finished before flush_accounts can commit
+        rows = await self.db.execute_fetchall('''
+            INSERT INTO user_data (user_id, balance, bank, last_accrued_at)
+            SELECT :user_id, MAX(ROUND(:wallet_delta, 2), 0), MAX(ROUND(:bank_delta, 2), 0), :now
+            WHERE (:wallet_min <= 0 AND :bank_min <= 0) OR EXISTS (SELECT 1 FROM user_data WHERE user_id = :user_id)
+            ON CONFLICT(user_id) DO UPDATE SET
+                balance = MAX(ROUND(balance + :wallet_delta, 2), 0),
+                bank = MAX(ROUND(bank + :bank_delta, 2), 0),
+                last_accrued_at = COALESCE(last_accrued_at, :now)
+            WHERE balance >= :wallet_min AND bank >= :bank_min
+            RETURNING balance, bank, last_accrued_at
+        ''', params)
+
+        if not rows:
+            return None
+        result = rows[0]
+        self.accounts.store(user_id, *result)
+        self.ledger.record(user_id, wallet_delta, bank_delta, source)
+        if source:
+            # What actually moved, a delta past 0 is floored away
+            self.stats.record(source, round(result[0] + result[1] - before[0] - before[1], 2))
+        return {'balance': result[0], 'bank': result[1]}
+
+    async def settle_many(self, deltas, source=None, game_id=None):
+        # Applies (user_id, wallet_delta) pairs for several accounts with one
+        # executemany, then reads the new balances back in one query. Stripes are
+        # taken in order and every statement lands in the same transaction.
+        totals = {}
+        for user_id, delta in deltas:
+            totals[user_id] = totals.get(user_id, 0) + delta
+        if not totals:
+            return {}
+
+        start = time.perf_counter()
+        async with self.locks.hold(*totals):
+            before = await self.cache_accounts(totals)
+            await self.sync_accounts(totals)
+            await self.write('''
+                INSERT INTO user_data (user_id, balance, bank) VALUES (:user_id, MAX(ROUND(:delta, 2), 0), 0)
+                ON CONFLICT(user_id) DO UPDATE SET balance = MAX(ROUND(balance + :delta, 2), 0)
+            ''', [{'user_id': user_id, 'delta': delta} for user_id, delta in totals.items()], many=True)
+
+            placeholders = ', '.join('?' * len(totals))
+            rows = await self.db.execute_fetchall(f'SELECT user_id, balance, bank, last_accrued_at FROM user_data WHERE user_id IN ({placeholders})', tuple(totals))
+            for user_id, delta in totals.items():
+                self.ledger.record(user_id, delta, 0, source, game_id)
+
+        balances = {}
+        for user_id, balance, bank, accrued_at in rows:
+            self.accounts.store(user_id, balance, bank, accrued_at)
+            balances[user_id] = {'balance': balance, 'bank': bank}
+            if source:
+                # What actually moved, a loss past 0 is floored away
+                self.stats.record(source, round(balance - before[user_id][0], 2))
+        self.settle_stats.record(len(totals), time.perf_counter() - start)
+        return balances
+
+    async def transfer(self, from_id, to_id, amount, received=None, source=None):
+        # One payment. The recipient gets received, which defaults to amount and is
+        # lower when a fee is kept.
+        return await self.transfer_many(from_id, {to_id: amount if received is None else received}, amount, source)
+
+    async def transfer_many(self, from_id, payouts, total=None, source=None):
+        # Takes total (by default the sum of the payouts) from from_id's wallet and
+        # pays each {user_id: amount}. Every leg is put in the cache without an await
+        # in between, so flush_accounts writes them in the same executemany and
+        # commit, or not at all. Returns the new balances, or None without moving
+        # anything if the wallet can't cover it.
+        if total is None:
+            total = sum(payouts.values())
+        totals = {from_id: -total}
+        for user_id, amount in payouts.items():
+            totals[user_id] = totals.get(user_id, 0) + amount
+
+        async with self.locks.hold(*totals):
+            rows = await self.load_accounts(totals)
+            # Small tolerance for floating-point precision errors
+            if rows[from_id][0] + 1e-6 < total:
+                return None
+            balances = {}
+            moved = 0
+            for user_id, delta in totals.items():
+                old_balance, bank = rows[user_id]
+                balance = round(max(0, old_balance + delta), 2)
+                self.accounts.put(user_id, balance, bank)
+                self.ledger.record(user_id, balance - old_balance, 0, source)
+                balances[user_id] = {'balance': balance, 'bank': bank}
+                moved += balance - old_balance
+        if source:
+            self.stats.record(source, round(moved, 2))  # The fee, if one was kept
+        return balances
+
+    async def hold(self, user_id, amount, game):
+        # Moves a bet from the wallet into escrow. Returns the hold id, or None if
+        # the wallet can't cover it. The RETURNING subqueries run before the
+        # trigger, so they repeat its arithmetic to hand back the new balance.
+        amount = round(amount, 2)
+        async with self.locks.hold(user_id):
+            await self.sync_accounts([user_id])
+            rows = await self.db.execute_fetchall('''
+                INSERT INTO holds (user_id, amount, game, created_at)
+                SELECT :user_id, :amount, :game, :now
+                WHERE EXISTS (SELECT 1 FROM user_data WHERE user_id = :user_id AND balance >= :amount)
+                RETURNING hold_id,
+                    (SELECT ROUND(balance - :amount, 2) FROM user_data WHERE user_id = :user_id),
+                    (SELECT bank FROM user_data WHERE user_id = :user_id),
+                    (SELECT last_accrued_at FROM user_data WHERE user_id = :user_id)
+            ''', {'user_id': user_id, 'amount': amount, 'game': game, 'now': time.time()})
+            if not rows:
+                return None
+            hold_id, balance, bank, accrued_at = rows[0]
+            self.accounts.store(user_id, balance, bank, accrued_at)
+            self.escrow.add(hold_id, user_id, amount, game)
+            self.ledger.record(user_id, -amount, 0, game, hold_id)
+        return hold_id
+
+    async def capture(self, hold_id, payout, released=False):
+        # Settles a hold, paying payout (0 for a lost bet) into the wallet. Returns
+        # the new balances, or None if the hold was already settled.
+        entry = self.escrow.get(hold_id)
+        if entry is None:
+            return None
+        user_id, amount, game = entry
+        payout = round(payout, 2)
+        async with self.locks.hold(user_id):
+            if self.escrow.pop(hold_id) is None:  # Settled while this waited for the stripe
+                return None
+            try:
+                await self.sync_accounts([user_id])
+                rows = await self.db.execute_fetchall('''
+                    UPDATE holds SET payout = :payout WHERE hold_id = :hold_id AND payout IS NULL
+                    RETURNING (SELECT ROUND(balance + :payout, 2) FROM user_data WHERE user_id = holds.user_id),
+                        (SELECT bank FROM user_data WHERE user_id = holds.user_id),
+                        (SELECT last_accrued_at FROM user_data WHERE user_id = holds.user_id)
+                ''', {'hold_id': hold_id, 'payout': payout})
+            except aiosqlite.Error:
+                self.escrow.add(hold_id, user_id, amount, game)  # Still open in the holds table, so it can be settled again
+                raise
+            balance, bank, accrued_at = rows[0]
+            self.accounts.store(user_id, balance, bank, accrued_at)
+            self.ledger.record(user_id, payout, 0, game, hold_id)
+        self.escrow.captured += 1
+        if released:
+            self.escrow.released += 1
+        self.stats.record(game, round(payout - amount, 2))
+        return {'balance': balance, 'bank': bank}
+
+    async def release(self, hold_id):
+        # Refunds a hold in full
+        entry = self.escrow.get(hold_id)
+        if entry is None:
+            return None
+        return await self.capture(hold_id, entry[1], released=True)
+
+    async def capture_many(self, payouts, released=False):
+        # capture for a whole round, {hold_id: payout} in one executemany. Returns
+        # the new balances of every player whose hold was still open.
+        entries = {hold_id: self.escrow.get(hold_id) for hold_id in payouts}
+        user_ids = {entry[0] for entry in entries.values() if entry is not None}
+        if not user_ids:
+            return {}
+
+        start = time.perf_counter()
+        async with self.locks.hold(*user_ids):
+            settled = [(round(payouts[hold_id], 2), hold_id) for hold_id in entries if self.escrow.pop(hold_id) is not None]
+            try:
+                await self.sync_accounts(user_ids)
+                await self.write('UPDATE holds SET payout = ? WHERE hold_id = ? AND payout IS NULL', settled, many=True)
+            except aiosqlite.Error:
+                for payout, hold_id in settled:
+                    self.escrow.add(hold_id, *entries[hold_id])
+                raise
+            for payout, hold_id in settled:
+                user_id, amount, game = entries[hold_id]
+                self.ledger.record(user_id, payout, 0, game, hold_id)
+            placeholders = ', '.join('?' * len(user_ids))
+            rows = await self.db.execute_fetchall(f'SELECT user_id, balance, bank, last_accrued_at FROM user_data WHERE user_id IN ({placeholders})', tuple(user_ids))
+
+        balances = {}
+        for user_id, balance, bank, accrued_at in rows:
+            self.accounts.store(user_id, balance, bank, accrued_at)
+            balances[user_id] = {'balance': balance, 'bank': bank}
+        for payout, hold_id in settled:
+            user_id, amount, game = entries[hold_id]
+            self.stats.record(game, round(payout - amount, 2))
+        self.escrow.captured += len(settled)
+        if released:
+            self.escrow.released += len(settled)
+        self.settle_stats.record(len(settled), time.perf_counter() - start)
+        return balances
+
+    async def release_many(self, hold_ids):
+        refunds = {}
+        for hold_id in hold_ids:
+            entry = self.escrow.get(hold_id)
+            if entry is not None:
+                refunds[hold_id] = entry[1]
+        return await self.capture_many(refunds, released=True)
+
+    async def settle_battle(self, teams, team_totals, total_bet, game_id=None):
+        # Case battle payouts for every human player in one batch, returns the new balances
+        deltas = []
+        if team_totals[1] != team_totals[2]:  # If it's not a tie
+            winning_team = 1 if team_totals[1] > team_totals[2] else 2
+            losing_team = 2 if winning_team == 1 else 1
+            for player in teams[winning_team]:
+                if not isinstance(player, str):  # Check if it's not a bot
+                    deltas.append((player.id, total_bet // len(teams[winning_team])))
+            for player in teams[losing_team]:
+                if not isinstance(player, str):  # Check if it's not a bot
+                    deltas.append((player.id, -(total_bet // len(teams[losing_team]))))
+        else:
+            # If it's a tie the bets are returned. They were never taken, so nothing
+            # is written and the balances are only read back for the embed.
+            user_ids = {player.id for team in teams.values() for player in team if not isinstance(player, str)}
+            async with self.locks.hold(*user_ids):
+                rows = await self.load_accounts(user_ids)
+            return {user_id: {'balance': balance, 'bank': bank} for user_id, (balance, bank) in rows.items()}
+        return await self.settle_many(deltas, 'casebattle', game_id)
+
+    @tasks.loop(seconds=2.0)
+    async def flush_accounts(self):
+        try:
+            await self.flush_dirty_accounts()
+        except aiosqlite.Error:
+            log.exception("Failed to flush account cache")
+
+    async def flush_dirty_accounts(self):
+        # Every balance change records its ledger entry under the account's stripe,
+        # so with all stripes held from the cut to the commit, the dirty rows and the
+        # ledger entries taken here describe exactly the same changes, and nothing
+        # else can slip into the transaction in between.
+        async with self.ledger.writing, self.locks.hold_all():
+            rows = self.accounts.take_dirty()
+            entries = self.ledger.take()
+            if not rows and not entries and not self.db.in_transaction:
+                return
+
+            start = time.perf_counter()
+            committing = set()
+            try:
+                if rows:
+                    await self.write('''
+                        INSERT INTO user_data (user_id, balance, bank, last_accrued_at) VALUES (?, ?, ?, ?)
+                        ON CONFLICT(user_id) DO UPDATE SET balance = excluded.balance, bank = excluded.bank,
+                            last_accrued_at = COALESCE(excluded.last_accrued_at, last_accrued_at)
+                    ''', rows, many=True)
+                if entries:
+                    await self.insert_ledger(entries)
+                # Also commits any apply_delta statements since the last flush
+                committing, self.accounts.uncommitted = self.accounts.uncommitted, set()
+                await self.db.commit()
+            except aiosqlite.Error:
+                # Keep the rows dirty so the next flush retries them
+                self.accounts.dirty.update(row[0] for row in rows)
+                self.accounts.uncommitted |= committing
+                raise
+        self.accounts.record_flush(len(rows), time.perf_counter() - start)
+        self.accounts.evict()
+
+    @tasks.loop(seconds=0.5)
+    async def flush_ledger(self):
+        try:
+            await self.write_ledger(self.ledger.batch_size)
+        except aiosqlite.Error:
+            log.exception("Failed to write ledger")
+
+    async def write_ledger(self, batch_size=None):
+        # Inserts the ledger entries queued so far into the open transaction,
+        # batch_size at a time (all in one batch by default). Entries recorded
+        # meanwhile wait for the next call. flush_accounts commits them.
+        async with self.ledger.writing:
+            remaining = self.ledger.pending()
+            while remaining > 0:
+                batch = self.ledger.take(min(remaining, batch_size or remaining))
+                if not batch:
+                    return
+                remaining -= len(batch)
+                await self.insert_ledger(batch)
+
+    async def insert_ledger(self, batch):
+        # The caller holds ledger.writing
+        start = time.perf_counter()
+        try:
+            await self.write('''
+                INSERT INTO ledger (ts, user_id, balance_delta, bank_delta, source, game_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', batch, many=True)
+        except aiosqlite.Error:
+            self.ledger.restore(batch)
+            raise
+        self.ledger.record_batch(len(batch), time.perf_counter() - start)
+
+    @tasks.loop(seconds=60.0)
+    async def persist_stats(self):
+        try:
+            await self.write_stats()
+        except aiosqlite.Error:
+            log.exception("Failed to write economy stats")
+
+    async def write_stats(self):
+        # Adds the buckets' new counts to their rows. Like apply_delta, the commit
+        # comes with the next flush_accounts.
+        rows = self.stats.take_pending()
+        try:
+            if rows:
+                await self.write('''
+                    INSERT INTO economy_stats (bucket, source, minted, burned, events) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(bucket, source) DO UPDATE SET minted = minted + excluded.minted,
+                        burned = burned + excluded.burned, events = events + excluded.events
+                ''', rows, many=True)
+            await self.write('INSERT OR REPLACE INTO economy_supply (bucket, supply, held) VALUES (?, ?, ?)',
+                             (self.stats.bucket_at(time.time()), round(self.stats.supply, 2), self.escrow.total))
+        except aiosqlite.Error:
+            self.stats.restore(rows)
+            raise
+
+    async def send_embed(self, ctx, description: str, color: discord.Color, delete_after: int = None):
+        embed = discord.Embed(description=description, color=color)
+        message = await ctx.send(embed=embed)
+        if delete_after:
+            await message.delete(delay=delete_after)
+
+    def cog_unload(self):
+        asyncio.create_task(self.close_db())
+
+    async def close_db(self):
+        self.ticker.close()
+        self.renderer.close()
+        self.flush_accounts.cancel()  # stop() would still run one more flush after the pool is closed
+        self.persist_stats.cancel()
+        self.flush_ledger.cancel()
+        if self.pool:
+            await self.write_stats()
+            await self.flush_dirty_accounts()
+            await self.pool.close()
+
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if message.author.bot or message.guild is None:
+            return
+        self.speakers.record(message.channel.id, message.author.id, self.clock.monotonic())
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload):
+        game = self.active_games.pop(payload.message_id, None)
+        if game:
+            await game.message_deleted()
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload):
+        for message_id in payload.message_ids:
+            game = self.active_games.pop(message_id, None)
+            if game:
+                await game.message_deleted()
+
+    @commands.command(aliases=['cb'])
+    async def casebattle(self, ctx):
+        embed = discord.Embed(title="Case Battle", color=discord.Color.gold())
+        
+        embed.add_field(name="Host", value=ctx.author.mention, inline=False)
+        embed.add_field(name="Cases", value="Not selected yet", inline=False)
+        embed.add_field(name="Total Bet", value="$0", inline=False)
+        embed.add_field(name="Players", value="Waiting for players to join...", inline=False)
+        embed.add_field(name="Mode", value="Player Battle", inline=False)
+        embed.add_field(name="Status", value="Waiting for case selection and players...", inline=False)
+        
+        view = CaseBattleView(ctx.author, self, self.case_data)  # Pass self.case_data here
+        message = await ctx.send(embed=embed, view=view)
+        
+        await view.wait()
+        
+        if view.selected_cases:
+            await self.run_battle(ctx, message, view.selected_cases, view.total_bet, view.teams, view.is_bot_battle)
+        else:
+            embed.set_field_at(5, name="Status", value="Battle cancelled - no cases selected", inline=False)
+            await message.edit(embed=embed, view=None)
+
+
+    async def run_battle(self, ctx, battle_message, selected_cases, total_bet, teams, is_bot_battle):
+        embed = battle_message.embeds[0]
+        embed.set_field_at(5, name="Status", value="Opening cases...", inline=False)
+        self.renderer.submit(battle_message, embed=embed)
+
+        # The whole battle is rolled and paid out before the reveal starts, so the
+        # animation length never holds up settlement
+        rounds, team_totals, player_totals = self.case_data.roll_battle(selected_cases, teams)
+        balances = await self.settle_battle(teams, team_totals, total_bet, battle_message.id)
+        await self.record_battle(battle_message, selected_cases, teams, rounds, team_totals, total_bet)
+
+        humans = sum(1 for team in teams.values() for player in team if not isinstance(player, str))
+        reveal = BattleReveal(embed, self.case_data, rounds, 5, "Status", reserved_fields=2 + humans)
+        for frame in reveal.frames():
+            self.renderer.submit(battle_message, embed=frame)
+            await self.clock.sleep(reveal.delay)  # Add some delay for suspense
+
+        reveal.finish(total_bet, team_totals, player_totals)
+        self.add_battle_balances(embed, teams, balances)
+
+        self.renderer.submit(battle_message, embed=embed)
+
+    async def record_battle(self, battle_message, selected_cases, teams, rounds, team_totals, total_bet):
+        # Full transcript of every pull, written with the payouts' transaction
+        if team_totals[1] == team_totals[2]:
+            winning_team = 0
+        else:
+            winning_team = 1 if team_totals[1] > team_totals[2] else 2
+        transcript = {
+            'cases': selected_cases,
+            'teams': {team_num: [str(player) for player in team] for team_num, team in teams.items()},
+            'rounds': [
+                {
+                    'case': case_type,
+                    'pulls': [
+                        {'team': team_num, 'player': str(player), 'player_id': None if isinstance(player, str) else player.id, 'item': item_name, 'value': item_value, 'rarity': rarity}
+                        for team_num, player, item_name, item_value, rarity in pulls
+                    ],
+                }
+                for case_type, pulls in rounds
+            ],
+            'team_totals': team_totals,
+        }
+        await self.write('''
+            INSERT INTO battle_history (message_id, created_at, total_bet, winning_team, transcript)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (battle_message.id, time.time(), total_bet, winning_team, json.dumps(transcript)))
+
+    def add_battle_balances(self, embed, teams, balances):
+        # Update the embed to show the new balances
+        for team_num, team in teams.items():
+            for player in team:
+                if not isinstance(player, str):  # Check if it's not a bot
+                    new_balance = balances[player.id]['balance'] if player.id in balances else 0
+                    embed.add_field(name=f"{player} New Balance", value=f"${new_balance:,.2f}", inline=True)
+
+
+
+    @commands.command()
+    async def slider(self, ctx):
+        game = SliderGame(ctx, self)
+        await game.run_game()
+
+    @commands.command(name='balance', description='Check your balance or the balance of another user.', aliases=['bal', 'money', 'cash', 'bank', 'wallet', 'networth'])
+    async def balance(self, ctx, member: discord.Member = None):
+        if member is None:
+            user_id = ctx.author.id
+            user_data = await self.get_user_data(user_id)
+            user = ctx.author
+        else:
+            user_id = member.id
+            user_data = await self.get_user_data(user_id)
+            user = member
+
+        balance = user_data['balance']
+        bank = user_data['bank']
+        held = self.escrow.held_by(user_id)
+        networth = balance + bank + held
+
+        in_play = f", **In Games**: ${held:,.2f}" if held else ""
+        await self.send_embed(ctx, f"🏦 {user.mention}, **Wallet**: ${balance:,.2f}, **Bank**: ${bank:,.2f}{in_play}, **Networth**: ${networth:,.2f}", 0x747c8c)
+
+    @commands.command(name='deposit', description='Deposit dollars into your bank.', aliases=['dep', 'depo'])
+    async def deposit(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+                return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must deposit a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        if await self.apply_delta(user_id, -amount, amount, require_min=amount, source='deposit') is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to deposit.", discord.Color.red(), delete_after=5)
+            return
+
+        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Amount Deposited**: ${amount:,.2f}", discord.Color.green(), delete_after=5)
+
+    @commands.command(name='withdraw', description='Withdraw dollars from your bank.', aliases=['with', 'bankwithdraw'])
+    async def withdraw(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['bank'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['bank']
+        elif amount.lower() == 'quarter':
+            amount = user_data['bank'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+                return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must withdraw a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        if await self.apply_delta(user_id, amount, -amount, require_bank_min=amount, source='withdraw') is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough money in the bank to withdraw.", discord.Color.red(), delete_after=5)
+            return
+
+        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Amount Withdrawn**: ${amount:,.2f}", discord.Color.green(), delete_after=5)
+
+
+
+    @commands.command(name='beg', description='Beg for money.')
+    @commands.cooldown(1, 30, commands.BucketType.user)  # 30 second cooldown
+    async def beg(self, ctx):
+        user_id = ctx.author.id
+
+        celebrities = [
+            "Elon Musk", "Jeff Bezos", "Bill Gates", "Mark Zuckerberg", "Kanye West", 
+            "Drake", "Rihanna", "Taylor Swift", "PewDiePie", "MrBeast", "Ninja", 
+            "Jacksepticeye", "Kylie Jenner", "Ariana Grande", "Justin Bieber", "Cardi B", 
+            "Travis Scott", "Lil Nas X", "Selena Gomez", "Zendaya", "Logan Paul", 
+            "Jake Paul", "Shane Dawson", "James Charles", "Snoop Dogg", "Eminem", 
+            "Nicki Minaj", "Lil Wayne", "Kendrick Lamar", "Migos", "Post Malone", 
+            "Your Mom", "Gordon Ramsay", "Oprah Winfrey", "Ellen DeGeneres", 
+            "Your Sister", "Fanum", "Jimmy Kimmel", "Your Brother", 
+            "Cristiano Ronaldo", "LeBron James", "Tom Brady", "Michael Jackson", 
+            "Usain Bolt", "Kim Kardashian", "Dwayne Johnson", "Ryan Reynolds", 
+            "Jason Momoa", "Kevin Hart", "Henry Cavill", "Margot Robbie", 
+            "Timothée Chalamet", "Andrew Tate", "Robert Downey Jr.", 
+            "Kai Cenat", "Chris Hemsworth", "Tom Holland", 
+            "Johnny Depp", "Angelina Jolie", "Brad Pitt", "Matthew McConaughey",
+            "Will Smith", "Jada Pinkett Smith", "Javier Bardem", "Duke Dennis",
+            "Beyoncé", "Adele", "Shakira", "Miley Cyrus", "Jesus Christ", "Zayn Malik", 
+            "Ed Sheeran", "Sam Smith", "Halsey", "Post Malone", "Doja Cat", 
+            "Halsey", "The Weeknd", "Megan Thee Stallion", "Billie Eilish", 
+            "J Cole", "Drake", "Lil Uzi Vert", "Future", "Tyler, The Creator", 
+            "SZA", "A$AP Rocky", "Travis Scott", "Juice WRLD", "21 Savage"
+        ]
+
+        scenarios = [
+            "You begged and received **${:,.2f}** from **{}**. Say thank you!",
+            "You begged and found **${:,.2f}** on the ground.",
+            "You begged and a generous person gave you **${:,.2f}**.",
+            "You begged and found a hidden stash of **${:,.2f}**.",
+            "You begged and **{}** gave you **${:,.2f}**.",
+            "You begged **{}** and they were feeling generous and gave you **${:,.2f}**.",
+            "You begged and **Random Stranger** gave you **${:,.2f}**.",
+            "You begged **{}** and they gave you **${:,.2f}**.",
+            "You begged **{}** and they gave you **${:,.2f}**. They said you might have better luck next time.",
+            "You begged **{}** and they gave you **${:,.2f}** and some advice on how to improve your begging skills.",
+            "You begged and **{}** was in a good mood, so they gave you **${:,.2f}**.",
+            "You begged and **{}** was so impressed by your persistence that they gave you **${:,.2f}**.",
+            "You begged **{}** and they gave you **${:,.2f}** because they felt sorry for you.",
+            "You begged **{}** and they gave you **${:,.2f}** as a reward for your efforts.",
+            "You begged **{}** and they generously gave you **${:,.2f}**.",
+            "You begged **{}** and they gave you **${:,.2f}** along with some motivational words.",
+            "You begged **{}** and they gave you **${:,.2f}**. They said, 'Keep going!'",
+            "You begged and **{}** decided to help you out with **${:,.2f}**.",
+            "You begged and **{}** gave you **${:,.2f}** because they liked your determination.",
+            "You begged and **{}** gave you **${:,.2f}** after you told them your story.",
+            "You begged **{}** and they gave you **${:,.2f}**. They wished you good luck!",
+            "You begged **{}** and they gave you **${:,.2f}** and said to pass it on when you can.",
+            "You begged **{}** and they gave you **${:,.2f}**. They were impressed by your perseverance.",
+            "You begged **{}** and they gave you **${:,.2f}** and a smile.",
+            "You begged **{}** for money and they gave you a **${:,.2f}** gift card instead.",
+            "You begged **{}** and they gave you **${:,.2f}** to help with your situation.",
+            "You begged **{}** but they said they couldn’t help today.",
+            "You begged **{}** and they were not in the mood to give.",
+            "You begged **{}** and they told you to try asking someone else.",
+            "You begged **{}** and they said they’re out of cash.",
+            "You begged **{}** and they gave you a pep talk but no money.",
+            "You begged **{}** but they just walked away without saying a word.",
+            "You begged **{}** and they told you to get a job instead.",
+            "You begged **{}** and they gave you a discount coupon instead.",
+            "You begged **{}** and they said they had no money to spare.",
+            "You begged **{}** and they told you to try your luck elsewhere.",
+            "You begged **{}** but they were not interested in helping."
+        ]
+
+        scenario = random.choice(scenarios)
+        if "{}" in scenario:
+            if "received" in scenario or "found" in scenario or "gave you" in scenario:
+                amount = random.uniform(10, 500)
+                await self.apply_delta(user_id, amount, source='beg')
+                if "Random Stranger" in scenario:
+                    scenario = scenario.format(amount)
+                else:
+                    celebrity = random.choice(celebrities)
+                    scenario = scenario.format(celebrity, amount)
+            else:
+                celebrity = random.choice(celebrities)
+                scenario = scenario.format(celebrity)
+        else:
+            scenario = scenario.format(random.choice(celebrities))  # For scenarios that don't need an amount
+
+        # Format the amount in the message if present
+        scenario = scenario.replace("{amount:,.2f}", f"{amount:,.2f}")
+
+        await self.send_embed(ctx, f"🤲 {ctx.author.mention}, {scenario}", discord.Color.yellow())
+
+
+
+
+    @commands.command(name='search', description='Search for items or money.')
+    @commands.cooldown(1, 60, commands.BucketType.user)  # 1 minute cooldown
+    async def search(self, ctx):
+        user_id = ctx.author.id
+
+        scenarios = [
+            "You searched the local trash can and found **${:,.2f}**.",
+            "You searched under the couch and found **${:,.2f}**.",
+            "You searched the park and found a hidden treasure of **${:,.2f}**.",
+            "You searched the alley and found **${:,.2f}** in an old wallet.",
+            "You searched the dumpster and found **${:,.2f}** in a discarded bag.",
+            "You searched the old bookstore and found **${:,.2f}** in a forgotten book.",
+            "You searched the abandoned warehouse and discovered **${:,.2f}** in a hidden compartment.",
+            "You searched the beach and stumbled upon **${:,.2f}** in a buried chest.",
+            "You searched the attic and found **${:,.2f}** in a dusty old trunk.",
+            "You searched the park bench and found **${:,.2f}** stuffed between the cushions.",
+            "You searched the train station and discovered **${:,.2f}** in an old suitcase.",
+            "You searched the library and found **${:,.2f}** in a misplaced book.",
+            "You searched the carnival and stumbled upon **${:,.2f}** in a forgotten game booth.",
+            "You searched the abandoned mall and discovered **${:,.2f}** in a broken vending machine.",
+            "You searched the old theater and found **${:,.2f}** in a hidden drawer.",
+            "You searched the old circus tent and found **${:,.2f}** in a forgotten box.",
+            "You searched the zoo and discovered **${:,.2f}** hidden behind the animal enclosure.",
+            "You searched the museum and found **${:,.2f}** in a hidden display.",
+            "You searched the hospital and stumbled upon **${:,.2f}** in an old donation box.",
+            "You searched the police station and found **${:,.2f}** in a lost and found box.",
+            "You searched the airport and discovered **${:,.2f}** in abandoned luggage.",
+            "You searched the college campus and found **${:,.2f}** in a forgotten locker.",
+            "You searched the amusement park and discovered **${:,.2f}** in a broken ride.",
+            "You searched the farmers' market and found **${:,.2f}** in a misplaced produce crate.",
+            "You searched the botanical garden and found **${:,.2f}** in a hidden plant pot.",
+            "You searched the abandoned factory and discovered **${:,.2f}** in a dusty crate.",
+            "You searched the historical monument and found **${:,.2f}** in a hidden alcove.",
+            "You searched the old library and found **${:,.2f}** in a secret compartment.",
+            "You searched the hiking trail and stumbled upon **${:,.2f}** buried in a cave.",
+            "You searched the construction site and discovered **${:,.2f}** in an old tool box.",
+            "You searched the marina and found **${:,.2f}** in a sunken boat.",
+            "You searched the stadium and discovered **${:,.2f}** in a forgotten concession stand.",
+            "You searched the old diner and found **${:,.2f}** in a hidden drawer.",
+            "You searched the abandoned amusement park and discovered **${:,.2f}** in an old ticket booth.",
+            "You searched the parking garage and found **${:,.2f}** in a discarded parking ticket.",
+            "You searched the botanical garden and discovered **${:,.2f}** in a hidden garden gnome.",
+            "You searched the local gym and found **${:,.2f}** in an abandoned locker.",
+            "You searched the historic battlefield and discovered **${:,.2f}** buried in the ground.",
+            "You searched the city aquarium and found **${:,.2f}** in an old fish tank.",
+            "You searched the rooftop and discovered **${:,.2f}** in a hidden container.",
+            "You searched the ancient ruins and found **${:,.2f}** in a hidden chamber."
+        ]
+
+        scenario = random.choice(scenarios)
+        if "found" in scenario or "discovered" in scenario:
+            amount = random.uniform(10, 500)
+            await self.apply_delta(user_id, amount, source='search')
+            scenario = scenario.format(amount)
+
+        await self.send_embed(ctx, f"🔍 {ctx.author.mention}, {scenario}", discord.Color.blue())
+
+    @commands.command(name='daily', description='Claim a daily reward.')
+    async def daily(self, ctx):
+        user_id = ctx.author.id
+        current_time = int(time.time())
+        cooldown_end = await self.db.get_cooldown(user_id, 'daily')
+
+        if cooldown_end and current_time < cooldown_end:
+            remaining_time = cooldown_end - current_time
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your daily reward again.", discord.Color.yellow(), delete_after=5)
+            return
+
+        user_data = await self.get_user_data(user_id)
+        reward_amount = random.uniform(100, 500)
+        user_data['balance'] += reward_amount
+        await self.update_user_data(user_id, user_data['balance'], user_data['bank'], 'daily')
+
+        # Set cooldown
+        await self.db.set_cooldown(user_id, 'daily', current_time + 86400)  # 24 hours cooldown
+
+        await self.send_embed(ctx, f"💸 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your daily reward!", discord.Color.yellow())
+
+    @commands.command(name='weekly', description='Claim a weekly reward.')
+    async def weekly(self, ctx):
+        user_id = ctx.author.id
+        current_time = int(time.time())
+        cooldown_end = await self.db.get_cooldown(user_id, 'weekly')
+
+        if cooldown_end and current_time < cooldown_end:
+            remaining_time = cooldown_end - current_time
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your weekly reward again.", discord.Color.yellow(), delete_after=5)
+            return
+
+        user_data = await self.get_user_data(user_id)
+        reward_amount = random.uniform(500, 2000)
+        user_data['balance'] += reward_amount
+        await self.update_user_data(user_id, user_data['balance'], user_data['bank'], 'weekly')
+
+        # Set cooldown
+        await self.db.set_cooldown(user_id, 'weekly', current_time + 604800)  # 7 days cooldown
+
+        await self.send_embed(ctx, f"💰 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your weekly reward!", discord.Color.yellow())
+
+    @commands.command(name='monthly', description='Claim a monthly reward.')
+    async def monthly(self, ctx):
+        user_id = ctx.author.id
+        current_time = int(time.time())
+        cooldown_end = await self.db.get_cooldown(user_id, 'monthly')
+
+        if cooldown_end and current_time < cooldown_end:
+            remaining_time = cooldown_end - current_time
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {remaining_time} seconds before you can claim your monthly reward again.", discord.Color.yellow(), delete_after=5)
+            return
+
+        user_data = await self.get_user_data(user_id)
+        reward_amount = random.uniform(2000, 5000)
+        user_data['balance'] += reward_amount
+        await self.update_user_data(user_id, user_data['balance'], user_data['bank'], 'monthly')
+
+        # Set cooldown
+        await self.db.set_cooldown(user_id, 'monthly', current_time + 2592000)  # 30 days cooldown
+
+        await self.send_embed(ctx, f"💵 {ctx.author.mention}, **Claimed**: ${reward_amount:,.2f} as your monthly reward!", discord.Color.yellow())
+
+
+
+    @commands.command(name='crime', aliases=['heist'], description='Commit a crime and potentially gain or lose money.')
+    async def crime(self, ctx):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+        balance = user_data['balance']
+
+        # Select a random outcome
+        outcome, multiplier = random.choice(CRIME_SCENARIOS)
+
+        # Determine gain or loss
+        delta = crime_delta(multiplier, balance)
+        if multiplier > 0:
+            gain = delta
+            embed_title = f"You Gained ${gain:,.2f}!"
+            embed_color = discord.Color.green()
+        elif multiplier < 0:
+            loss = -delta
+            embed_title = f"You Lost ${loss:,.2f}!"
+            embed_color = discord.Color.red()
+        else:
+            embed_title = "Nothing Happened"
+            embed_color = discord.Color.gray()
+
+        user_data = await self.apply_delta(user_id, delta, source='crime')
+
+        # Send feedback message
+        await self.send_embed(ctx, f"💰{ctx.author.mention}, {outcome.format(gain if multiplier > 0 else loss)}\nYour current balance is **${user_data['balance']:,.2f}**.", embed_color)
+
+
+    @commands.command(name='highlow', aliases=['hl'], description='Play the Highlow game.')
+    async def highlow(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
+                return
+
+        if amount <= 0:
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", delete_after=5)
+            return
+
+        hold_id = await self.hold(user_id, amount, 'highlow')
+        if hold_id is None:
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", delete_after=5)
+            return
+
+        game = HighLowGame(ctx, amount, self, hold_id)
+        embed = discord.Embed(
+            title="Highlow Game",
+            description=f"The number is **{game.first_number}**.\n"
+                        f"Will the next number be higher, lower, or the same?\n"
+                        f"Your bet: **${amount:,.2f}**",
+            color=discord.Color.blue()
+        )
+        embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+        await ctx.send(embed=embed, view=game)
+
+    @highlow.error
+    async def highlow_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
+
+    @commands.command(name='crash', description='Start a Crash game.')
+    async def crash(self, ctx):
+        game = CrashGame(ctx, self)
+        await game.run_game()
+
+    @crash.error
+    async def crash_error(self, ctx, error):
+        await ctx.send(f"🚫 {ctx.author.mention}, **Error**: An error occurred while starting the game.", delete_after=5)
+
+
+
+
+
+    @commands.command(name='tower', description='Play the Tower game.')
+    async def tower(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
+                return
+
+        if amount <= 0:
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", delete_after=5)
+            return
+
+        hold_id = await self.hold(user_id, amount, 'tower')
+        if hold_id is None:
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", delete_after=5)
+            return
+
+        game = TowerGame(ctx, amount, self, hold_id)
+        embed = game.create_embed()
+        await ctx.send(embed=embed, view=game)
+
+    @tower.error
+    async def tower_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await ctx.send(f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", delete_after=5)
+
+    @commands.command(name='slots', description='Play the slot machine.')
+    async def slots(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+                return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must bet a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        result = [random.choice(SLOT_SYMBOLS) for _ in range(3)]
+        winnings = slots_winnings(result, amount)
+
+        user_data = await self.apply_delta(user_id, winnings - amount, require_min=amount, source='slots')
+        if user_data is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to bet.", discord.Color.red(), delete_after=5)
+            return
+
+        result_str = ' '.join(result)
+        if winnings > amount:
+            color = discord.Color.green()
+            title = f"You Won ${winnings - amount:,.2f}!"
+        elif winnings == amount:
+            color = discord.Color.yellow()
+            title = "You Broke Even!"
+        else:
+            color = discord.Color.red()
+            title = f"You Lost ${amount - winnings:,.2f}!"
+
+        embed = discord.Embed(
+            title=title,
+            description=f"🎰 {result_str} 🎰\n\nYou bet **${amount:,.2f}** and won **${winnings:,.2f}**.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+            color=color
+        )
+        embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+        await ctx.send(embed=embed)
+
+    @slots.error
+    async def slots_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+
+
+    @commands.command(name='coinflip', aliases=['cf'], description='Flip a coin and gamble your money.')
+    async def coinflip(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+                return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must gamble a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        # Coin flip outcome
+        outcome = random.choice(COIN_SIDES)
+        
+        # Assume the user calls 'Heads' or 'Tails' as the guess. You could add that as an argument if you want.
+        guess = random.choice(COIN_SIDES)  # For example purposes; replace with actual user guess if available
+
+        user_data = await self.apply_delta(user_id, amount if guess == outcome else -amount, require_min=amount, source='coinflip')
+        if user_data is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to gamble.", discord.Color.red(), delete_after=5)
+            return
+
+        if guess == outcome:
+            winnings = amount
+            embed = discord.Embed(
+                title=f"You Won ${winnings:,.2f}!",
+                description=f"Flipped a coin and guessed **{guess}**.\nThe coin landed on **{outcome}**.\nYou bet **${amount:,.2f}** and won **${winnings:,.2f}**.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+                color=discord.Color.green()
+            )
+            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+        else:
+            embed = discord.Embed(
+                title=f"You Lost ${amount:,.2f}!",
+                description=f"Flipped a coin and guessed **{guess}**.\nThe coin landed on **{outcome}**.\nYou bet **${amount:,.2f}** and lost.\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+                color=discord.Color.red()
+            )
+            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+
+
+
+    @commands.command(name='gamble', description='Gamble your money.')
+    async def gamble(self, ctx, amount: str):
+        user_id = ctx.author.id
+        user_data = await self.get_user_data(user_id)
+
+        if amount.lower() == 'half':
+            amount = user_data['balance'] / 2
+        elif amount.lower() == 'all':
+            amount = user_data['balance']
+        elif amount.lower() == 'quarter':
+            amount = user_data['balance'] / 4
+        else:
+            try:
+                amount = float(amount)
+            except ValueError:
+                await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+                return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must gamble a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        dice_roll = random.randint(1, 100)
+        delta = gamble_delta(dice_roll, amount)
+        winnings = delta
+
+        user_data = await self.apply_delta(user_id, delta, require_min=amount, source='gamble')
+        if user_data is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to gamble.", discord.Color.red(), delete_after=5)
+            return
+
+        if dice_roll < 50:
+            embed = discord.Embed(
+                title=f"You Lost ${amount:,.2f}!",
+                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] + amount:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Better luck next time. 📉\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+                color=discord.Color.red()
+            )
+            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+        elif dice_roll == 50:
+            embed = discord.Embed(
+                title=f"You Lost ${amount / 2:,.2f}!",
+                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] + amount:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Couldve Been Worse. 🟰\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+                color=discord.Color.yellow()
+            )
+            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+        else:
+            embed = discord.Embed(
+                title=f"You Won ${winnings:,.2f}!",
+                description=f"Gambled **${amount:,.2f}**\ndollars out of **${user_data['balance'] - winnings:,.2f}**.\nRolled a **{dice_roll}**/100. 🎲 Congratulations! 📈\nIn total, you have **${user_data['balance']:,.2f}** left. 💵",
+                color=discord.Color.green()
+            )
+            embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.display_avatar.url)
+            await ctx.send(embed=embed)
+
+    @commands.command(name='pay', description='Transfer money to another user.', aliases=['give'])
+    async def pay(self, ctx, member: discord.Member, amount: float):
+        if member == ctx.author:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You cannot pay yourself.", discord.Color.red(), delete_after=5)
+            return
+
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must transfer a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        user_id = ctx.author.id
+        target_id = member.id
+
+        # Calculate the fee based on the amount
+        if amount < 1000:
+            fee_percentage = 0
+        elif amount < 5000:
+            fee_percentage = 0.05  # 5% fee
+        elif amount < 10000:
+            fee_percentage = 0.10  # 10% fee
+        else:
+            fee_percentage = 0.15  # 15% fee
+
+        fee_amount = amount * fee_percentage
+        amount_after_fee = amount - fee_amount
+
+        balances = await self.transfer(user_id, target_id, amount, amount_after_fee, 'pay')
+        if balances is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to transfer.", discord.Color.red(), delete_after=5)
+            return
+
+        await self.send_embed(ctx, f"🏦 {ctx.author.mention}, **Transferred**: ${amount_after_fee:,.2f} to {member.mention} with a **{fee_percentage * 100}%** fee.", discord.Color.green())
+
+
+    @commands.command(name='rain', description='Split an amount between the members who chatted here recently.')
+    async def rain(self, ctx, amount: float, count: int = 10):
+        if amount <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must rain a positive amount.", discord.Color.red(), delete_after=5)
+            return
+
+        if count <= 0:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You must rain on at least one member.", discord.Color.red(), delete_after=5)
+            return
+
+        recipients = self.speakers.recent(ctx.channel.id, min(count, 500), self.clock.monotonic(), exclude=ctx.author.id)
+        if not recipients:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Nobody else has chatted here recently.", discord.Color.red(), delete_after=5)
+            return
+
+        # Everyone gets the same whole-cent share, whatever doesn't divide evenly stays with the sender
+        share = math.floor(amount / len(recipients) * 100) / 100
+        if share < 0.01:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: ${amount:,.2f} is too little to split between {len(recipients)} members.", discord.Color.red(), delete_after=5)
+            return
+        total = round(share * len(recipients), 2)
+
+        balances = await self.transfer_many(ctx.author.id, {user_id: share for user_id in recipients}, total, 'rain')
+        if balances is None:
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: You do not have enough dollars to make it rain.", discord.Color.red(), delete_after=5)
+            return
+
+        if len(recipients) <= 20:
+            members = ', '.join(f"<@{user_id}>" for user_id in recipients)
+        else:
+            members = f"{len(recipients)} members"
+        await self.send_embed(ctx, f"🌧️ {ctx.author.mention}, **Rained**: ${total:,.2f} on {members}, **${share:,.2f}** each!", discord.Color.green())
+
+    @commands.command(name='leaderboard', description='Display the top users by balance.', aliases=['leader', 'lb','gml'])
+    async def leaderboard(self, ctx):
+        await self.accrue_leaderboard()
+        if not len(self.ranks):
+            await ctx.send(f"{ctx.author.mention}, No users found.", delete_after=5)
+            return
+
+        view = LeaderboardView(self.bot, self)
+        embed = view.create_embed(view.current_rows, 0)
+        view.message = await ctx.send(embed=embed, view=view)
+
+    @commands.command(name='rank', description='Show your position on the leaderboard.', aliases=['position'])
+    async def rank(self, ctx, member: discord.Member = None):
+        user = member or ctx.author
+        position = self.ranks.rank(user.id)
+        if position is None:
+            await self.send_embed(ctx, f"🏆 {user.mention} isn't on the leaderboard yet.", 0x747c8c)
+            return
+
+        networth = self.ranks.networth[user.id]
+        await self.send_embed(ctx, f"🏆 {user.mention} is ranked **#{position + 1:,}** of {len(self.ranks):,} with a **Networth** of ${networth:,.2f}", 0x747c8c)
+
+    @commands.command(name='ecostats', description='Show the money supply and where money came from and went.', aliases=['economystats'])
+    @commands.has_permissions(administrator=True)
+    async def ecostats(self, ctx):
+        report = self.stats.report()
+        held = self.escrow.total
+        embed = discord.Embed(
+            title="📊 Economy Stats",
+            description=f"**Money Supply**: ${report['supply'] + held:,.2f}\n**Wallets & Banks**: ${report['supply']:,.2f}, **In Games**: ${held:,.2f}",
+            color=0x747c8c
+        )
+        for name, flows in report['windows'].items():
+            # Biggest net change first, so the faucets lead and the sinks trail
+            lines = [f"**{source}**: {minted - burned:+,.2f} ({events:,})"
+                     for source, (minted, burned, events) in sorted(flows.items(), key=lambda item: item[1][1] - item[1][0])]
+            embed.add_field(name=f"Last {name}", value='\n'.join(lines) or "Nothing yet.", inline=True)
+        await ctx.send(embed=embed)
+
+    @balance.error
+    async def balance_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid user.", discord.Color.red(), delete_after=5)
+
+    @deposit.error
+    async def deposit_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+
+    @withdraw.error
+    async def withdraw_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount.", discord.Color.red(), delete_after=5)
+
+    @beg.error
+    async def beg_error(self, ctx, error):
+        if isinstance(error, commands.CommandOnCooldown):
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can beg again.", discord.Color.yellow(), delete_after=5)
+
+    @search.error
+    async def search_error(self, ctx, error):
+        if isinstance(error, commands.CommandOnCooldown):
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can search again.", discord.Color.yellow(), delete_after=5)
+
+    @daily.error
+    async def daily_error(self, ctx, error):
+        if isinstance(error, commands.CommandOnCooldown):
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your daily reward again.", discord.Color.yellow(), delete_after=5)
+
+    @weekly.error
+    async def weekly_error(self, ctx, error):
+        if isinstance(error, commands.CommandOnCooldown):
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your weekly reward again.", discord.Color.yellow(), delete_after=5)
+
+    @monthly.error
+    async def monthly_error(self, ctx, error):
+        if isinstance(error, commands.CommandOnCooldown):
+            await self.send_embed(ctx, f"🕐 {ctx.author.mention}, **Error**: You need to wait {int(error.retry_after)} seconds before you can claim your monthly reward again.", discord.Color.yellow(), delete_after=5)
+
+    @pay.error
+    async def pay_error(self, ctx, error):
+        if isinstance(error, commands.MissingRequiredArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Missing required arguments.", discord.Color.red(), delete_after=5)
+        elif isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid user or amount.", discord.Color.red(), delete_after=5)
+
+    @rain.error
+    async def rain_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid amount or count.", discord.Color.red(), delete_after=5)
+
+    @leaderboard.error
+    async def leaderboard_error(self, ctx, error):
+        if isinstance(error, commands.CommandInvokeError):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: An error occurred while fetching the leaderboard.", discord.Color.red(), delete_after=5)
+
+    @rank.error
+    async def rank_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Invalid user.", discord.Color.red(), delete_after=5)
+
+    @ecostats.error
+    async def ecostats_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await self.send_embed(ctx, f"🚫 {ctx.author.mention}, **Error**: Only administrators can view economy stats.", discord.Color.red(), delete_after=5)
+
+class RankIndex:
+    # Order-statistics index over every account with a positive net worth.
+    # Keys (-networth, user_id) live in sorted buckets of bounded size, and a
+    # Fenwick tree over the bucket lengths turns "how many keys come before this
+    # bucket" into a logarithmic prefix sum, so rank lookups and position
+    # lookups are O(log n) instead of a COUNT(*) over the table.
+    def __init__(self, load=500):
+        self.load = load
+        self.buckets = []
+        self.maxes = []
+        self.tree = []
+        self.networth = {}
+
+    def build(self, rows):
+        # rows must already be ordered by networth DESC, user_id
+        keys = [(-networth, user_id) for user_id, networth in rows]
+        self.networth = {user_id: networth for user_id, networth in rows}
+        self.buckets = [keys[i:i + self.load] for i in range(0, len(keys), self.load)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+        self.rebuild_tree()
+
+    def rebuild_tree(self):
+        self.tree = [0] * (len(self.buckets) + 1)
+        for i, bucket in enumerate(self.buckets, 1):
+            self.tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[i]
+
+    def tree_add(self, i, value):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += value
+            i += i & -i
+
+    def tree_prefix(self, i):
+        # Number of keys in buckets[:i]
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def __len__(self):
+        return len(self.networth)
+
+    def insert(self, key):
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            self.rebuild_tree()
+            return
+        b = min(bisect.bisect_left(self.maxes, key), len(self.buckets) - 1)
+        bucket = self.buckets[b]
+        bisect.insort(bucket, key)
+        self.maxes[b] = bucket[-1]
+        if len(bucket) > 2 * self.load:
+            self.buckets[b:b + 1] = [bucket[:self.load], bucket[self.load:]]
+            self.maxes[b:b + 1] = [bucket[self.load - 1], bucket[-1]]
+            self.rebuild_tree()
+        else:
+            self.tree_add(b, 1)
+
+    def remove(self, key):
+        b = bisect.bisect_left(self.maxes, key)
+        bucket = self.buckets[b]
+        del bucket[bisect.bisect_left(bucket, key)]
+        if bucket:
+            self.maxes[b] = bucket[-1]
+            self.tree_add(b, -1)
+        else:
+            del self.buckets[b]
+            del self.maxes[b]
+            self.rebuild_tree()
+
+    def update(self, user_id, networth):
+        old = self.networth.pop(user_id, None)
+        if old == networth:
+            if old is not None:
+                self.networth[user_id] = old
+            return
+        if old is not None:
+            self.remove((-old, user_id))
+        if networth > 0:
+            self.networth[user_id] = networth
+            self.insert((-networth, user_id))
+
+    def rank(self, user_id):
+        # 0-based position, or None for accounts that aren't ranked
+        networth = self.networth.get(user_id)
+        if networth is None:
+            return None
+        key = (-networth, user_id)
+        b = bisect.bisect_left(self.maxes, key)
+        return self.tree_prefix(b) + bisect.bisect_left(self.buckets[b], key)
+
+    def locate(self, position):
+        # Walk down the Fenwick tree to the bucket holding the position
+        b = 0
+        remaining = position
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = b + step
+            if nxt < len(self.tree) and self.tree[nxt] <= remaining:
+                b = nxt
+                remaining -= self.tree[nxt]
+            step >>= 1
+        return b, remaining
+
+    def slice(self, start, count):
+        # (user_id, networth) for positions start to start + count, in rank order
+        rows = []
+        if start >= len(self):
+            return rows
+        b, offset = self.locate(start)
+        for bucket in self.buckets[b:]:
+            for networth, user_id in bucket[offset:]:
+                if len(rows) == count:
+                    return rows
+                rows.append((user_id, -networth))
+            offset = 0
+        return rows
+
+    def top(self, count):
+        return self.slice(0, count)
+
+class RecentSpeakers:
+    # Who chatted in each channel lately, newest last. Fed by on_message, so !rain
+    # can pick its recipients without fetching channel history.
+    def __init__(self, per_channel=500, window=600):
+        self.per_channel = per_channel
+        self.window = window  # Seconds a message keeps its author on the list
+        self.channels = {}  # channel id -> OrderedDict of user id -> time of last message
+
+    def record(self, channel_id, user_id, now):
+        speakers = self.channels.setdefault(channel_id, collections.OrderedDict())
+        speakers.pop(user_id, None)
+        speakers[user_id] = now
+        if len(speakers) > self.per_channel:
+            speakers.popitem(last=False)
+
+    def recent(self, channel_id, count, now, exclude=None):
+        recipients = []
+        for user_id, seen in reversed(self.channels.get(channel_id, {}).items()):
+            if now - seen > self.window or len(recipients) == count:
+                break
+            if user_id != exclude:
+                recipients.append(user_id)
+        return recipients
+
+class LeaderboardView(View):
+    def __init__(self, bot, economy_cog):
+        super().__init__(timeout=360)
+        self.bot = bot
+        self.economy_cog = economy_cog
+        self.current_page = 0
+        self.current_rows = economy_cog.leaderboard_page(0)
+        self.message = None
+        self.update_button_states()
+
+    @property
+    def page_count(self):
+        # Pages are sliced from the rank index on demand, so count every ranked account
+        return max(1, math.ceil(len(self.economy_cog.ranks) / LEADERBOARD_PAGE_SIZE))
+
+    def update_button_states(self):
+        # With only one page there's nothing to page through, but Jump to Me still
+        # highlights the caller's row
+        single_page = self.page_count <= 1
+        self.children[0].disabled = single_page or self.current_page == 0  # Previous button
+        self.children[1].disabled = single_page or self.current_page == self.page_count - 1  # Next button
+        self.children[2].disabled = single_page  # Go to Page button
+
+    def disable_all_buttons(self):
+        for child in self.children:
+            child.disabled = True
+
+    def create_embed(self, page, page_num, highlight=None):
+        def format_position(i, page_num):
+            if page_num == 0:
+                if i == 0:
+                    return "👑"
+                elif i == 1:
+                    return "🥈"
+                elif i == 2:
+                    return "🥉"
+            return f"`{i + 1 + page_num * LEADERBOARD_PAGE_SIZE}.`"
+
+        leaderboard_text = "\n".join([
+            f"{format_position(i, page_num)} **{self.bot.get_user(user_id).name if self.bot.get_user(user_id) else 'Unknown User'}** - ${net_worth:,.2f}"
+            + (" ⬅️" if user_id == highlight else "")
+            for i, (user_id, net_worth) in enumerate(page)
+        ])
+        embed = discord.Embed(title="Global Money Leaderboard", description=leaderboard_text, color=discord.Color.blue())
+        embed.set_footer(text=f"Page {page_num + 1}/{self.page_count}")
+        return embed
+
+    async def update_embed(self, interaction: discord.Interaction, highlight=None):
+        self.current_page = min(self.current_page, self.page_count - 1)
+        self.current_rows = self.economy_cog.leaderboard_page(self.current_page)
+        embed = self.create_embed(self.current_rows, self.current_page, highlight)
+        self.update_button_states()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.current_page > 0:
+            self.current_page -= 1
+        else:
+            self.current_page = self.page_count - 1
+        await self.update_embed(interaction)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.current_page < self.page_count - 1:
+            self.current_page += 1
+        else:
+            self.current_page = 0
+        await self.update_embed(interaction)
+
+    @discord.ui.button(label="Go to Page", style=discord.ButtonStyle.secondary)
+    async def go_to_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(PageModal(self))
+
+    @discord.ui.button(label="Jump to Me", style=discord.ButtonStyle.secondary)
+    async def jump_to_me(self, interaction: discord.Interaction, button: discord.ui.Button):
+        rank = self.economy_cog.ranks.rank(interaction.user.id)
+        if rank is None:
+            await interaction.response.send_message("You're not on the leaderboard yet.", ephemeral=True)
+            return
+        self.current_page = rank // LEADERBOARD_PAGE_SIZE
+        await self.update_embed(interaction, highlight=interaction.user.id)
+
+    async def on_timeout(self):
+        self.disable_all_buttons()
+        if self.message:
+            await self.message.edit(view=self)
+
+class PageModal(Modal, title='Go to Page'):
+    page_number = TextInput(label='Page Number', placeholder='Enter a page number...')
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            page = int(self.page_number.value) - 1
+            if 0 <= page < self.view.page_count:
+                self.view.current_page = page
+                await self.view.update_embed(interaction)
+            else:
+                await interaction.response.send_message(f"Invalid page number. Please enter a number between 1 and {self.view.page_count}.", ephemeral=True)
+        except ValueError:
+            await interaction.response.send_message("Please enter a valid number.", ephemeral=True)
+
+async def setup(bot):
     await bot.add_cog(Economy(bot))
\ No newline at end of file
@@ -0,0 +1,149 @@
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+# Rebuilds user_data from a snapshot plus the ledger the Economy cog appends to.
+# Every entry is applied with the same arithmetic as the statement that made the
+# change (Economy.apply_delta and friends), so replaying the whole ledger over a
+# snapshot gives back the table to the cent.
+
+USER_DATA = '''
+    CREATE TABLE user_data (
+        user_id INTEGER PRIMARY KEY,
+        balance REAL,
+        bank REAL,
+        last_accrued_at REAL,
+        networth REAL GENERATED ALWAYS AS (balance + bank) VIRTUAL
+    )
+'''
+
+APPLY_ENTRY = '''
+    INSERT INTO user_data (user_id, balance, bank)
+    VALUES (:user_id, MAX(ROUND(:balance_delta, 2), 0), MAX(ROUND(:bank_delta, 2), 0))
+    ON CONFLICT(user_id) DO UPDATE SET
+        balance = MAX(ROUND(balance + :balance_delta, 2), 0),
+        bank = MAX(ROUND(bank + :bank_delta, 2), 0),
+        last_accrued_at = CASE WHEN :source = 'interest' THEN :ts ELSE last_accrued_at END
+'''
+
+
+def connect_readonly(path):
+    return sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+
+
+def create(path):
+    if os.path.exists(path):
+        sys.exit(f"{path} already exists")
+    return sqlite3.connect(path)
+
+
+def snapshot(args):
+    # user_data and the last ledger entry it includes, read in one transaction so they agree
+    source = connect_readonly(args.database)
+    source.execute('BEGIN')
+    entry_id = source.execute('SELECT COALESCE(MAX(entry_id), 0) FROM ledger').fetchone()[0]
+    rows = source.execute('SELECT user_id, balance, bank, last_accrued_at FROM user_data').fetchall()
+    source.rollback()
+
+    target = create(args.snapshot)
+    target.execute(USER_DATA)
+    target.execute('CREATE TABLE snapshot (entry_id INTEGER, taken_at REAL)')
+    target.executemany('INSERT INTO user_data (user_id, balance, bank, last_accrued_at) VALUES (?, ?, ?, ?)', rows)
+    target.execute('INSERT INTO snapshot VALUES (?, ?)', (entry_id, time.time()))
+    target.commit()
+    print(f"{len(rows):,} accounts as of ledger entry {entry_id:,} written to {args.snapshot}")
+
+
+def replay(args):
+    target = create(args.output)
+    target.execute(USER_DATA)
+    after = 0
+    if args.snapshot:
+        # Without one the ledger is replayed from an empty table, which only works
+        # for a database that has had a ledger from the start
+        target.execute('ATTACH DATABASE ? AS snapshot', (args.snapshot,))
+        target.execute('INSERT INTO user_data (user_id, balance, bank, last_accrued_at) SELECT user_id, balance, bank, last_accrued_at FROM snapshot.user_data')
+        after = target.execute('SELECT entry_id FROM snapshot.snapshot').fetchone()[0]
+        target.commit()
+        target.execute('DETACH DATABASE snapshot')
+
+    source = connect_readonly(args.database)
+    query = 'SELECT entry_id, ts, user_id, balance_delta, bank_delta, source FROM ledger WHERE entry_id > ?'
+    params = [after]
+    if args.until is not None:
+        query += ' AND entry_id <= ?'
+        params.append(args.until)
+    cursor = source.execute(query + ' ORDER BY entry_id', params)
+
+    start = time.perf_counter()
+    applied = 0
+    last_entry = after
+    while True:
+        rows = cursor.fetchmany(args.batch)
+        if not rows:
+            break
+        target.executemany(APPLY_ENTRY, [
+            {'ts': ts, 'user_id': user_id, 'balance_delta': balance_delta, 'bank_delta': bank_delta, 'source': source_name}
+            for entry_id, ts, user_id, balance_delta, bank_delta, source_name in rows
+        ])
+        applied += len(rows)
+        last_entry = rows[-1][0]
+    target.commit()
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {applied:,} entries ({after + 1:,} to {last_entry:,}) in {elapsed:.2f}s into {args.output}")
+
+    if args.verify:
+        verify(target, args.database)
+
+
+def verify(target, database):
+    # Compares the rebuilt table with the live one, counting an account the
+    # ledger never touched as matching if it's empty in both
+    target.execute('ATTACH DATABASE ? AS live', (database,))
+    mismatches = target.execute('''
+        SELECT user_id, rebuilt_balance, rebuilt_bank, live_balance, live_bank FROM (
+            SELECT r.user_id, r.balance AS rebuilt_balance, r.bank AS rebuilt_bank, l.balance AS live_balance, l.bank AS live_bank
+            FROM user_data r LEFT JOIN live.user_data l USING (user_id)
+            UNION ALL
+            SELECT l.user_id, NULL, NULL, l.balance, l.bank
+            FROM live.user_data l WHERE l.user_id NOT IN (SELECT user_id FROM user_data)
+        )
+        WHERE ABS(COALESCE(rebuilt_balance, 0) - COALESCE(live_balance, 0)) >= 0.005
+           OR ABS(COALESCE(rebuilt_bank, 0) - COALESCE(live_bank, 0)) >= 0.005
+    ''').fetchall()
+    accounts = target.execute('SELECT COUNT(*) FROM live.user_data').fetchone()[0]
+    if not mismatches:
+        print(f"All {accounts:,} accounts match {database}")
+        return
+    print(f"{len(mismatches):,} of {accounts:,} accounts differ from {database}:")
+    for user_id, rebuilt_balance, rebuilt_bank, live_balance, live_bank in mismatches[:20]:
+        print(f"  {user_id}: rebuilt {rebuilt_balance} / {rebuilt_bank}, live {live_balance} / {live_bank}")
+    sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Snapshot user_data and rebuild it from the balance ledger.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    snapshot_parser = commands.add_parser('snapshot', help='copy user_data and the ledger position it matches')
+    snapshot_parser.add_argument('database', help='the economy database')
+    snapshot_parser.add_argument('snapshot', help='new file to write the snapshot to')
+    snapshot_parser.set_defaults(run=snapshot)
+
+    replay_parser = commands.add_parser('replay', help='apply the ledger on top of a snapshot')
+    replay_parser.add_argument('database', help='the economy database holding the ledger')
+    replay_parser.add_argument('output', help='new file to write the rebuilt user_data to')
+    replay_parser.add_argument('--snapshot', help='snapshot to start from, an empty table if left out')
+    replay_parser.add_argument('--until', type=int, default=None, help='last ledger entry to apply')
+    replay_parser.add_argument('--batch', type=int, default=10_000, help='entries per executemany')
+    replay_parser.add_argument('--verify', action='store_true', help='compare the result with the live user_data')
+    replay_parser.set_defaults(run=replay)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import asyncio
+import collections
+import os
+import random
+import tempfile
+import time
+
+from economy import CrashGame, Economy, VirtualClock
+from loadtest.fakes import FakeBot, FakeInteraction, fill_modal
+
+DEFAULT_MIX = 'balance=40,slots=25,pay=10,crash=15,leaderboard=10'
+BUCKETS = [0.00025 * 2 ** i for i in range(16)]  # 0.25ms to ~8s
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self.skipped = 0
+
+    def record(self, op, elapsed):
+        self.samples[op].append(elapsed)
+
+    def report(self, duration):
+        total = sum(len(samples) for samples in self.samples.values())
+        print(f"\n{total:,} commands in {duration:.1f}s, {total / duration:,.0f}/s, {sum(self.errors.values())} errors, {self.skipped} skipped")
+        print(f"{'command':<14} {'count':>8} {'errors':>7} {'mean ms':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for op in sorted(self.samples):
+            samples = sorted(self.samples[op])
+            print(f"{op:<14} {len(samples):>8,} {self.errors[op]:>7} {sum(samples) / len(samples) * 1000:>9.2f} "
+                  f"{percentile(samples, 50) * 1000:>8.2f} {percentile(samples, 90) * 1000:>8.2f} "
+                  f"{percentile(samples, 99) * 1000:>8.2f} {samples[-1] * 1000:>8.2f}")
+
+        counts = [0] * (len(BUCKETS) + 1)
+        for samples in self.samples.values():
+            for elapsed in samples:
+                index = 0
+                while index < len(BUCKETS) and elapsed > BUCKETS[index]:
+                    index += 1
+                counts[index] += 1
+        print("\nlatency histogram, all commands")
+        widest = max(counts) or 1
+        for index, count in enumerate(counts):
+            if not count:
+                continue
+            label = f"<= {BUCKETS[index] * 1000:g}ms" if index < len(BUCKETS) else f"> {BUCKETS[-1] * 1000:g}ms"
+            print(f"{label:>12} {count:>9,} {'#' * max(1, round(40 * count / widest))}")
+
+
+def percentile(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(','):
+        op, weight = part.split('=')
+        weights[op.strip()] = float(weight)
+    return weights
+
+
+class CrashTable:
+    # Back to back Crash rounds in one channel, joined and cashed out by the sessions
+    def __init__(self, bot, cog, countdown):
+        self.bot = bot
+        self.cog = cog
+        self.countdown = countdown
+        self.channel = bot.channel()
+        self.game = None
+        self.rounds = 0
+
+    async def run(self):
+        while True:
+            host = random.choice(list(self.bot.users))
+            self.game = CrashGame(self.bot.context(host, self.channel), self.cog)
+            self.game.countdown = self.countdown
+            await self.game.run_game()
+            self.rounds += 1
+
+    def open_seats(self):
+        game = self.game
+        return game and game.message and not game.start_time and len(game.players) < game.max_players
+
+    def live_players(self):
+        game = self.game
+        if not game or not game.start_time or game.crashed:
+            return []
+        return [player_id for player_id, data in game.players.items() if not data['cashed_out']]
+
+
+class LoadDriver:
+    def __init__(self, bot, cog, args):
+        self.bot = bot
+        self.cog = cog
+        self.clock = cog.clock
+        self.args = args
+        self.mix = parse_mix(args.mix)
+        self.user_ids = list(bot.users)
+        self.channels = [bot.channel() for _ in range(args.channels)]
+        self.tables = [CrashTable(bot, cog, args.crash_countdown) for _ in range(args.crash_tables)]
+        self.latency = LatencyRecorder()
+        # Called through the callbacks, the way the bot would after parsing the message
+        self.commands = {command.name: command.callback for command in cog.get_commands()}
+
+    async def seed(self):
+        rows = [(user_id, round(random.uniform(1_000, 10_000), 2), round(random.uniform(0, 5_000), 2)) for user_id in self.user_ids]
+        await self.cog.db.executemany('INSERT OR REPLACE INTO user_data (user_id, balance, bank) VALUES (?, ?, ?)', rows)
+        await self.cog.db.commit()
+        await self.cog.load_rankings()
+
+    def context(self, user_id):
+        return self.bot.context(user_id, random.choice(self.channels))
+
+    async def balance(self, user_id):
+        await self.commands['balance'](self.cog, self.context(user_id))
+        return 'balance'
+
+    async def slots(self, user_id):
+        await self.commands['slots'](self.cog, self.context(user_id), str(random.choice([10, 25, 50, 100])))
+        return 'slots'
+
+    async def pay(self, user_id):
+        target = random.choice(self.user_ids)
+        while target == user_id:
+            target = random.choice(self.user_ids)
+        await self.commands['pay'](self.cog, self.context(user_id), self.bot.users[target], round(random.uniform(1, 200), 2))
+        return 'pay'
+
+    async def leaderboard(self, user_id):
+        await self.commands['leaderboard'](self.cog, self.context(user_id))
+        return 'leaderboard'
+
+    async def crash(self, user_id):
+        # Cash out someone still riding a live round, otherwise take a free seat
+        random.shuffle(self.tables)
+        for table in self.tables:
+            players = table.live_players()
+            if players:
+                player = self.bot.users[random.choice(players)]
+                await table.game.interaction_check(FakeInteraction(player, table.game.message, 'cashout'))
+                return 'crash_cashout'
+        for table in self.tables:
+            if table.open_seats() and user_id not in table.game.players:
+                game = table.game
+                user = self.bot.users[user_id]
+                interaction = FakeInteraction(user, game.message, 'join')
+                await game.interaction_check(interaction)
+                modal = interaction.response.modal
+                if modal:
+                    fill_modal(modal, bet=str(random.choice([10, 25, 50])), auto_cashout=random.choice(['', '1.5', '2', '5']))
+                    await modal.on_submit(FakeInteraction(user, game.message))
+                return 'crash_join'
+        return None
+
+    async def session(self, deadline):
+        ops = list(self.mix)
+        weights = [self.mix[op] for op in ops]
+        while time.monotonic() < deadline:
+            op = random.choices(ops, weights)[0]
+            start = time.perf_counter()
+            try:
+                name = await getattr(self, op)(random.choice(self.user_ids))
+            except Exception as e:
+                self.latency.errors[op] += 1
+                if self.latency.errors[op] == 1:
+                    print(f"{op} failed: {e!r}")
+                name = op
+            elapsed = time.perf_counter() - start
+            if name is None:
+                self.latency.skipped += 1
+            else:
+                self.latency.record(name, elapsed)
+            await self.clock.sleep(random.expovariate(1 / self.args.think) if self.args.think else 0)
+
+    async def run(self):
+        await self.seed()
+        tables = [asyncio.create_task(table.run()) for table in self.tables]
+        self.clock_start = self.clock.monotonic()
+        start = time.monotonic()
+        await asyncio.gather(*(self.session(start + self.args.duration) for _ in range(self.args.sessions)))
+        duration = time.monotonic() - start
+        for task in tables:
+            task.cancel()
+        await asyncio.gather(*tables, return_exceptions=True)
+        return duration
+
+    def report(self, duration):
+        self.latency.report(duration)
+
+        accounts = self.cog.accounts.stats()
+        print(f"\ndb commits: {accounts['flushes']:,} ({accounts['flushes'] / duration:.2f}/s), "
+              f"rows flushed: {accounts['rows_flushed']:,} ({accounts['rows_flushed'] / duration:,.0f}/s), "
+              f"avg commit {accounts['avg_flush_time'] * 1000:.2f}ms, cache hit rate {accounts['hit_rate']:.1%}")
+        settle = self.cog.settle_stats.stats()
+        print(f"settle_many: {settle['rounds']:,} batches, {settle['rows']:,} rows, avg {settle['avg_time'] * 1000:.2f}ms, max {settle['max_time'] * 1000:.2f}ms")
+
+        ledger = self.cog.ledger.stats()
+        print(f"ledger: {ledger['written']:,} entries in {ledger['batches']:,} batches (avg {ledger['avg_batch_time'] * 1000:.2f}ms), "
+              f"{ledger['spilled']:,} spilled past the queue, {ledger['queued']:,} still queued")
+
+        locks = self.cog.locks.stats()
+        acquisitions = locks['acquisitions'] or 1
+        print(f"lock wait: {locks['wait_time'] * 1000:.1f}ms total over {locks['acquisitions']:,} acquisitions "
+              f"({locks['wait_time'] / acquisitions * 1e6:.1f}us avg), {locks['contended']:,} contended")
+        for stripe in locks['stripes'][:5]:
+            print(f"  stripe {stripe['stripe']:>3}: {stripe['wait_time'] * 1000:.1f}ms over {stripe['acquisitions']:,} ({stripe['contended']} contended)")
+
+        ticker = self.cog.ticker.stats()
+        renderer = self.cog.renderer.stats()
+        print(f"crash rounds: {sum(table.rounds for table in self.tables)}, ticks {ticker['ticks']:,} (avg {ticker['avg_tick_time'] * 1000:.2f}ms, max {ticker['max_tick_time'] * 1000:.2f}ms), "
+              f"renders sent {renderer['sent']:,}, dropped {renderer['dropped']:,}")
+        if isinstance(self.clock, VirtualClock):
+            print(f"virtual clock: {self.clock.monotonic() - self.clock_start:,.1f}s of game time in {duration:.1f}s, {self.clock.jumps:,} jumps")
+
+
+async def main(args):
+    random.seed(args.seed)
+    directory = tempfile.mkdtemp(prefix='economy-loadtest-')
+    bot = FakeBot(args.users)
+    cog = Economy(bot, clock=VirtualClock() if args.virtual_clock else None)
+    cog.db_name = os.path.join(directory, 'economy.db')  # Picked up by setup_database once the loop runs it
+    bot.add_cog(cog)
+    while not cog.flush_accounts.is_running():
+        await asyncio.sleep(0.01)
+
+    driver = LoadDriver(bot, cog, args)
+    print(f"{args.users:,} users, {args.sessions} sessions, {args.duration:g}s, mix {args.mix}, database {cog.db_name}")
+    try:
+        duration = await driver.run()
+    finally:
+        await cog.close_db()
+    driver.report(duration)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load test the economy cog against a temporary SQLite file.')
+    parser.add_argument('--users', type=int, default=5000, help='simulated accounts')
+    parser.add_argument('--sessions', type=int, default=200, help='concurrent command loops')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to run for')
+    parser.add_argument('--think', type=float, default=0.05, help='mean pause between a session\'s commands, in seconds')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='command weights, e.g. ' + DEFAULT_MIX)
+    parser.add_argument('--channels', type=int, default=20, help='channels the commands are spread over')
+    parser.add_argument('--crash-tables', type=int, default=5, help='Crash rounds running side by side')
+    parser.add_argument('--crash-countdown', type=int, default=3, help='seconds each Crash round takes joins for')
+    parser.add_argument('--virtual-clock', action='store_true', help='run game timers and think time on a virtual clock that skips idle waits')
+    parser.add_argument('--seed', type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import types
+
+# Just enough of discord.py for the Economy cog to run without a gateway. Every
+# send and edit returns straight away, so what the driver measures is the cog,
+# its locks and the database, not Discord.
+
+snowflakes = itertools.count(1_100_000_000_000_000_000)
+
+
+class FakeUser:
+    def __init__(self, user_id, name=None):
+        self.id = user_id
+        self.name = name or f"user{user_id}"
+        self.display_name = self.name
+        self.mention = f"<@{user_id}>"
+        self.display_avatar = types.SimpleNamespace(url=f"https://cdn.example/avatars/{user_id}.png")
+        self.bot = False
+        self.dms = 0
+
+    def __str__(self):
+        return self.name
+
+    async def send(self, content=None, **kwargs):
+        self.dms += 1
+        return FakeMessage(None, content, **kwargs)
+
+
+class FakeGuild:
+    def __init__(self, members):
+        self.id = next(snowflakes)
+        self.members = members
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+
+class FakeChannel:
+    def __init__(self, guild):
+        self.id = next(snowflakes)
+        self.guild = guild
+        self.messages = {}
+        self.sent = 0
+        self.edits = 0
+
+    async def send(self, content=None, **kwargs):
+        message = FakeMessage(self, content, **kwargs)
+        self.messages[message.id] = message
+        self.sent += 1
+        return message
+
+    async def fetch_message(self, message_id):
+        return self.messages[message_id]
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, view=None, delete_after=None, **kwargs):
+        self.id = next(snowflakes)
+        self.channel = channel
+        self.content = content
+        self.embeds = [embed] if embed else []
+        self.view = view
+        self.deleted = False
+
+    async def edit(self, content=None, embed=None, view=None, **kwargs):
+        if self.channel:
+            self.channel.edits += 1
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+        if view is not None:
+            self.view = view
+        return self
+
+    async def delete(self, delay=None):
+        # discord.py schedules delayed deletes in the background, so never wait here
+        self.deleted = True
+        if self.channel:
+            self.channel.messages.pop(self.id, None)
+
+
+class FakeContext:
+    def __init__(self, bot, author, channel):
+        self.bot = bot
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.message = FakeMessage(channel)
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+    async def fetch_message(self, message_id):
+        return await self.channel.fetch_message(message_id)
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+        self.modal = None
+        self.sent = []
+
+    def is_done(self):
+        return self.done
+
+    async def send_message(self, content=None, **kwargs):
+        self.done = True
+        self.sent.append(content)
+
+    async def send_modal(self, modal):
+        self.done = True
+        self.modal = modal
+
+    async def edit_message(self, **kwargs):
+        self.done = True
+        if self.interaction.message:
+            await self.interaction.message.edit(**kwargs)
+
+    async def defer(self, **kwargs):
+        self.done = True
+
+
+class FakeFollowup:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def send(self, content=None, ephemeral=False, **kwargs):
+        return FakeMessage(self.channel, content, **kwargs)
+
+
+class FakeInteraction:
+    def __init__(self, user, message=None, custom_id=None):
+        self.id = next(snowflakes)
+        self.user = user
+        self.message = message
+        self.channel = message.channel if message else None
+        self.guild = self.channel.guild if self.channel else None
+        self.data = {'custom_id': custom_id} if custom_id else {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self.channel)
+
+
+def fill_modal(modal, **values):
+    # Sets TextInput values the way a modal submit from Discord would
+    for name, value in values.items():
+        getattr(modal, name)._value = value
+
+
+class FakeBot:
+    def __init__(self, user_count):
+        self.users = {user_id: FakeUser(user_id) for user_id in range(1, user_count + 1)}
+        self.guild = FakeGuild(self.users)
+        self.cogs = {}
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def get_user(self, user_id):
+        return self.users.get(user_id)
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    def add_cog(self, cog):
+        self.cogs[type(cog).__name__] = cog
+
+    def channel(self):
+        return FakeChannel(self.guild)
+
+    def context(self, user_id, channel):
+        return FakeContext(self, self.users[user_id], channel)
@@ -0,0 +1,62 @@
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from simulation.games import scenarios
+
+
+def simulate(vectorized, rng, rounds, batch):
+    total = 0.0
+    total_sq = 0.0
+    done = 0
+    start = time.perf_counter()
+    while done < rounds:
+        size = min(batch, rounds - done)
+        profits = vectorized(rng, size)
+        total += profits.sum()
+        total_sq += np.square(profits).sum()
+        done += size
+    elapsed = time.perf_counter() - start
+    mean = total / rounds
+    return mean, max(0.0, total_sq / rounds - mean * mean), rounds / elapsed
+
+
+def replay(scalar, rng, rounds):
+    start = time.perf_counter()
+    total = sum(scalar(rng) for _ in range(rounds))
+    return total / rounds, rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo payout check for every game in the economy cog.')
+    parser.add_argument('--rounds', type=int, default=2_000_000, help='vectorized rounds per strategy')
+    parser.add_argument('--batch', type=int, default=500_000, help='rounds per NumPy batch')
+    parser.add_argument('--check-rounds', type=int, default=20_000, help='rounds replayed through the scalar game code')
+    parser.add_argument('--games', help='comma separated games to run, e.g. crash,slots')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    games = set(args.games.split(',')) if args.games else None
+    rng = np.random.default_rng(args.seed)
+    scalar_rng = random.Random(args.seed)
+
+    print(f"{'game':<11} {'strategy':<30} {'EV/bet':>9} {'std':>8} {'edge':>8} {'rounds/s':>12} {'scalar EV':>10} {'scalar/s':>10}")
+    for game, strategy, vectorized, scalar in scenarios():
+        if games and game not in games:
+            continue
+        mean, variance, throughput = simulate(vectorized, rng, args.rounds, args.batch)
+        check = ''
+        scalar_mean, scalar_throughput = float('nan'), float('nan')
+        if args.check_rounds:
+            scalar_mean, scalar_throughput = replay(scalar, scalar_rng, args.check_rounds)
+            # Flag a vectorized table that drifted away from the game code
+            if abs(scalar_mean - mean) > 5 * math.sqrt(variance / args.check_rounds) + 1e-9:
+                check = '  MISMATCH'
+        print(f"{game:<11} {strategy:<30} {mean:>+9.4f} {math.sqrt(variance):>8.3f} {-mean:>+8.2%} {throughput:>12,.0f} {scalar_mean:>+10.4f} {scalar_throughput:>10,.0f}{check}")
+
+
+if __name__ == '__main__':
+    main()
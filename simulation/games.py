@@ -0,0 +1,206 @@
+import itertools
+
+import numpy as np
+
+import economy
+
+# Every game is simulated in units of one bet. Each entry has a vectorized NumPy
+# version that returns the profit of every round in a batch, and a scalar version
+# that plays one round through the same functions the commands call. The scalar
+# side is what keeps the vectorized tables honest.
+
+
+def build_slots_table():
+    # Profit for every one of the 6^3 reels, straight from slots_winnings
+    count = len(economy.SLOT_SYMBOLS)
+    table = np.empty(count ** 3)
+    for i, reels in enumerate(itertools.product(economy.SLOT_SYMBOLS, repeat=3)):
+        table[i] = economy.slots_winnings(reels, 1.0) - 1.0
+    return table
+
+
+SLOTS_TABLE = build_slots_table()
+
+
+def slots_vectorized(rng, rounds):
+    count = len(economy.SLOT_SYMBOLS)
+    return SLOTS_TABLE[rng.integers(0, count ** 3, rounds)]
+
+
+def slots_scalar(rng):
+    result = [rng.choice(economy.SLOT_SYMBOLS) for _ in range(3)]
+    return economy.slots_winnings(result, 1.0) - 1.0
+
+
+def coinflip_vectorized(rng, rounds):
+    sides = len(economy.COIN_SIDES)
+    won = rng.integers(0, sides, rounds) == rng.integers(0, sides, rounds)
+    return np.where(won, 1.0, -1.0)
+
+
+def coinflip_scalar(rng):
+    return 1.0 if rng.choice(economy.COIN_SIDES) == rng.choice(economy.COIN_SIDES) else -1.0
+
+
+GAMBLE_TABLE = np.array([economy.gamble_delta(dice_roll, 1.0) for dice_roll in range(1, 101)])
+
+
+def gamble_vectorized(rng, rounds):
+    return GAMBLE_TABLE[rng.integers(0, 100, rounds)]
+
+
+def gamble_scalar(rng):
+    return economy.gamble_delta(rng.randint(1, 100), 1.0)
+
+
+# Crime moves a share of the wallet, so it's measured per unit of balance
+CRIME_TABLE = np.array([economy.crime_delta(multiplier, 1.0) for outcome, multiplier in economy.CRIME_SCENARIOS])
+
+
+def crime_vectorized(rng, rounds):
+    return CRIME_TABLE[rng.integers(0, len(CRIME_TABLE), rounds)]
+
+
+def crime_scalar(rng):
+    outcome, multiplier = rng.choice(economy.CRIME_SCENARIOS)
+    return economy.crime_delta(multiplier, 1.0)
+
+
+def crash_points(rng, rounds):
+    # Same curve as economy.crash_point, rounding included
+    r = rng.random(rounds)
+    return np.maximum(1.0, np.round(0.99 / (1 - r), 2))
+
+
+def crash_vectorized(target):
+    def simulate(rng, rounds):
+        # An auto cashout pays whenever the multiplier reaches the target before the crash
+        return np.where(crash_points(rng, rounds) >= target, target - 1.0, -1.0)
+    return simulate
+
+
+def crash_scalar(target):
+    def play(rng):
+        return target - 1.0 if economy.crash_point(rng.random()) >= target else -1.0
+    return play
+
+
+def slider_vectorized(color):
+    outcomes = [economy.SLIDER_NAMES[symbol] for symbol in economy.SLIDER_SYMBOLS]
+    bet = {f'bet_{name.lower()}': 0.0 for name in outcomes}
+    bet[f'bet_{color.lower()}'] = 1.0
+    table = np.array([economy.slider_winnings(bet, outcome) - 1.0 for outcome in outcomes])
+
+    def simulate(rng, rounds):
+        return table[rng.choice(len(outcomes), rounds, p=economy.SLIDER_WEIGHTS)]
+    return simulate
+
+
+def slider_scalar(color):
+    def play(rng):
+        bet = {'bet_bronze': 0.0, 'bet_silver': 0.0, 'bet_gold': 0.0}
+        bet[f'bet_{color.lower()}'] = 1.0
+        symbol = rng.choices(economy.SLIDER_SYMBOLS, weights=economy.SLIDER_WEIGHTS)[0]
+        return economy.slider_winnings(bet, economy.SLIDER_NAMES[symbol]) - 1.0
+    return play
+
+
+def tower_vectorized(levels):
+    multiplier = economy.TOWER_MULTIPLIERS[levels - 1]
+
+    def simulate(rng, rounds):
+        # A level is survived when the picked tile is one of the safe ones
+        survived = (rng.integers(0, 3, (rounds, levels)) < economy.TOWER_SAFE_TILES).all(axis=1)
+        return np.where(survived, multiplier - 1.0, -1.0)
+    return simulate
+
+
+def tower_scalar(levels):
+    def play(rng):
+        for _ in range(levels):
+            if rng.randrange(3) not in rng.sample(range(3), economy.TOWER_SAFE_TILES):
+                return -1.0
+        return economy.TOWER_MULTIPLIERS[levels - 1] - 1.0
+    return play
+
+
+def highlow_guess(strategy, first_number):
+    if strategy == 'best':
+        return 'higher' if first_number <= 50 else 'lower'
+    return strategy
+
+
+def build_highlow_table(strategy):
+    table = np.empty((100, 100))
+    for first_number in range(1, 101):
+        guess = highlow_guess(strategy, first_number)
+        for second_number in range(1, 101):
+            result = economy.highlow_result(guess, first_number, second_number)
+            table[first_number - 1, second_number - 1] = economy.HIGHLOW_PROFIT[result]
+    return table
+
+
+def highlow_vectorized(strategy):
+    table = build_highlow_table(strategy)
+
+    def simulate(rng, rounds):
+        return table[rng.integers(0, 100, rounds), rng.integers(0, 100, rounds)]
+    return simulate
+
+
+def highlow_scalar(strategy):
+    def play(rng):
+        first_number, second_number = rng.randint(1, 100), rng.randint(1, 100)
+        result = economy.highlow_result(highlow_guess(strategy, first_number), first_number, second_number)
+        return economy.HIGHLOW_PROFIT[result]
+    return play
+
+
+def case_arrays(case_id):
+    case = economy.CASE_CATALOG[case_id]
+    values = np.array([item_value for item_name, item_value, rarity in case.items], dtype=float)
+    return case, values, np.array(case.table.prob), np.array(case.table.alias)
+
+
+def draw_values(rng, case_id, rounds):
+    # Walker alias draws, the same tables CaseCatalog.sample uses
+    case, values, prob, alias = case_arrays(case_id)
+    i = (rng.random(rounds) * len(prob)).astype(np.int64)
+    return values[np.where(rng.random(rounds) < prob[i], i, alias[i])]
+
+
+def battle_vectorized(case_id):
+    def simulate(rng, rounds):
+        # 1v1 against a bot with one case, in units of the case price that
+        # check_balance asks for. Ties return the bets.
+        player = draw_values(rng, case_id, rounds)
+        bot = draw_values(rng, case_id, rounds)
+        return np.select([player > bot, player < bot], [1.0, -1.0], 0.0)
+    return simulate
+
+
+def battle_scalar(case_id):
+    def play(rng):
+        rounds, team_totals, player_totals = economy.CASE_CATALOG.roll_battle({case_id: 1}, {1: ['Player'], 2: ['Bot']}, rng)
+        if team_totals[1] == team_totals[2]:
+            return 0.0
+        return 1.0 if team_totals[1] > team_totals[2] else -1.0
+    return play
+
+
+def scenarios():
+    # (game, strategy, vectorized, scalar)
+    yield 'slots', 'flat bet', slots_vectorized, slots_scalar
+    yield 'coinflip', 'flat bet', coinflip_vectorized, coinflip_scalar
+    yield 'gamble', 'flat bet', gamble_vectorized, gamble_scalar
+    yield 'crime', 'per unit of wallet', crime_vectorized, crime_scalar
+    for target in (1.5, 2.0, 3.0, 5.0, 10.0):
+        yield 'crash', f'auto cashout {target}x', crash_vectorized(target), crash_scalar(target)
+    for name in economy.SLIDER_PAYOUTS:
+        yield 'slider', f'all on {name}', slider_vectorized(name), slider_scalar(name)
+    for levels in range(1, len(economy.TOWER_MULTIPLIERS) + 1):
+        yield 'tower', f'cash out after {levels}', tower_vectorized(levels), tower_scalar(levels)
+    for strategy in ('higher', 'lower', 'jackpot', 'best'):
+        yield 'highlow', strategy, highlow_vectorized(strategy), highlow_scalar(strategy)
+    for case_id in economy.CASE_CATALOG:
+        yield 'casebattle', f'1v1 bot, {case_id}', battle_vectorized(case_id), battle_scalar(case_id)
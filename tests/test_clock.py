@@ -0,0 +1,82 @@
+import asyncio
+import math
+import os
+import tempfile
+import unittest
+
+from economy import CrashEngine, CrashGame, Economy, VirtualClock
+from loadtest.fakes import FakeBot
+
+# Game timing runs on the cog's injected clock. On a VirtualClock a whole Crash
+# round takes a few milliseconds and lands on the same virtual timestamps every
+# run, so the schedule itself can be checked.
+
+
+class VirtualClockTest(unittest.IsolatedAsyncioTestCase):
+    async def test_advance_wakes_sleepers_at_their_deadlines(self):
+        clock = VirtualClock(start=100.0)
+        woken = []
+
+        async def sleeper(name, seconds):
+            await clock.sleep(seconds)
+            woken.append((name, clock.monotonic()))
+
+        tasks = [asyncio.create_task(sleeper(name, seconds)) for name, seconds in [('late', 3.0), ('early', 1.0), ('never', 10.0)]]
+        await asyncio.sleep(0)
+        await clock.advance(5.0)
+
+        self.assertEqual(woken, [('early', 101.0), ('late', 103.0)])
+        self.assertEqual(clock.monotonic(), 105.0)
+        for task in tasks:
+            task.cancel()
+
+
+class CrashRoundTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.clock = VirtualClock()
+        self.bot = FakeBot(3)
+        self.cog = Economy(self.bot, clock=self.clock)
+        self.cog.db_name = os.path.join(self.directory.name, 'economy.db')
+        self.bot.add_cog(self.cog)
+        while not self.cog.flush_accounts.is_running():
+            await asyncio.sleep(0.01)
+
+    async def asyncTearDown(self):
+        await self.cog.close_db()
+        self.directory.cleanup()
+
+    async def test_auto_cashout_and_crash_point(self):
+        for user_id in (1, 2):
+            await self.cog.update_user_data(user_id, 1000, 0)
+
+        game = CrashGame(self.bot.context(1, self.bot.channel()), self.cog)
+        game.countdown = 5
+        game.crash_point = 2.0
+        game.engine = CrashEngine(game.crash_point)
+        game.add_player(1, 100, 1.5, await self.cog.hold(1, 100, 'crash'))
+        game.add_player(2, 100, None, await self.cog.hold(2, 100, 'crash'))
+
+        opened = self.clock.monotonic()
+        await game.run_game()
+
+        # Launched on the first tick after the countdown, and only crashed once the
+        # engine's time to 2.0x had passed on the virtual clock
+        launched = game.engine.started_at - opened
+        self.assertGreaterEqual(launched, 5.0)
+        self.assertLess(launched, 5.0 + 2 * self.cog.ticker.interval)
+        self.assertAlmostEqual(game.engine.crash_after, math.log(2.0) / game.engine.growth_rate)
+        self.assertGreaterEqual(self.clock.monotonic(), game.engine.started_at + game.engine.crash_after)
+        self.assertTrue(game.crashed)
+        self.assertEqual(game.multiplier, 2.0)
+
+        # The auto cashout pays its exact threshold, the rider loses the bet
+        self.assertEqual(game.players[1]['cashout_multiplier'], 1.5)
+        self.assertFalse(game.players[2]['cashed_out'])
+        self.assertEqual((await self.cog.get_user_data(1))['balance'], 1050)
+        self.assertEqual((await self.cog.get_user_data(2))['balance'], 900)
+        self.assertEqual(self.cog.escrow.total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()